@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Frontmatter parser benchmark
+
+Compares scripts/skill_frontmatter.py against the line loop the scripts used
+before it and, when PyYAML is installed, against PyYAML's pure-Python
+SafeLoader. Also checks that the new parser agrees with PyYAML on the corpus
+and on EDGE_CASES, shapes the generated corpus does not produce, and
+that the numbers in SOURCE_TEXT render as written.
+
+Usage:
+    python3 benchmarks/bench_frontmatter.py [--skills 20000] [--repeat 3]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from skill_frontmatter import as_text, parse_frontmatter, split_frontmatter
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# Frontmatter blocks that once parsed differently from PyYAML
+EDGE_CASES = [
+    # Keep chomping at the end of the frontmatter keeps exactly the final newline
+    "description: |+\n  text\n",
+    "summary: >+\n  folded\n  text\n",
+    "description: |+\n  text\n\nname: x\n",
+    "description: |+\n  text\n\n\n",
+    # Flow collections whose closing bracket is on its own line
+    "tags: [\n]\n",
+    "tags: [a,\n b\n]\n",
+    "tags: [a,\n]\nname: x\n",
+    "meta: {x: 1,\n  y: 2\n}\n",
+    "inputs:\n  names: [a,\n    b\n  ]\nname: x\n",
+    # Multi-line quoted scalars: one break folds to a space, a blank line to a newline
+    "description: 'multi\n\n  line'\n",
+    "description: \"one\n  two\n\n\n  three\"\n",
+    "description: \"tab\\t\n  kept\"\n",
+    "tags: ['a\n\n  b', \"c\n  d\"]\n",
+]
+
+# Plain scalars whose as_text() must give back the source exactly
+SOURCE_TEXT = ["1.10", "0.10", "1e3", "012", "0x1F", "1_000"]
+
+WORDS = ("review code security deploy test format lint docs api database "
+         "migrate schema python rust docker release audit performance").split()
+
+def _phrase(rng: random.Random, n: int) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+def make_skill(rng: random.Random, i: int) -> str:
+    """One SKILL.md in the shapes the templates produce."""
+    lines = ["---", f"name: skill-{i}"]
+    if rng.random() < 0.5:
+        lines.append('version: "1.%d.0"' % rng.randint(0, 9))
+    lines.append("description: |")
+    lines.append(f"  {_phrase(rng, 8).capitalize()}.")
+    lines.append(f"  Use when: {_phrase(rng, 5)}")
+    lines.append('  Triggers for: "%s", "%s", "%s"' % (_phrase(rng, 2), _phrase(rng, 2), _phrase(rng, 2)))
+    shape = i % 4
+    if shape == 1:
+        lines.append("context: fork")
+        lines.append("tags: [%s]" % ', '.join(rng.sample(WORDS, 3)))
+    elif shape == 2:
+        lines.append("platforms:")
+        lines.extend(f"  - {p}" for p in ("claude-code", "gemini-cli", "cursor"))
+        lines.append("inputs:")
+        for n in range(2):
+            lines.append(f"  - name: input_{n}")
+            lines.append("    type: string")
+            lines.append(f"    description: {_phrase(rng, 4)}")
+            lines.append("    required: true")
+    elif shape == 3:
+        lines.append("hooks:")
+        for hook in ("PreToolUse", "PostToolUse"):
+            lines.append(f"  - type: {hook}")
+            lines.append("    tool: Bash")
+            lines.append(f"    script: scripts/{hook.lower()}.sh")
+        lines.append("summary: >")
+        lines.append(f"  {_phrase(rng, 6)}")
+        lines.append(f"  {_phrase(rng, 6)}")
+    lines.append("---")
+    lines.append("")
+    lines.append(f"# Skill {i}")
+    lines.append("")
+    lines.append(_phrase(rng, 30))
+    return '\n'.join(lines) + '\n'
+
+def legacy_parse(content: str):
+    """The line loop validate/score/package-skill.py used before skill_frontmatter."""
+    frontmatter = {}
+    if not content.startswith('---'):
+        return frontmatter, content
+    parts = content.split('---', 2)
+    if len(parts) < 3:
+        return frontmatter, content
+
+    frontmatter_text = parts[1].strip()
+    body = parts[2].strip()
+
+    current_key = None
+    current_value = []
+    in_multiline = False
+
+    for line in frontmatter_text.split('\n'):
+        if not line.startswith(' ') and ':' in line:
+            if current_key and in_multiline:
+                frontmatter[current_key] = '\n'.join(current_value)
+
+            key_part = line.split(':', 1)
+            current_key = key_part[0].strip()
+            value = key_part[1].strip() if len(key_part) > 1 else ""
+
+            if value == '|':
+                in_multiline = True
+                current_value = []
+            elif value.startswith('[') or value.startswith('{'):
+                frontmatter[current_key] = value
+                current_key = None
+            elif value:
+                frontmatter[current_key] = value.strip('"\'')
+                current_key = None
+            else:
+                in_multiline = False
+                current_value = []
+        elif current_key and in_multiline:
+            current_value.append(line.strip())
+
+    if current_key and in_multiline:
+        frontmatter[current_key] = '\n'.join(current_value)
+
+    return frontmatter, body
+
+def pyyaml_parse(content: str):
+    text, body, _ = split_frontmatter(content)
+    return yaml.load(text, Loader=yaml.SafeLoader), body
+
+def bench(name: str, func, corpus, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in corpus:
+            func(content)
+        best = min(best, time.perf_counter() - start)
+    per_skill = best / len(corpus) * 1e6
+    print(f"  {name:<28} {best * 1000:9.1f} ms   {per_skill:7.2f} us/skill")
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark frontmatter parsers")
+    parser.add_argument("--skills", type=int, default=20000, help="Corpus size (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser; best is reported")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus = [make_skill(rng, i) for i in range(args.skills)]
+
+    changed = [text for text in SOURCE_TEXT
+               if as_text(parse_frontmatter(f"---\nversion: {text}\n---\n")[0]["version"]) != text]
+    for text in changed:
+        print(f"  Source text not kept: {text!r}")
+    if changed:
+        sys.exit(1)
+
+    if yaml is not None:
+        mismatches = sum(1 for c in corpus if parse_frontmatter(c)[0] != pyyaml_parse(c)[0])
+        print(f"Agreement with PyYAML: {len(corpus) - mismatches}/{len(corpus)} skills identical")
+        failed = 0
+        for case in EDGE_CASES:
+            content = f"---\n{case}---\n"
+            try:
+                ours = parse_frontmatter(content)[0]
+            except ValueError as e:
+                ours = e
+            if ours != pyyaml_parse(content)[0]:
+                failed += 1
+                print(f"  Edge case differs: {case!r}: {ours!r}")
+        print(f"Edge cases: {len(EDGE_CASES) - failed}/{len(EDGE_CASES)} identical")
+        if mismatches or failed:
+            sys.exit(1)
+
+    print(f"\nParsing {len(corpus)} skills (best of {args.repeat}):")
+    results = {
+        "legacy loop": bench("legacy loop (untyped)", legacy_parse, corpus, args.repeat),
+        "skill_frontmatter": bench("skill_frontmatter", parse_frontmatter, corpus, args.repeat),
+    }
+    if yaml is not None:
+        results["PyYAML"] = bench("PyYAML SafeLoader (pure)", pyyaml_parse, corpus, args.repeat)
+    else:
+        print("  PyYAML not installed; skipping")
+
+    base = results["skill_frontmatter"]
+    print()
+    for name, elapsed in results.items():
+        if name != "skill_frontmatter":
+            print(f"skill_frontmatter vs {name}: {elapsed / base:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Artifact Cache - List, pin and trim a package-skill.py --artifacts directory
+
+package-skill.py --artifacts DIR keeps packages in DIR, indexed by skill
+name, version and tree hash, and evicts the least recently used unpinned
+packages once DIR exceeds its byte budget. This shows what is cached and
+changes pins and the budget between runs.
+
+Usage:
+    python artifact-cache.py outputs/
+    python artifact-cache.py outputs/ --pin my-skill@1.2.0 --unpin my-skill@1.0.0
+    python artifact-cache.py outputs/ --budget 200MB
+"""
+
+import sys
+import json
+import argparse
+from datetime import datetime
+from pathlib import Path
+from dataclasses import asdict
+
+from skill_limits import parse_size
+from skill_store import ArtifactCache
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="List, pin and trim a package-skill.py --artifacts directory"
+    )
+    parser.add_argument(
+        "directory",
+        help="Artifact cache directory"
+    )
+    parser.add_argument(
+        "--pin",
+        action="append",
+        default=[],
+        metavar="NAME[@VERSION]",
+        help="Never evict this version (or every version of this skill); repeatable"
+    )
+    parser.add_argument(
+        "--unpin",
+        action="append",
+        default=[],
+        metavar="NAME[@VERSION]",
+        help="Remove a pin; repeatable"
+    )
+    parser.add_argument(
+        "--budget",
+        type=parse_size,
+        metavar="SIZE",
+        help="Set the byte budget, e.g. 500MB, and evict down to it now"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="With --budget, show what would be evicted without deleting it"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result as JSON"
+    )
+
+    args = parser.parse_args()
+    if not Path(args.directory).is_dir():
+        print(colorize(f"Error: {args.directory} is not a directory", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+    if args.dry_run and args.budget is None:
+        parser.error("--dry-run applies to --budget")
+
+    cache = ArtifactCache(Path(args.directory), None if args.dry_run else args.budget)
+    if args.pin or args.unpin:
+        cache.pin(args.pin, args.unpin)
+    eviction = None
+    if args.budget is not None:
+        if args.dry_run:
+            cache.budget = args.budget
+        eviction = cache.evict(dry_run=args.dry_run)
+    artifacts, pins, budget = cache.artifacts()
+    if args.dry_run:
+        # Listed as they would be after eviction
+        artifacts = [a for a in artifacts if a.file not in eviction["removed"]]
+    total = sum(a.size for a in artifacts)
+
+    if args.json:
+        output = {
+            "directory": str(Path(args.directory).resolve()),
+            "budget_bytes": budget,
+            "total_bytes": total,
+            "pins": pins,
+            "artifacts": [dict(asdict(a), pinned=cache.is_pinned(a, pins)) for a in artifacts],
+        }
+        if eviction is not None:
+            output["evicted"] = eviction["removed"]
+            output["dry_run"] = args.dry_run
+        print(json.dumps(output, indent=2))
+        sys.exit(0)
+
+    print(colorize(f"\n=== Artifact Cache: {args.directory} ===\n", Colors.BOLD))
+    if eviction is not None:
+        verb = "Would evict" if args.dry_run else "Evicted"
+        for file in eviction["removed"]:
+            print(colorize(f"  {verb}: {file}", Colors.YELLOW))
+        if eviction["removed"]:
+            print()
+    if not artifacts:
+        print("  (empty)")
+    for a in artifacts:
+        used = datetime.fromtimestamp(a.last_used).strftime("%Y-%m-%d %H:%M")
+        pinned = colorize("  pinned", Colors.BLUE) if cache.is_pinned(a, pins) else ""
+        print(f"  {a.file:<40} {a.size / 1024:>9.1f} KB  used {used}  {a.tree_hash[:12]}{pinned}")
+    print(f"\n{len(artifacts)} packages, {total / 1024:.1f} KB of {budget / 1024:.1f} KB budget")
+    if pins:
+        print(f"Pinned: {', '.join(pins)}")
+    if total > budget:
+        print(colorize("Over budget: the next package-skill.py --artifacts run (or --budget) evicts "
+                       "unpinned packages", Colors.YELLOW))
+
+if __name__ == "__main__":
+    main()
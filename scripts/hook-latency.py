@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Hook Latency - Time a skill's hooks and script entry points
+
+Runs every hook declared in SKILL.md frontmatter with a synthetic
+tool-event payload, and every other executable in scripts/ with --help,
+in a scratch copy of the skill. Reports cold start, p50/p99 over repeated
+runs and Python import time, and fails when a hook's p99 is over the
+latency budget (see skill_hooks.py).
+
+Usage:
+    python hook-latency.py path/to/skill
+    python hook-latency.py path/to/skill --runs 50 --budget 100 --json
+    python hook-latency.py path/to/skill --hooks-only
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import List
+
+from skill_frontmatter import FrontmatterError, parse_frontmatter
+from skill_hooks import (DEFAULT_BUDGET_MS, DEFAULT_RUNS, DEFAULT_TIMEOUT, HookHarness, HookTiming,
+                         declared_hooks, entry_points)
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+def format_ms(value) -> str:
+    return f"{value:.1f} ms" if value is not None else "-"
+
+def print_timings(skill_dir: Path, timings: List[HookTiming], budget_ms: float):
+    print(colorize(f"\n=== Hook Latency: {skill_dir.name} ===\n", Colors.BOLD))
+    if not timings:
+        print("No hooks or executable scripts found")
+        return
+    for timing in timings:
+        spec = timing.spec
+        label = f"{spec.event} {spec.tool or '*'}" if spec.is_hook else "entry point (--help)"
+        print(colorize(f"{spec.script}", Colors.BLUE) + f"  [{label}]")
+        if timing.error or timing.timed_out:
+            print(colorize(f"  Error: {timing.error}" if timing.error else "  Timed out", Colors.RED))
+            print()
+            continue
+        print(f"  Cold start: {format_ms(timing.cold_ms)}")
+        print(f"  p50: {format_ms(timing.p50_ms)}   p99: {format_ms(timing.p99_ms)}   ({len(timing.runs_ms)} runs)")
+        if timing.import_ms is not None:
+            slowest = ", ".join(f"{name} {ms:.1f}" for name, ms in timing.slowest_imports)
+            print(f"  Imports: {format_ms(timing.import_ms)} ({slowest})")
+        codes = sorted(set(timing.exit_codes))
+        if codes != [0]:
+            print(colorize(f"  Exit codes: {', '.join(map(str, codes))}", Colors.YELLOW))
+        if spec.is_hook:
+            if timing.over_budget(budget_ms):
+                print(colorize(f"  Over budget ({budget_ms:.0f} ms)", Colors.RED))
+            else:
+                print(colorize(f"  Within budget ({budget_ms:.0f} ms)", Colors.GREEN))
+        print()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Time a skill's hook scripts and scripts/ entry points"
+    )
+    parser.add_argument(
+        "path",
+        help="Path to skill directory or SKILL.md file"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help=f"Timed runs per script after the cold start (default: {DEFAULT_RUNS})"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=f"Seconds before a single run is killed (default: {DEFAULT_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=DEFAULT_BUDGET_MS,
+        metavar="MS",
+        help=f"Fail if a hook's p99 latency is above MS milliseconds (default: {DEFAULT_BUDGET_MS:g})"
+    )
+    parser.add_argument(
+        "--hooks-only",
+        action="store_true",
+        help="Only time hooks declared in SKILL.md, not other scripts/ entry points"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON"
+    )
+
+    args = parser.parse_args()
+
+    skill_dir = Path(args.path).resolve()
+    if skill_dir.is_file():
+        skill_dir = skill_dir.parent
+    skill_md = skill_dir / "SKILL.md"
+    if not skill_md.is_file():
+        print(colorize(f"Error: no SKILL.md in {skill_dir}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+    try:
+        frontmatter, _ = parse_frontmatter(skill_md.read_text(encoding='utf-8'))
+    except FrontmatterError as e:
+        print(colorize(f"Error: SKILL.md frontmatter: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+
+    specs = declared_hooks(frontmatter, skill_dir)
+    if not args.hooks_only:
+        specs += entry_points(skill_dir, specs)
+    timings = HookHarness(skill_dir, runs=args.runs, timeout=args.timeout).run(specs)
+    failed = [t for t in timings if t.spec.is_hook and t.over_budget(args.budget)]
+
+    if args.json:
+        print(json.dumps({
+            "skill_path": str(skill_dir),
+            "budget_ms": args.budget,
+            "passed": not failed,
+            "scripts": [t.to_dict(args.budget) for t in timings],
+        }, indent=2))
+    else:
+        print_timings(skill_dir, timings, args.budget)
+        hooks = sum(1 for t in timings if t.spec.is_hook)
+        if failed:
+            print(colorize(f"{len(failed)}/{hooks} hooks over the {args.budget:g} ms budget", Colors.RED))
+        elif hooks:
+            print(colorize(f"All {hooks} hooks within the {args.budget:g} ms budget", Colors.GREEN))
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
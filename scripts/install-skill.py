@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+Skill Installer - Incremental, atomic installs of packaged skills
+
+Installs a package from package-skill.py into a skills directory, writing
+only the files that changed:
+- Each archive entry is compared with the installed file by size, CRC-32
+  and (when the manifest records one) SHA-256
+- Unchanged files are hard-linked into a staging directory next to the
+  installed skill; changed files are extracted there
+- The staging directory is swapped in atomically, so an interrupted
+  install leaves the previous version in place
+
+A small record (.skill-install.json) keeps the size, mtime and hashes of
+installed files, so later upgrades compare without re-reading them.
+
+With --store, files are hard-linked from a content-addressed store under
+the skills directory (.skill-store), so a file shipped by many skills is
+kept on disk once. Files installed this way are read-only; --gc removes
+stored files no installed skill uses any more.
+
+Usage:
+    python install-skill.py my-skill-1.0.0.zip
+    python install-skill.py my-skill-1.1.0.zip --dest .claude/skills --dry-run
+    python install-skill.py my-skill-1.0.0.zip --store
+    python install-skill.py --gc
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import ctypes
+import shutil
+import hashlib
+import zipfile
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from skill_archive import read_layout, recorded_files
+from skill_store import STORE_DIRNAME, BlobStore, blob_mode
+
+RECORD_FILE = ".skill-install.json"
+RECORD_VERSION = 1
+COPY_CHUNK = 1024 * 1024
+DEFAULT_DEST = Path("~/.claude/skills").expanduser()
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+class InstallError(Exception):
+    """Raised when a package cannot be installed."""
+
+def _hash_file(path: Path) -> Tuple[int, str]:
+    """CRC-32 and SHA-256 of a file, read in chunks."""
+    crc = 0
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(COPY_CHUNK)
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            digest.update(chunk)
+    return crc, digest.hexdigest()
+
+def _exchange(a: Path, b: Path) -> bool:
+    """Atomically swap two directories with renameat2(RENAME_EXCHANGE) where supported."""
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (AttributeError, OSError):
+        return False
+    at_fdcwd, rename_exchange = -100, 2
+    return renameat2(at_fdcwd, os.fsencode(a), at_fdcwd, os.fsencode(b), rename_exchange) == 0
+
+@dataclass
+class InstallPlan:
+    """Which files an install writes, keeps, re-modes and removes."""
+    name: str
+    target: Path
+    write: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    chmod: List[str] = field(default_factory=list)
+    remove: List[str] = field(default_factory=list)
+
+    @property
+    def up_to_date(self) -> bool:
+        return self.target.is_dir() and not (self.write or self.chmod or self.remove)
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "target": str(self.target),
+            "written": self.write,
+            "unchanged": len(self.unchanged),
+            "mode_changed": self.chmod,
+            "removed": self.remove,
+        }
+
+class SkillInstaller:
+    """Install or upgrade one packaged skill under a skills directory."""
+
+    def __init__(self, package_path: str, dest: Optional[str] = None, use_store: bool = False):
+        self.package_path = Path(package_path)
+        self.dest = Path(dest).expanduser().resolve() if dest else DEFAULT_DEST
+        self.store = BlobStore(self.dest / STORE_DIRNAME) if use_store else None
+        self.manifest: Dict = {}
+        self.installed: Dict[str, List] = {}
+        self.fingerprints: Dict[str, List] = {}
+
+    def _mode(self, info: zipfile.ZipInfo) -> int:
+        mode = (info.external_attr >> 16) & 0o7777 or 0o644
+        # Stored blobs are shared, so their mode is fixed by the store
+        return blob_mode(mode) if self.store else mode
+
+    def _load_record(self, target: Path):
+        try:
+            with open(target / RECORD_FILE) as f:
+                data = json.load(f)
+            if data.get("version") == RECORD_VERSION:
+                self.installed = data.get("files", {})
+        except (OSError, ValueError):
+            self.installed = {}
+
+    def _fingerprint(self, path: Path, rel: str, st: os.stat_result) -> Tuple[int, str]:
+        """(crc, sha256) of an installed file, from the record when its stat is unchanged."""
+        record = self.installed.get(rel)
+        if record and record[0] == st.st_size and record[1] == st.st_mtime_ns:
+            return record[2], record[3]
+        return _hash_file(path)
+
+    def plan(self, zf: zipfile.ZipFile) -> InstallPlan:
+        """Compare the package with the installed tree without changing anything."""
+        name, self.manifest, issues = read_layout(zf)
+        if issues:
+            raise InstallError("; ".join(issues))
+        if not name:
+            raise InstallError("package is empty")
+
+        target = self.dest / name
+        plan = InstallPlan(name, target)
+        self._load_record(target)
+        hashes = recorded_files(self.manifest)
+        prefix = f"{name}/"
+        outside = [info.filename for info in zf.infolist() if not info.filename.startswith(prefix)]
+        if outside:
+            raise InstallError(f"entries outside {prefix}: {', '.join(outside)}")
+
+        packaged = set()
+        for info in zf.infolist():
+            if info.is_dir():
+                continue
+            rel = info.filename[len(prefix):]
+            packaged.add(rel)
+            path = target / rel
+            try:
+                st = path.stat()
+            except OSError:
+                plan.write.append(rel)
+                continue
+            if not path.is_file() or st.st_size != info.file_size:
+                plan.write.append(rel)
+                continue
+
+            crc, sha256 = self._fingerprint(path, rel, st)
+            expected = hashes.get(rel, {}).get("sha256") if isinstance(hashes.get(rel), dict) else None
+            if crc != info.CRC or (expected and expected != sha256):
+                plan.write.append(rel)
+                continue
+            plan.unchanged.append(rel)
+            self.fingerprints[rel] = [st.st_size, st.st_mtime_ns, crc, sha256]
+            if (st.st_mode & 0o7777) != self._mode(info):
+                plan.chmod.append(rel)
+
+        if target.is_dir():
+            for path in sorted(target.rglob('*')):
+                rel = path.relative_to(target).as_posix()
+                if path.is_file() and rel not in packaged and rel != RECORD_FILE:
+                    plan.remove.append(rel)
+        return plan
+
+    def _extract(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, path: Path) -> str:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        with zf.open(info) as src, open(path, 'wb') as dst:
+            while True:
+                chunk = src.read(COPY_CHUNK)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                dst.write(chunk)
+        os.chmod(path, self._mode(info))
+        return digest.hexdigest()
+
+    def _store_entry(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, rel: str, expected: Optional[str]) -> str:
+        """Make sure the store holds an entry's content; returns its SHA-256."""
+        executable = bool(self._mode(info) & 0o111)
+        if expected and self.store.has(expected, executable):
+            return expected
+        with zf.open(info) as src:
+            digest, _ = self.store.put_stream(src, executable)
+        if expected and digest != expected:
+            raise InstallError(f"{rel}: SHA-256 does not match manifest")
+        return digest
+
+    def _link_from_store(self, digest: str, info: zipfile.ZipInfo, path: Path):
+        executable = bool(self._mode(info) & 0o111)
+        try:
+            self.store.link(digest, executable, path)
+        except OSError:
+            # Store on another filesystem: fall back to a private copy
+            shutil.copyfile(self.store.blob_path(digest, executable), path)
+            os.chmod(path, self._mode(info))
+
+    def _stage(self, zf: zipfile.ZipFile, plan: InstallPlan, staging: Path) -> Dict[str, List]:
+        """Build the new tree in staging: links for unchanged files, extraction for the rest."""
+        staging.mkdir(parents=True)
+        record = {}
+        infos = {info.filename[len(plan.name) + 1:]: info for info in zf.infolist() if not info.is_dir()}
+        changed = set(plan.write)
+        chmod = set(plan.chmod)
+        hashes = recorded_files(self.manifest)
+
+        for rel, info in infos.items():
+            path = staging / rel
+            if self.store is not None:
+                if rel in changed:
+                    expected = hashes.get(rel, {}).get("sha256") if isinstance(hashes.get(rel), dict) else None
+                    sha256 = self._store_entry(zf, info, rel, expected)
+                else:
+                    # Already installed: move it into the store if an earlier install did not
+                    sha256 = self.fingerprints[rel][3]
+                    executable = bool(self._mode(info) & 0o111)
+                    if not self.store.has(sha256, executable):
+                        self.store.put_file(plan.target / rel, executable)
+                self._link_from_store(sha256, info, path)
+                st = path.stat()
+                record[rel] = [st.st_size, st.st_mtime_ns, info.CRC, sha256]
+                continue
+            if rel in changed:
+                sha256 = self._extract(zf, info, path)
+                st = path.stat()
+                record[rel] = [st.st_size, st.st_mtime_ns, info.CRC, sha256]
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if rel in chmod:
+                # Copy rather than link: the inode may be shared with the store or other skills
+                shutil.copy2(plan.target / rel, path)
+                os.chmod(path, self._mode(info))
+            else:
+                try:
+                    os.link(plan.target / rel, path)
+                except OSError:
+                    shutil.copy2(plan.target / rel, path)
+            st = path.stat()
+            record[rel] = [st.st_size, st.st_mtime_ns] + self.fingerprints[rel][2:]
+
+        with open(staging / RECORD_FILE, 'w') as f:
+            json.dump({"version": RECORD_VERSION, "files": record}, f, separators=(',', ':'))
+        return record
+
+    def _swap(self, staging: Path, target: Path):
+        """Put staging in place of target atomically."""
+        if not target.exists():
+            os.rename(staging, target)
+            return
+        if _exchange(staging, target):
+            shutil.rmtree(staging)
+            return
+        # No atomic exchange: two renames, with the old tree kept until the new one is in place
+        backup = target.with_name(f".{target.name}.old-{os.getpid()}")
+        os.rename(target, backup)
+        try:
+            os.rename(staging, target)
+        except OSError:
+            os.rename(backup, target)
+            raise
+        shutil.rmtree(backup)
+
+    def _recover(self, target: Path):
+        """Restore a previous version left behind by an interrupted two-rename swap."""
+        if target.exists():
+            return
+        backups = sorted(target.parent.glob(f".{target.name}.old-*"))
+        if backups:
+            os.rename(backups[-1], target)
+
+    def install(self, dry_run: bool = False) -> InstallPlan:
+        """Install the package; with dry_run, only compute the plan."""
+        try:
+            zf = zipfile.ZipFile(self.package_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            raise InstallError(f"not a readable zip archive: {e}")
+
+        with zf:
+            self.dest.mkdir(parents=True, exist_ok=True)
+            if not dry_run:
+                name, _, issues = read_layout(zf)
+                if name and not issues:
+                    self._recover(self.dest / name)
+            plan = self.plan(zf)
+            if dry_run or plan.up_to_date:
+                return plan
+
+            staging = self.dest / f".{plan.name}.staging-{os.getpid()}"
+            try:
+                self._stage(zf, plan, staging)
+                self._swap(staging, plan.target)
+            except (OSError, zipfile.BadZipFile, zlib.error, InstallError) as e:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise InstallError(f"install failed, previous version kept: {e}")
+        return plan
+
+def print_plan(plan: InstallPlan, elapsed_ms: float, dry_run: bool):
+    print(colorize(f"\n=== {'Install Plan' if dry_run else 'Skill Install'}: {plan.name} ===\n", Colors.BOLD))
+    print(f"Target: {plan.target}\n")
+    for rel in plan.write:
+        print(f"  {'Would write' if dry_run else 'Written'}: {rel}")
+    for rel in plan.chmod:
+        print(f"  {'Would change mode' if dry_run else 'Mode changed'}: {rel}")
+    for rel in plan.remove:
+        print(f"  {'Would remove' if dry_run else 'Removed'}: {rel}")
+
+    if plan.up_to_date:
+        print(colorize("Already up to date", Colors.GREEN))
+    summary = (f"{len(plan.write)} written, {len(plan.unchanged)} unchanged, "
+               f"{len(plan.remove)} removed in {elapsed_ms:.1f} ms")
+    print(colorize(f"\n{summary}", Colors.YELLOW if dry_run else Colors.GREEN))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Install a packaged skill, writing only changed files"
+    )
+    parser.add_argument(
+        "package",
+        nargs="?",
+        help="Skill package (.zip) created by package-skill.py"
+    )
+    parser.add_argument(
+        "-d", "--dest",
+        help=f"Skills directory to install into (default: {DEFAULT_DEST})"
+    )
+    parser.add_argument(
+        "--store",
+        action="store_true",
+        help=f"Hard-link files from the shared content store (DEST/{STORE_DIRNAME})"
+    )
+    parser.add_argument(
+        "--gc",
+        action="store_true",
+        help="Remove stored files no installed skill uses, then exit"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would change without writing anything"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result as JSON"
+    )
+
+    args = parser.parse_args()
+
+    if args.gc:
+        dest = Path(args.dest).expanduser().resolve() if args.dest else DEFAULT_DEST
+        store = BlobStore(dest / STORE_DIRNAME)
+        result = store.gc(dry_run=args.dry_run)
+        usage = store.usage()
+        if args.json:
+            print(json.dumps({"store": str(store.root), "dry_run": args.dry_run, **result,
+                              "remaining_blobs": usage["blobs"], "remaining_bytes": usage["bytes"]}, indent=2))
+        else:
+            verb = "Would remove" if args.dry_run else "Removed"
+            print(f"{verb} {result['removed']} unused blobs ({result['bytes_freed'] / 1024:.1f} KB) from {store.root}")
+            print(f"Store holds {usage['blobs']} blobs ({usage['bytes'] / 1024:.1f} KB)")
+        sys.exit(0)
+
+    if not args.package:
+        parser.error("a package is required unless --gc is given")
+
+    installer = SkillInstaller(args.package, args.dest, args.store)
+    start = time.perf_counter()
+    try:
+        plan = installer.install(dry_run=args.dry_run)
+    except InstallError as e:
+        if args.json:
+            print(json.dumps({"success": False, "error": str(e)}, indent=2))
+        else:
+            print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        output = {"success": True, "dry_run": args.dry_run, **plan.to_dict(),
+                  "elapsed_ms": round(elapsed_ms, 1)}
+        print(json.dumps(output, indent=2))
+    else:
+        print_plan(plan, elapsed_ms, args.dry_run)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Merge Reports - Combine the JSON reports of a sharded run
+
+Each shard of a --shard K/N run of validate-skill.py, score-skill.py or
+package-skill.py writes its own --json report. This merges them into one
+report for the whole run, checking that every shard 1..N is present
+exactly once, and exits the way a single unsharded run would have:
+0 when every shard passed, 1 when any failed.
+
+--ndjson shard files are merged into one NDJSON stream instead: the
+records of shard 1, then shard 2 and so on, and a final summary line.
+Each shard file ends with a trailer line naming its shard, so shards are
+checked before any record is read, and records are streamed rather than
+held in memory.
+
+With --costs, the inputs are instead --record-costs files from several
+nodes, merged into one file for the next --shard-costs run.
+
+Usage:
+    python merge-reports.py shard-*.json > report.json
+    python merge-reports.py shard-*.json --summary
+    python merge-reports.py shard-*.ndjson > report.ndjson
+    python merge-reports.py --costs costs-*.json > costs.json
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, TextIO, Tuple
+
+from skill_shard import load_costs
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+class MergeError(Exception):
+    """The shard reports cannot be merged into a complete result."""
+
+def report_kind(report: Dict) -> str:
+    if "tool" in report:
+        return report["tool"]
+    if "packages" in report:
+        return "package"
+    if "all_passed" in report:
+        return "validate"
+    return "score"
+
+def record_order(record: Dict) -> Tuple:
+    # Discovery order walks directories sorted by name, so path parts sort the same way
+    path = record.get("skill_path") or record.get("package_path") or ""
+    return Path(path).parts
+
+def load_report(path: str) -> Dict:
+    try:
+        with open(path, encoding='utf-8') as f:
+            report = json.load(f)
+    except (OSError, ValueError) as e:
+        raise MergeError(f"{path}: {e}")
+    if not isinstance(report, dict) or not isinstance(report.get("shard"), dict):
+        raise MergeError(f"{path}: not a sharded --json report (run with --shard K/N --json)")
+    return report
+
+def is_ndjson(path: str) -> bool:
+    # --ndjson puts a whole record on the first line; --json output is indented
+    try:
+        with open(path, encoding='utf-8') as f:
+            first = f.readline()
+    except OSError as e:
+        raise MergeError(f"{path}: {e}")
+    try:
+        return isinstance(json.loads(first), dict)
+    except ValueError:
+        return False
+
+def ndjson_records(path: str) -> Iterator[Dict]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise MergeError(f"{path}:{number}: {e}")
+    except OSError as e:
+        raise MergeError(f"{path}: {e}")
+
+def load_trailer(path: str) -> Dict:
+    """The shard trailer that ends a sharded --ndjson file."""
+    last = None
+    for last in ndjson_records(path):
+        pass
+    if not isinstance(last, dict) or not isinstance(last.get("shard"), dict):
+        raise MergeError(f"{path}: no shard trailer (run with --shard K/N --ndjson, "
+                         f"and check the run was not cut short)")
+    return last
+
+def check_shards(reports: List[Dict], names: List[str]) -> str:
+    """The tool the reports come from; raises MergeError if shards are missing or mixed."""
+    kinds = {report_kind(r) for r in reports}
+    if len(kinds) > 1:
+        raise MergeError(f"reports from different tools: {', '.join(sorted(kinds))}")
+    counts = {r["shard"]["count"] for r in reports}
+    if len(counts) > 1:
+        raise MergeError(f"reports from runs with different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    seen: Dict[int, str] = {}
+    for report, name in zip(reports, names):
+        index = report["shard"]["index"]
+        if index in seen:
+            raise MergeError(f"shard {index}/{count} given twice: {seen[index]} and {name}")
+        seen[index] = name
+    missing = [str(i) for i in range(1, count + 1) if i not in seen]
+    if missing:
+        raise MergeError(f"missing shard(s) {', '.join(missing)} of {count}")
+    return kinds.pop()
+
+def merge_reports(reports: List[Dict], names: List[str]) -> Dict:
+    """One report for the whole run; raises MergeError if shards are missing or mixed."""
+    kind = check_shards(reports, names)
+    reports = sorted(reports, key=lambda r: r["shard"]["index"])
+    passed = all(r["shard"]["passed"] for r in reports)
+    shards = [r["shard"] for r in reports]
+    if kind == "package":
+        packages = sorted((p for r in reports for p in r["packages"]), key=record_order)
+        return {"all_succeeded": passed, "packages": packages, "shards": shards}
+    skills = sorted((s for r in reports for s in r["skills"]), key=record_order)
+    if kind == "validate":
+        skipped = [s for r in reports for s in r.get("skipped_skills", [])]
+        return {"all_passed": passed, "skills": skills, "skipped_skills": skipped, "shards": shards}
+    return {"passed": passed, "skills": skills, "shards": shards}
+
+def merge_ndjson(paths: List[str], out: TextIO = None) -> Dict:
+    """Write the records of --ndjson shard files to out in shard order, returning the summary.
+
+    Shards are checked from their trailers first, so nothing is written for
+    an incomplete run. Records keep their order within each shard.
+    """
+    trailers = [load_trailer(path) for path in paths]
+    kind = check_shards(trailers, paths)
+    ordered = sorted(zip(trailers, paths), key=lambda t: t[0]["shard"]["index"])
+    records = 0
+    for _, path in ordered:
+        for record in ndjson_records(path):
+            if "shard" in record:
+                continue
+            if out:
+                out.write(json.dumps(record, separators=(',', ':')) + "\n")
+            records += 1
+    shards = [trailer["shard"] for trailer, _ in ordered]
+    passed = all(shard["passed"] for shard in shards)
+    summary = {"tool": kind, "all_passed" if kind == "validate" else "passed": passed, "shards": shards}
+    if out:
+        out.write(json.dumps(summary, separators=(',', ':')) + "\n")
+    return dict(summary, records=records)
+
+def merge_costs(paths: List[str]) -> Dict[str, float]:
+    """Union of recorded cost files; later files win for skills recorded twice."""
+    merged: Dict[str, float] = {}
+    for path in paths:
+        if not Path(path).is_file():
+            raise MergeError(f"{path}: no such file")
+        merged.update(load_costs(path))
+    return dict(sorted(merged.items()))
+
+def overall_passed(merged: Dict) -> bool:
+    for key in ("all_passed", "passed", "all_succeeded"):
+        if key in merged:
+            return merged[key]
+    return False
+
+def print_summary(merged: Dict):
+    print(colorize("\n=== Merged Shards ===\n", Colors.BOLD))
+    for shard in merged["shards"]:
+        status = colorize("passed", Colors.GREEN) if shard["passed"] else colorize("failed", Colors.RED)
+        print(f"  Shard {shard['index']}/{shard['count']}: {shard['skills']} skills, {status}")
+    records = merged.get("records", len(merged.get("skills", merged.get("packages", []))))
+    print(f"\n{records} skills across {len(merged['shards'])} shards")
+    if merged.get("skipped_skills"):
+        print(colorize(f"{len(merged['skipped_skills'])} skills not validated (stopped early)", Colors.YELLOW))
+    if overall_passed(merged):
+        print(colorize("All shards passed", Colors.GREEN))
+    else:
+        print(colorize("Some shards failed", Colors.RED))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge the --json or --ndjson reports of a sharded validate, score or package run"
+    )
+    parser.add_argument(
+        "reports",
+        nargs="+",
+        help="Per-shard --json or --ndjson reports (or --record-costs files, with --costs)"
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print a per-shard summary instead of the merged JSON"
+    )
+    parser.add_argument(
+        "--costs",
+        action="store_true",
+        help="Merge --record-costs files into one --shard-costs file"
+    )
+
+    args = parser.parse_args()
+
+    try:
+        if args.costs:
+            print(json.dumps(merge_costs(args.reports), indent=2))
+            sys.exit(0)
+        ndjson = [is_ndjson(path) for path in args.reports]
+        if any(ndjson) and not all(ndjson):
+            raise MergeError("cannot merge --json and --ndjson reports together")
+        if all(ndjson):
+            merged = merge_ndjson(args.reports, None if args.summary else sys.stdout)
+        else:
+            merged = merge_reports([load_report(path) for path in args.reports], args.reports)
+    except MergeError as e:
+        print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+
+    if args.summary:
+        print_summary(merged)
+    elif not all(ndjson):
+        print(json.dumps(merged, indent=2))
+    sys.exit(0 if overall_passed(merged) else 1)
+
+if __name__ == "__main__":
+    main()
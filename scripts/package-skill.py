@@ -2,7 +2,7 @@
 """
 Skill Packager - Create distribution-ready packages for Claude Code skills
 
-Creates a ZIP file with:
+Creates a ZIP file (or, with --format, a tar.gz/tar.xz/tar.zst stream) with:
 - All skill files
 - Generated README.md (if not present)
 - manifest.json for agentskills.io
@@ -13,11 +13,29 @@ import os
 import sys
 import re
 import json
-import zipfile
+import time
+import hashlib
 import argparse
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional
+from contextlib import nullcontext, redirect_stdout
+from datetime import datetime, timezone
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from skill_archive import (ARCHIVE_FORMATS, END_RECORD_SIZE, SAMPLE_BYTES, TAR_FORMATS, ArchiveEntry, CountingWriter,
+                           ParallelZipWriter, SizeEstimate, TarStreamWriter, available_formats,
+                           estimate_entry, source_date_epoch, verify_zip)
+from skill_frontmatter import FrontmatterError, as_list, as_text, parse_frontmatter
+from skill_limits import parse_size
+from skill_links import unreachable_files
+from skill_metrics import SIZE_BUCKETS, Metrics, add_metrics_argument
+from skill_shard import add_shard_arguments, record_costs, shard_info, shard_paths, skill_key
+from skill_store import ArtifactCache, DeflateCache
+from skill_walk import SkillWalker
+
+DEFAULT_BUDGET = 10 * 1024 * 1024
+ANALYZE_TOP = 20
+# Bump when the package layout changes, so cached artifacts are rebuilt
+TREE_HASH_VERSION = 1
 
 class Colors:
     GREEN = '\033[92m'
@@ -35,13 +53,37 @@ def colorize(text: str, color: str) -> str:
 class SkillPackager:
     """Package Claude Code skills for distribution."""
 
-    def __init__(self, skill_path: str, output_dir: str = None):
+    def __init__(self, skill_path: str, output_dir: str = None, exclude_unreachable: bool = False,
+                 workers: Optional[int] = None, cache: Optional[DeflateCache] = None,
+                 archive_format: str = 'zip', stream: Optional[BinaryIO] = None,
+                 metrics: Optional[Metrics] = None, artifacts: Optional[ArtifactCache] = None):
         self.skill_path = Path(skill_path).resolve()
         self.output_dir = Path(output_dir).resolve() if output_dir else self.skill_path.parent
+        self.exclude_unreachable = exclude_unreachable
+        self.workers = workers
+        self.cache = cache
+        # With a stream (e.g. stdout), the package is written there instead of a file
+        self.archive_format = archive_format
+        self.stream = stream
+        # Collect and write times go to metrics, when given
+        self.metrics = metrics
+        # With an artifact cache, an unchanged skill reuses its earlier package
+        self.artifacts = artifacts
+        self.reused = False
+        self.package_size = 0
+        # Time stamped on generated entries and the manifest; see package()
+        self.build_time = 0
+        self.contents: List[Tuple[str, int]] = []
+        self.excluded: List[Tuple[Path, int]] = []
+        self.cycles: List[str] = []
         self.skill_md_path = None
         self.content = ""
         self.frontmatter = {}
         self.body = ""
+        self.parse_error: Optional[FrontmatterError] = None
+
+    def phase(self, name: str):
+        return self.metrics.phase(name) if self.metrics is not None else nullcontext()
 
     def find_skill_file(self) -> bool:
         """Locate the SKILL.md file."""
@@ -62,103 +104,60 @@ class SkillPackager:
         except Exception:
             return False
 
-        if not self.content.startswith('---'):
-            self.body = self.content
-            return True
-
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
-            self.body = self.content
-            return True
-
-        frontmatter_text = parts[1].strip()
-        self.body = parts[2].strip()
-
-        # Simple YAML parsing
-        current_key = None
-        current_value = []
-        in_multiline = False
-
-        for line in frontmatter_text.split('\n'):
-            if not line.startswith(' ') and ':' in line:
-                if current_key and in_multiline:
-                    self.frontmatter[current_key] = '\n'.join(current_value)
-
-                key_part = line.split(':', 1)
-                current_key = key_part[0].strip()
-                value = key_part[1].strip() if len(key_part) > 1 else ""
-
-                if value == '|':
-                    in_multiline = True
-                    current_value = []
-                elif value.startswith('[') or value.startswith('{'):
-                    self.frontmatter[current_key] = value
-                    current_key = None
-                elif value:
-                    self.frontmatter[current_key] = value.strip('"\'')
-                    current_key = None
-                else:
-                    in_multiline = False
-                    current_value = []
-            elif current_key and in_multiline:
-                current_value.append(line.strip())
-
-        if current_key and in_multiline:
-            self.frontmatter[current_key] = '\n'.join(current_value)
-
+        try:
+            data, self.body = parse_frontmatter(self.content)
+        except FrontmatterError as e:
+            self.parse_error = e
+            return False
+        # Keys without a value are absent, as before
+        self.frontmatter = {k: v for k, v in data.items() if v is not None}
         return True
 
-    def generate_manifest(self) -> Dict:
-        """Generate agentskills.io manifest."""
-        name = self.frontmatter.get('name', self.skill_path.name)
-        description = self.frontmatter.get('description', '')
+    def generate_manifest(self, files: Optional[Dict[str, Dict]] = None) -> Dict:
+        """Generate agentskills.io manifest; files maps package paths to size and SHA-256."""
+        name = as_text(self.frontmatter.get('name', self.skill_path.name))
+        description = as_text(self.frontmatter.get('description', ''))
 
         # Extract first line of description for short desc
         short_desc = description.split('\n')[0].strip() if description else f"{name} skill"
 
         manifest = {
             "name": name,
-            "version": self.frontmatter.get('version', '1.0.0').strip('"'),
+            "version": as_text(self.frontmatter.get('version', '1.0.0')),
             "description": short_desc,
-            "author": self.frontmatter.get('author', 'Unknown'),
-            "license": self.frontmatter.get('license', 'MIT'),
+            "author": as_text(self.frontmatter.get('author', 'Unknown')),
+            "license": as_text(self.frontmatter.get('license', 'MIT')),
             "platforms": ["claude-code"],
             "tags": [],
             "skill_file": "SKILL.md",
-            "created": datetime.now().isoformat(),
+            "created": datetime.fromtimestamp(self.build_time, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S'),
         }
 
         # Extract tags from frontmatter or generate from description
         if 'tags' in self.frontmatter:
-            tags_str = self.frontmatter['tags']
-            if tags_str.startswith('['):
-                # Try to parse as JSON array
-                try:
-                    manifest['tags'] = json.loads(tags_str.replace("'", '"'))
-                except:
-                    pass
+            manifest['tags'] = [as_text(t) for t in as_list(self.frontmatter['tags'])]
         else:
             # Generate tags from name and description
             words = re.findall(r'\b[a-z]{3,}\b', (name + ' ' + description).lower())
             common_words = {'the', 'and', 'for', 'when', 'use', 'this', 'that', 'with'}
             tags = [w for w in words if w not in common_words][:5]
-            manifest['tags'] = list(set(tags))
+            # First occurrence order, so the manifest does not depend on set ordering
+            manifest['tags'] = list(dict.fromkeys(tags))
 
         # Add platforms if specified
         if 'platforms' in self.frontmatter:
-            platforms_str = self.frontmatter['platforms']
-            if platforms_str.startswith('['):
-                try:
-                    manifest['platforms'] = json.loads(platforms_str.replace("'", '"'))
-                except:
-                    pass
+            manifest['platforms'] = [as_text(p) for p in as_list(self.frontmatter['platforms'])]
+
+        # Content hashes let --verify check the package after download
+        if files is not None:
+            manifest['files'] = files
 
         return manifest
 
     def generate_readme(self) -> str:
         """Generate README.md for the package."""
-        name = self.frontmatter.get('name', self.skill_path.name)
-        description = self.frontmatter.get('description', '')
+        name = as_text(self.frontmatter.get('name', self.skill_path.name))
+        description = as_text(self.frontmatter.get('description', ''))
 
         # Extract first paragraph as short description
         short_desc = description.split('\n')[0].strip() if description else ""
@@ -213,8 +212,9 @@ See the `manifest.json` for agentskills.io compatibility information.
             dir_path = self.skill_path / subdir
             if dir_path.exists():
                 readme += f"├── {subdir}/\n"
+                excluded = {path for path, _ in self.excluded}
                 for f in dir_path.iterdir():
-                    if not f.name.startswith('.'):
+                    if not f.name.startswith('.') and f not in excluded:
                         readme += f"│   └── {f.name}\n"
 
         readme += """```
@@ -222,30 +222,79 @@ See the `manifest.json` for agentskills.io compatibility information.
 ## License
 
 """
-        license_name = self.frontmatter.get('license', 'MIT')
+        license_name = as_text(self.frontmatter.get('license', 'MIT'))
         readme += f"This skill is released under the {license_name} License.\n"
 
         return readme
 
     def collect_files(self) -> List[Path]:
         """Collect all files to include in package."""
-        files = []
+        # Ignored directories (.git/, node_modules/, virtualenvs, .skillignore
+        # and .gitignore matches) are pruned before the walk descends
+        walker = SkillWalker(self.skill_path)
+        files = [self.skill_path / rel for rel, _ in walker.walk()]
+        self.cycles = walker.cycles
 
-        # Walk the skill directory
-        for item in self.skill_path.rglob('*'):
-            if item.is_file():
-                # Skip unwanted files
-                if item.name.startswith('.'):
-                    continue
-                if item.name in ['__pycache__', '.DS_Store', 'Thumbs.db']:
-                    continue
-                if item.suffix in ['.pyc', '.pyo']:
-                    continue
+        # Sorted so the archive layout does not depend on directory order
+        files.sort()
 
-                files.append(item)
+        if self.exclude_unreachable:
+            self.excluded = unreachable_files(self.skill_path, files)
+            dead = {path for path, _ in self.excluded}
+            files = [f for f in files if f not in dead]
 
         return files
 
+    def tree_hash(self, name: str, files: List[Path]) -> str:
+        """SHA-256 of everything the package is built from: name, format, paths, modes and contents."""
+        digest = hashlib.sha256(f"{TREE_HASH_VERSION}\0{name}\0{self.archive_format}\0".encode('utf-8'))
+        for path in files:
+            file_hash = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    file_hash.update(chunk)
+            executable = os.stat(path).st_mode & 0o111 != 0
+            rel = path.relative_to(self.skill_path).as_posix()
+            digest.update(f"{rel}\0{int(executable)}\0{file_hash.hexdigest()}\0".encode('utf-8'))
+        return digest.hexdigest()
+
+    def analyze(self, sample_bytes: int = SAMPLE_BYTES) -> List[SizeEstimate]:
+        """Estimate the size of every file collect_files would package, largest first.
+
+        Only the first sample_bytes of each file are compressed and nothing
+        is written, so this is cheap enough to run on every commit.
+        """
+        name = as_text(self.frontmatter.get('name', self.skill_path.name))
+        estimates = [
+            estimate_entry(path, f"{name}/{path.relative_to(self.skill_path).as_posix()}", sample_bytes=sample_bytes)
+            for path in self.collect_files()
+        ]
+        estimates.sort(key=lambda e: (-e.size, e.arcname))
+        return estimates
+
+    def find_unreachable(self) -> List[Tuple[Path, int]]:
+        """List references/ and scripts/ files SKILL.md never links to, with their sizes."""
+        exclude = self.exclude_unreachable
+        self.exclude_unreachable = False
+        try:
+            return unreachable_files(self.skill_path, self.collect_files())
+        finally:
+            self.exclude_unreachable = exclude
+
+    def print_unreachable(self, unreachable: List[Tuple[Path, int]]):
+        """Print the dead-weight report."""
+        print(colorize("\n=== Unreachable Files ===\n", Colors.BOLD))
+        if not unreachable:
+            print(colorize("Every file in references/ and scripts/ is reachable from SKILL.md", Colors.GREEN))
+            return
+
+        for path, size in unreachable:
+            print(f"  {path.relative_to(self.skill_path)} ({size} bytes)")
+
+        total = sum(size for _, size in unreachable)
+        print(colorize(f"\n{len(unreachable)} unreachable files, {total / 1024:.1f} KB", Colors.YELLOW))
+        print("Link them from SKILL.md or package with --exclude-unreachable")
+
     def package(self) -> Optional[Path]:
         """Create the distribution package."""
         if not self.find_skill_file():
@@ -253,50 +302,102 @@ See the `manifest.json` for agentskills.io compatibility information.
             return None
 
         if not self.parse_frontmatter():
-            print(colorize("Error: Could not parse SKILL.md", Colors.RED))
+            detail = f": frontmatter error at {self.parse_error}" if self.parse_error else ""
+            print(colorize(f"Error: Could not parse SKILL.md{detail}", Colors.RED))
             return None
 
-        name = self.frontmatter.get('name', self.skill_path.name)
-        version = self.frontmatter.get('version', '1.0.0').strip('"')
+        name = as_text(self.frontmatter.get('name', self.skill_path.name))
+        version = as_text(self.frontmatter.get('version', '1.0.0'))
 
         # Create output filename
         safe_name = re.sub(r'[^a-z0-9-]', '-', name.lower())
-        zip_name = f"{safe_name}-{version}.zip"
-        zip_path = self.output_dir / zip_name
+        zip_name = f"{safe_name}-{version}.{self.archive_format}"
+        zip_path = self.output_dir / zip_name if self.stream is None else Path("-")
 
         print(colorize(f"\nPackaging skill: {name}", Colors.BOLD))
         print(f"Version: {version}")
-        print(f"Output: {zip_path}\n")
+        print(f"Output: {zip_path if self.stream is None else 'stdout'} ({self.archive_format})\n")
 
         # Collect files
-        files = self.collect_files()
+        with self.phase("collect"):
+            files = self.collect_files()
+        for path, size in self.excluded:
+            print(f"  Excluded (unreachable): {path.relative_to(self.skill_path)} ({size} bytes)")
+        for rel in self.cycles:
+            print(colorize(f"  Skipped (symlink cycle): {rel}", Colors.YELLOW))
+
+        tree_hash = None
+        if self.artifacts is not None and self.stream is None:
+            tree_hash = self.tree_hash(name, files)
+            cached = self.artifacts.lookup(tree_hash, self.archive_format)
+            if cached is not None:
+                self.reused = True
+                self.package_size = cached.stat().st_size
+                print(colorize(f"Package unchanged, reused: {cached}", Colors.GREEN))
+                print(f"Size: {self.package_size / 1024:.1f} KB")
+                return cached
+
+        # Generated files are stamped with SOURCE_DATE_EPOCH, or else the newest
+        # packaged file's mtime, so an unchanged tree packages byte for byte the same
+        epoch = source_date_epoch()
+        if epoch is not None:
+            self.build_time = epoch
+        else:
+            self.build_time = int(max((os.stat(f).st_mtime for f in files), default=0))
 
-        # Create ZIP
+        # Create ZIP: entries are compressed in parallel, written in this order.
+        # Tar formats write the same entries in the same order as one stream
         try:
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                # Add skill files
-                for file_path in files:
-                    arcname = f"{name}/{file_path.relative_to(self.skill_path)}"
-                    zf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
-
-                # Add manifest.json if not present
+            entries = [
+                ArchiveEntry.from_file(file_path, f"{name}/{file_path.relative_to(self.skill_path).as_posix()}",
+                                       clamp=epoch)
+                for file_path in files
+            ]
+            generated = []
+
+            # Add README.md if not present
+            readme_path = self.skill_path / "README.md"
+            if not readme_path.exists():
+                readme = self.generate_readme()
+                generated.append(ArchiveEntry.from_bytes(f"{name}/README.md", readme.encode('utf-8'),
+                                                         self.build_time, utc=epoch is not None))
+
+            with self.phase("write"), \
+                    (open(zip_path, 'wb') if self.stream is None else nullcontext(self.stream)) as f:
+                out = CountingWriter(f)
+                if self.archive_format in TAR_FORMATS:
+                    writer = TarStreamWriter(out, self.archive_format)
+                else:
+                    writer = ParallelZipWriter(out, self.workers, cache=self.cache)
+                written = writer.write_entries(entries + generated)
+
+                # Add manifest.json if not present, last, so it can record every hash
                 manifest_path = self.skill_path / "manifest.json"
                 if not manifest_path.exists():
-                    manifest = self.generate_manifest()
+                    prefix = len(name) + 1
+                    manifest = self.generate_manifest({
+                        item.entry.arcname[prefix:]: {"size": item.file_size, "sha256": item.sha256}
+                        for item in written
+                    })
                     manifest_content = json.dumps(manifest, indent=2)
-                    zf.writestr(f"{name}/manifest.json", manifest_content)
-                    print(f"  Generated: {name}/manifest.json")
-
-                # Add README.md if not present
-                readme_path = self.skill_path / "README.md"
-                if not readme_path.exists():
-                    readme = self.generate_readme()
-                    zf.writestr(f"{name}/README.md", readme)
-                    print(f"  Generated: {name}/README.md")
-
-            print(colorize(f"\nPackage created: {zip_path}", Colors.GREEN))
-            print(f"Size: {zip_path.stat().st_size / 1024:.1f} KB")
+                    generated.append(ArchiveEntry.from_bytes(f"{name}/manifest.json",
+                                                             manifest_content.encode('utf-8'),
+                                                             self.build_time, utc=epoch is not None))
+                    written = writer.write_entries(generated[-1:])
+                writer.close()
+                out.flush()
+            self.package_size = out.count
+            self.contents = [(item.entry.arcname, item.file_size) for item in written]
+            if tree_hash is not None:
+                self.artifacts.record(name, version, self.archive_format, tree_hash, zip_path)
+
+            for entry in entries:
+                print(f"  Added: {entry.arcname}")
+            for entry in generated:
+                print(f"  Generated: {entry.arcname}")
+
+            print(colorize(f"\nPackage created: {zip_path if self.stream is None else 'stdout'}", Colors.GREEN))
+            print(f"Size: {self.package_size / 1024:.1f} KB")
 
             return zip_path
 
@@ -306,15 +407,16 @@ See the `manifest.json` for agentskills.io compatibility information.
 
     def print_summary(self, zip_path: Path):
         """Print package summary and next steps."""
-        name = self.frontmatter.get('name', self.skill_path.name)
+        name = as_text(self.frontmatter.get('name', self.skill_path.name))
 
         print(colorize("\n=== Package Summary ===\n", Colors.BOLD))
 
         # List contents
         print("Contents:")
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            for info in zf.infolist():
-                print(f"  {info.filename} ({info.file_size} bytes)")
+        if self.reused:
+            print("  Unchanged since the cached package was built")
+        for arcname, size in self.contents:
+            print(f"  {arcname} ({size} bytes)")
 
         print(colorize("\n=== Distribution Options ===\n", Colors.BOLD))
 
@@ -331,49 +433,318 @@ See the `manifest.json` for agentskills.io compatibility information.
         print()
 
         print(colorize("=== Installation Command ===\n", Colors.BOLD))
-        print(f"unzip {zip_path.name} -d ~/.claude/skills/")
+        if self.archive_format == 'zip':
+            print(f"python3 scripts/install-skill.py {zip_path.name}")
+        else:
+            # install-skill.py and --verify read ZIP packages only
+            print(f"mkdir -p ~/.claude/skills && tar -xf {zip_path.name} -C ~/.claude/skills")
         print()
 
+def analysis_totals(estimates: List[SizeEstimate], budget: int) -> Dict:
+    """Raw and estimated archive size of a set of estimates, against a budget."""
+    raw = sum(e.size for e in estimates)
+    archive = sum(e.archived for e in estimates) + END_RECORD_SIZE
+    return {
+        "files": len(estimates),
+        "raw_bytes": raw,
+        "estimated_bytes": archive,
+        "budget_bytes": budget,
+        "within_budget": archive <= budget,
+    }
+
+def print_analysis(packager: "SkillPackager", estimates: List[SizeEstimate], totals: Dict):
+    """Print the --analyze report."""
+    print(colorize(f"\n=== Package Size Analysis: {packager.skill_path.name} ===\n", Colors.BOLD))
+    width = max([len(e.arcname) for e in estimates[:ANALYZE_TOP]] + [4])
+    print(f"  {'File':<{width}}  {'Raw':>10}  {'Estimated':>10}  Ratio")
+    for e in estimates[:ANALYZE_TOP]:
+        ratio = e.compressed / e.size if e.size else 1.0
+        marker = '' if e.exact else '~'
+        print(f"  {e.arcname:<{width}}  {e.size / 1024:>8.1f}KB  {marker + f'{e.compressed / 1024:.1f}':>8}KB  {ratio:5.0%}")
+    if len(estimates) > ANALYZE_TOP:
+        rest = estimates[ANALYZE_TOP:]
+        print(f"  ... {len(rest)} smaller files, {sum(e.size for e in rest) / 1024:.1f} KB raw")
+    if packager.excluded:
+        print(f"\n  {len(packager.excluded)} unreachable files excluded")
+
+    print(f"\nRaw size: {totals['raw_bytes'] / 1024:.1f} KB in {totals['files']} files")
+    print(f"Estimated package: {totals['estimated_bytes'] / 1024:.1f} KB "
+          f"(budget {totals['budget_bytes'] / 1024:.1f} KB)")
+    if totals["within_budget"]:
+        print(colorize("Within budget", Colors.GREEN))
+    else:
+        over = totals['estimated_bytes'] - totals['budget_bytes']
+        print(colorize(f"Over budget by {over / 1024:.1f} KB", Colors.RED))
+
+def print_verify_report(report):
+    """Print the result of --verify."""
+    print(colorize("\n=== Package Verification ===\n", Colors.BOLD))
+    print(f"Package: {report.zip_path}")
+    if report.name:
+        print(f"Skill: {report.name}")
+    print(f"Entries: {report.entries} ({report.bytes_checked / 1024:.1f} KB checked, "
+          f"{report.hashes_checked} manifest hashes)\n")
+
+    if report.ok:
+        print(colorize("Package is intact and matches its manifest", Colors.GREEN))
+        return
+    for issue in report.issues:
+        print(colorize(f"  - {issue}", Colors.RED))
+    print(colorize(f"\n{len(report.issues)} problem(s) found", Colors.RED))
+
 def main():
     parser = argparse.ArgumentParser(
         description="Package Claude Code skill for distribution"
     )
     parser.add_argument(
         "path",
-        help="Path to skill directory or SKILL.md file"
+        nargs="+",
+        help="Skill directories or SKILL.md files (or packages, with --verify)"
     )
     parser.add_argument(
         "-o", "--output",
-        help="Output directory for the package (default: skill parent directory)"
+        help="Output directory for the package (default: skill parent directory), or - for stdout"
+    )
+    parser.add_argument(
+        "--format",
+        choices=ARCHIVE_FORMATS,
+        default="zip",
+        help="Package format; tar formats compress the whole stream (default: zip)"
     )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Output result as JSON"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Threads compressing entries in parallel (default: CPU count)"
+    )
+    parser.add_argument(
+        "--store",
+        metavar="DIR",
+        help="Keep compressed file contents in DIR so later runs reuse them"
+    )
+    parser.add_argument(
+        "--artifacts",
+        metavar="DIR",
+        help="Write packages to the artifact cache DIR, reusing any built from an identical tree"
+    )
+    parser.add_argument(
+        "--artifacts-budget",
+        type=parse_size,
+        metavar="SIZE",
+        help="Byte budget of the artifact cache, e.g. 500MB; remembered for later runs (default: 1GB)"
+    )
+    parser.add_argument(
+        "--pin",
+        action="store_true",
+        help="Pin the packaged versions so the artifact cache never evicts them"
+    )
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="Rank files by size and estimate the package size without writing it"
+    )
+    parser.add_argument(
+        "--budget",
+        type=parse_size,
+        default=DEFAULT_BUDGET,
+        help="Package size budget for --analyze, e.g. 512K or 10MB (default: 10MB)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Check a package's CRCs, sizes and manifest hashes without extracting it"
+    )
+    parser.add_argument(
+        "--unreachable",
+        action="store_true",
+        help="Report references/ and scripts/ files SKILL.md never links to, without packaging"
+    )
+    parser.add_argument(
+        "--exclude-unreachable",
+        action="store_true",
+        help="Leave files SKILL.md cannot reach out of the package"
+    )
+    add_shard_arguments(parser)
+    add_metrics_argument(parser)
 
     args = parser.parse_args()
-
-    packager = SkillPackager(args.path, args.output)
-    zip_path = packager.package()
-
-    if args.json:
-        if zip_path:
-            output = {
-                "success": True,
-                "package_path": str(zip_path),
-                "size_bytes": zip_path.stat().st_size,
-                "skill_name": packager.frontmatter.get('name', packager.skill_path.name),
-                "version": packager.frontmatter.get('version', '1.0.0')
-            }
+    metrics = Metrics("package")
+    if args.shard:
+        if args.verify or args.analyze or args.unreachable:
+            parser.error("--shard applies to packaging, not --verify, --analyze or --unreachable")
+        if args.output == '-':
+            parser.error("--shard packages several skills and cannot write to stdout")
+        with metrics.phase("discover"):
+            args.path = shard_paths(args)
+        if not args.json:
+            print(f"Shard {args.shard}: {len(args.path)} skills")
+
+    # One output object for a single path, as before; a list for several
+    def emit(outputs):
+        print(json.dumps(outputs[0] if len(outputs) == 1 else outputs, indent=2))
+
+    if args.verify:
+        reports = [verify_zip(Path(path)) for path in args.path]
+        if args.json:
+            emit([report.to_dict() for report in reports])
         else:
-            output = {"success": False, "error": "Failed to create package"}
-        print(json.dumps(output, indent=2))
-    else:
+            for report in reports:
+                print_verify_report(report)
+        sys.exit(0 if all(report.ok for report in reports) else 1)
+
+    if args.format not in available_formats():
+        parser.error(f"--format {args.format} needs the zstd command or Python's compression.zstd module")
+    stream = None
+    if args.output == '-':
+        if len(args.path) > 1 or args.json:
+            parser.error("-o - writes one package to stdout and cannot be combined with several paths or --json")
+        stream = sys.stdout.buffer
+        args.output = None
+
+    artifacts = None
+    if args.artifacts:
+        if args.output:
+            parser.error("--artifacts writes packages into the cache directory and cannot be combined with -o")
+        artifacts = ArtifactCache(Path(args.artifacts), args.artifacts_budget)
+        args.output = args.artifacts
+    elif args.artifacts_budget is not None or args.pin:
+        parser.error("--artifacts-budget and --pin need --artifacts")
+
+    # Identical files across the skills of one run are compressed once
+    cache = DeflateCache(Path(args.store) / "deflate" if args.store else None)
+    packagers = [SkillPackager(path, args.output, args.exclude_unreachable, args.workers, cache,
+                               args.format, stream, metrics, artifacts)
+                 for path in args.path]
+
+    if args.analyze:
+        outputs = []
+        within = True
+        for packager in packagers:
+            if not packager.find_skill_file():
+                print(colorize(f"Error: SKILL.md not found in {packager.skill_path}", Colors.RED))
+                sys.exit(1)
+            # A broken frontmatter only costs the skill name in entry paths
+            packager.parse_frontmatter()
+            estimates = packager.analyze()
+            totals = analysis_totals(estimates, args.budget)
+            within = within and totals["within_budget"]
+            if args.json:
+                outputs.append({
+                    "skill_path": str(packager.skill_path),
+                    **totals,
+                    "excluded": [str(path.relative_to(packager.skill_path)) for path, _ in packager.excluded],
+                    "largest": [
+                        {"path": e.arcname, "size_bytes": e.size, "estimated_bytes": e.compressed, "exact": e.exact}
+                        for e in estimates
+                    ],
+                })
+            else:
+                print_analysis(packager, estimates, totals)
+        if args.json:
+            emit(outputs)
+        sys.exit(0 if within else 1)
+
+    if args.unreachable:
+        outputs = []
+        for packager in packagers:
+            if not packager.find_skill_file():
+                print(colorize(f"Error: SKILL.md not found in {packager.skill_path}", Colors.RED))
+                sys.exit(1)
+            unreachable = packager.find_unreachable()
+            if args.json:
+                outputs.append({
+                    "skill_path": str(packager.skill_path),
+                    "unreachable": [
+                        {"path": str(path.relative_to(packager.skill_path)), "size_bytes": size}
+                        for path, size in unreachable
+                    ],
+                    "unreachable_bytes": sum(size for _, size in unreachable),
+                })
+            else:
+                packager.print_unreachable(unreachable)
+        if args.json:
+            emit(outputs)
+        sys.exit(0)
+
+    def record_package(packager: SkillPackager, ok: bool):
+        metrics.add("skills_processed", result="passed" if ok else "failed")
+        if ok:
+            metrics.observe("package_size_bytes", packager.package_size, SIZE_BUCKETS, format=args.format)
+
+    outputs = []
+    all_ok = True
+    if stream is not None:
+        # stdout carries the package; progress goes to stderr
+        with redirect_stdout(sys.stderr):
+            all_ok = packagers[0].package() is not None
+        record_package(packagers[0], all_ok)
+        metrics.cache("deflate", cache)
+        metrics.write(args.metrics)
+        sys.exit(0 if all_ok else 1)
+    # Seconds per skill, for --record-costs
+    skill_costs: Dict[str, float] = {}
+    produced: List[Path] = []
+    for packager in packagers:
+        start = time.perf_counter()
+        # Keep stdout to the JSON report
+        with redirect_stdout(sys.stderr) if args.json else nullcontext():
+            zip_path = packager.package()
+        skill_costs[skill_key(packager.skill_path)] = time.perf_counter() - start
+        record_package(packager, zip_path is not None)
+        all_ok = all_ok and zip_path is not None
         if zip_path:
+            produced.append(zip_path)
+        if args.json:
+            if zip_path:
+                output = {
+                    "success": True,
+                    "package_path": str(zip_path),
+                    "format": args.format,
+                    "size_bytes": packager.package_size,
+                    "skill_name": as_text(packager.frontmatter.get('name', packager.skill_path.name)),
+                    "version": as_text(packager.frontmatter.get('version', '1.0.0')),
+                    "excluded": [str(path.relative_to(packager.skill_path)) for path, _ in packager.excluded]
+                }
+                if artifacts is not None:
+                    output["reused"] = packager.reused
+                outputs.append(output)
+            else:
+                outputs.append({"success": False, "skill_path": str(packager.skill_path),
+                                "error": "Failed to create package"})
+        elif zip_path:
             packager.print_summary(zip_path)
 
-    sys.exit(0 if zip_path else 1)
+    if args.record_costs:
+        record_costs(args.record_costs, skill_costs)
+    eviction = None
+    if artifacts is not None:
+        if args.pin:
+            artifacts.pin(f"{as_text(p.frontmatter.get('name', p.skill_path.name))}@"
+                          f"{as_text(p.frontmatter.get('version', '1.0.0'))}"
+                          for p in packagers if p.frontmatter)
+        # This run's packages stay even if they alone exceed the budget
+        eviction = artifacts.evict(keep=[path.name for path in produced])
+        metrics.cache("artifacts", artifacts)
+    metrics.cache("deflate", cache)
+    metrics.write(args.metrics)
+
+    if args.json and args.shard:
+        print(json.dumps({"packages": outputs, "shard": shard_info(args, len(packagers), all_ok)}, indent=2))
+    elif args.json:
+        emit(outputs)
+    elif len(packagers) > 1:
+        print(f"Compression cache: {cache.hits} reused, {cache.misses} compressed")
+    if eviction is not None and not args.json:
+        print(f"Artifact cache: {artifacts.hits} reused, {artifacts.misses} built, "
+              f"{len(eviction['removed'])} evicted, {eviction['bytes'] / 1024:.1f} KB of "
+              f"{eviction['budget'] / 1024:.1f} KB budget")
+
+    sys.exit(0 if all_ok else 1)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Route Skills - Offline routing simulation over a prompt corpus
+
+Matches every prompt in a corpus against the trigger phrases of every
+installed skill (see skill_routing.py) and reports which skills each
+prompt would activate, which prompts are ambiguous between skills, and
+which skills no prompt ever reaches.
+
+The prompts file has one prompt per line, or one JSON object per line
+with a "prompt" field (.jsonl/.ndjson). Use - to read from stdin.
+
+Usage:
+    python route-skills.py skills/ --prompts prompts.txt
+    python route-skills.py skills/ plugins/ --prompts prompts.jsonl --json
+    python route-skills.py skills/ --prompts prompts.txt --per-prompt matches.ndjson
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from skill_frontmatter import FrontmatterError, as_text, parse_frontmatter
+from skill_routing import RoutingIndex, route
+from skill_walk import find_skills
+
+DEFAULT_MIN_STRENGTH = 0.6
+DEFAULT_MARGIN = 0.1
+DEFAULT_TOP = 10
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+def load_skills(roots: List[str]) -> Tuple[List[Tuple[str, str]], List[Dict]]:
+    """(name, description) of every skill under roots, and the skills that could not be read."""
+    skills = []
+    errors = []
+    for skill_md in find_skills(roots):
+        try:
+            frontmatter, _ = parse_frontmatter(skill_md.read_text(encoding='utf-8'))
+        except (OSError, UnicodeDecodeError, FrontmatterError) as e:
+            errors.append({"skill_path": str(skill_md.parent), "error": str(e)})
+            continue
+        name = as_text(frontmatter.get('name')) or skill_md.parent.name
+        skills.append((name, as_text(frontmatter.get('description'))))
+    return skills, errors
+
+def read_prompts(path: str) -> Iterator[str]:
+    """Prompts from a text file (one per line) or JSON lines with a "prompt" field."""
+    as_json = path.endswith(('.jsonl', '.ndjson'))
+    stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            if as_json or line.startswith('{'):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    record = None
+                if isinstance(record, dict):
+                    line = as_text(record.get('prompt')).strip()
+                    if not line:
+                        continue
+            yield line
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def build_report(index: RoutingIndex, result: Dict, errors: List[Dict], top: int) -> Dict:
+    skills = index.skills
+    pairs = sorted(result["pairs"].items(), key=lambda item: (-item[1], skills[item[0][0]], skills[item[0][1]]))
+    return {
+        "skills": len(skills),
+        "prompts": result["prompts"],
+        "matched_prompts": result["prompts"] - len(result["unmatched"]),
+        "unmatched_prompts": len(result["unmatched"]),
+        "ambiguous_prompts": result["ambiguous"],
+        "never_matched": sorted(skills[i] for i, count in enumerate(result["matched"]) if not count),
+        "never_chosen": sorted(skills[i] for i, count in enumerate(result["won"])
+                               if not count and result["matched"][i]),
+        "ambiguous_pairs": [{"skills": [skills[a], skills[b]], "prompts": count}
+                            for (a, b), count in pairs[:top]],
+        "unmatched_examples": result["unmatched"][:top],
+        "per_skill": [{"name": name, "matched": result["matched"][i], "chosen": result["won"][i],
+                       "ambiguous": result["contested"][i]} for i, name in enumerate(skills)],
+        "errors": errors,
+    }
+
+def print_names(names: List[str], top: int):
+    for name in names[:top]:
+        print(f"  - {name}")
+    if len(names) > top:
+        print(f"  ... and {len(names) - top} more")
+
+def print_report(report: Dict, top: int, elapsed: float):
+    print(colorize("\n=== Skill Routing ===\n", Colors.BOLD))
+    prompts = report["prompts"]
+    print(f"Skills: {report['skills']}   Prompts: {prompts}   ({elapsed:.2f}s)")
+    if prompts:
+        print(f"Matched:   {report['matched_prompts']} ({report['matched_prompts'] / prompts:.0%})")
+        print(f"Ambiguous: {report['ambiguous_prompts']} ({report['ambiguous_prompts'] / prompts:.0%})")
+        print(f"Unmatched: {report['unmatched_prompts']} ({report['unmatched_prompts'] / prompts:.0%})")
+
+    if report["ambiguous_pairs"]:
+        print(colorize("\nMost ambiguous skill pairs:", Colors.YELLOW))
+        for pair in report["ambiguous_pairs"]:
+            print(f"  {pair['skills'][0]} / {pair['skills'][1]}: {pair['prompts']} prompts")
+    if report["never_matched"]:
+        print(colorize(f"\nNever matched ({len(report['never_matched'])}):", Colors.RED))
+        print_names(report["never_matched"], top)
+    if report["never_chosen"]:
+        print(colorize(f"\nMatched but never the top choice ({len(report['never_chosen'])}):", Colors.YELLOW))
+        print_names(report["never_chosen"], top)
+    if report["unmatched_examples"]:
+        print(colorize("\nUnmatched prompts (examples):", Colors.BLUE))
+        for prompt in report["unmatched_examples"]:
+            print(f"  - {prompt[:100]}")
+    for error in report["errors"]:
+        print(colorize(f"\nError: {error['skill_path']}: {error['error']}", Colors.RED))
+    print()
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simulate which skills a corpus of prompts would activate"
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Skill directories, SKILL.md files or directories containing skills"
+    )
+    parser.add_argument(
+        "--prompts",
+        required=True,
+        metavar="FILE",
+        help="Prompts, one per line or JSON lines with a \"prompt\" field (- for stdin)"
+    )
+    parser.add_argument(
+        "--min-strength",
+        type=float,
+        default=DEFAULT_MIN_STRENGTH,
+        help=f"Weakest match that counts, 0-1 (default: {DEFAULT_MIN_STRENGTH:g})"
+    )
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=DEFAULT_MARGIN,
+        help=f"A prompt is ambiguous when a second skill is within this of the best (default: {DEFAULT_MARGIN:g})"
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help=f"Pairs, skills and prompts to list in each section (default: {DEFAULT_TOP})"
+    )
+    parser.add_argument(
+        "--per-prompt",
+        metavar="FILE",
+        help="Write every prompt's matches to FILE as NDJSON (- for stdout)"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the report as JSON"
+    )
+
+    args = parser.parse_args()
+    if args.json and args.per_prompt == '-':
+        parser.error("--json and --per-prompt - both write to stdout")
+
+    start = time.perf_counter()
+    skills, errors = load_skills(args.paths)
+    if not skills:
+        print(colorize("Error: no skills found", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+    index = RoutingIndex.build(skills, args.min_strength)
+
+    out = None
+    on_prompt = None
+    if args.per_prompt:
+        out = sys.stdout if args.per_prompt == '-' else open(args.per_prompt, 'w', encoding='utf-8')
+
+        def on_prompt(prompt, matches):
+            out.write(json.dumps({
+                "prompt": prompt,
+                "matches": [{"skill": index.skills[m.skill], "strength": round(m.strength, 3),
+                             "phrase": m.phrase, "exact": m.exact} for m in matches],
+            }) + '\n')
+
+    try:
+        result = route(index, read_prompts(args.prompts), args.margin, on_prompt)
+    except OSError as e:
+        print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    report = build_report(index, result, errors, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif args.per_prompt != '-':
+        print_report(report, args.top, elapsed)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Skill Scaffolder - Render many skills from templates in one run
+
+Reads a JSON or CSV spec with one entry per skill, renders each entry's
+template (compiled once per run), writes the skill directories in parallel
+and validates every generated skill from the rendered text it already holds.
+
+Spec entries map placeholder names to values, plus two reserved keys:
+- template: template name under templates/ or a path (default: --template)
+- output:   directory to create, relative to --output (default: SKILL_NAME)
+
+JSON specs are a list of entries or {"defaults": {...}, "skills": [...]};
+CSV specs have one column per key. Keys are matched case-insensitively.
+
+Usage:
+    python scaffold-skills.py skills.json -o ./skills
+    python scaffold-skills.py skills.csv --template standard --json
+    python scaffold-skills.py --placeholders hook-enabled
+"""
+
+import os
+import sys
+import csv
+import json
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from skill_api import load_script
+from skill_template import TemplateError, available_templates, load_template
+
+RESERVED_KEYS = ('template', 'output')
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+def _as_value(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return '\n'.join(str(v) for v in value)
+    return str(value)
+
+def _normalise(entry: Dict, drop_empty: bool) -> Dict[str, str]:
+    normalised = {}
+    for key, value in entry.items():
+        if key is None:
+            continue
+        key = key.strip()
+        key = key.lower() if key.lower() in RESERVED_KEYS else key.upper()
+        value = _as_value(value)
+        if value is None or (drop_empty and value == ''):
+            continue
+        normalised[key] = value
+    return normalised
+
+def load_spec(path: Path) -> List[Dict[str, str]]:
+    """Read a JSON or CSV spec into a list of entries."""
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='', encoding='utf-8') as f:
+            # Empty cells leave the placeholder unfilled
+            return [_normalise(row, drop_empty=True) for row in csv.DictReader(f)]
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = data.get('defaults', {})
+        data = data.get('skills', [])
+    if not isinstance(data, list) or not all(isinstance(e, dict) for e in data):
+        raise ValueError("spec must be a list of objects or {\"skills\": [...]}")
+    return [_normalise({**defaults, **entry}, drop_empty=False) for entry in data]
+
+@dataclass
+class ScaffoldResult:
+    """Outcome of rendering, writing and validating one spec entry."""
+    index: int
+    template: str
+    path: Optional[Path] = None
+    missing: List[str] = field(default_factory=list)
+    written: bool = False
+    error: Optional[str] = None
+    validated: bool = False
+    passed: bool = False
+    failed_checks: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.written and not self.missing and (self.passed or not self.validated)
+
+    def to_dict(self) -> Dict:
+        output = {
+            "index": self.index,
+            "template": self.template,
+            "path": str(self.path) if self.path else None,
+            "written": self.written,
+            "unfilled": self.missing,
+        }
+        if self.error:
+            output["error"] = self.error
+        if self.validated:
+            output["all_passed"] = self.passed
+            output["failed_checks"] = self.failed_checks
+        return output
+
+class SkillScaffolder:
+    """Render spec entries through compiled templates and write them out."""
+
+    def __init__(self, output_dir: str, default_template: Optional[str] = None,
+                 force: bool = False, validate: bool = True, workers: int = 4):
+        self.output_dir = Path(output_dir).resolve()
+        self.default_template = default_template
+        self.force = force
+        self.workers = max(1, workers)
+        self.validator = load_script("validate-skill.py") if validate else None
+
+    def scaffold(self, entries: List[Dict[str, str]]) -> List[ScaffoldResult]:
+        """Render every entry, then write and validate them in parallel."""
+        jobs = []
+        results = []
+        targets = set()
+        for index, entry in enumerate(entries):
+            result = ScaffoldResult(index, entry.get('template') or self.default_template or '')
+            results.append(result)
+            if not result.template:
+                result.error = "no template given (set 'template' or --template)"
+                continue
+            try:
+                template = load_template(result.template)
+            except TemplateError as e:
+                result.error = str(e)
+                continue
+
+            directory = entry.get('output') or entry.get('SKILL_NAME')
+            if not directory:
+                result.error = "no 'output' or SKILL_NAME to name the skill directory"
+                continue
+            result.path = self.output_dir / directory
+            if result.path in targets:
+                result.error = f"duplicate output directory: {result.path}"
+                continue
+            targets.add(result.path)
+
+            text, result.missing = template.render(entry)
+            jobs.append((result, text))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            list(pool.map(lambda job: self._write_and_validate(*job), jobs))
+        return results
+
+    def _write_and_validate(self, result: ScaffoldResult, text: str):
+        skill_file = result.path / "SKILL.md"
+        try:
+            if skill_file.exists() and not self.force:
+                result.error = f"{skill_file} exists (use --force to overwrite)"
+                return
+            result.path.mkdir(parents=True, exist_ok=True)
+            with open(skill_file, 'w', encoding='utf-8') as f:
+                f.write(text)
+            result.written = True
+        except OSError as e:
+            result.error = str(e)
+            return
+
+        if self.validator is None:
+            return
+        # Hand the rendered text to the validator instead of re-reading the file
+        validator = self.validator.SkillValidator(str(result.path))
+        result.validated = True
+        if not validator.find_skill_file() or not validator.parse_frontmatter(text):
+            error = validator.parse_error
+            result.failed_checks = ["Initialization"]
+            result.error = f"could not parse SKILL.md: {error}" if error else "could not parse SKILL.md"
+            return
+        result.passed, checks = validator.run_checks()
+        result.failed_checks = [check.name for check in checks if not check.passed]
+
+def print_results(results: List[ScaffoldResult]):
+    print(colorize("\n=== Skill Scaffolding Report ===\n", Colors.BOLD))
+    for result in results:
+        label = str(result.path) if result.path else f"entry {result.index}"
+        if result.ok:
+            print(colorize(f"[OK]   {label}", Colors.GREEN) + f" ({result.template})")
+        else:
+            print(colorize(f"[FAIL] {label}", Colors.RED) + f" ({result.template})")
+        if result.error:
+            print(f"       - {result.error}")
+        if result.missing:
+            print(colorize(f"       - Unfilled: {', '.join(result.missing)}", Colors.YELLOW))
+        if result.validated and result.failed_checks and not result.error:
+            print(f"       - Failed checks: {', '.join(result.failed_checks)}")
+
+    written = sum(1 for r in results if r.written)
+    ok = sum(1 for r in results if r.ok)
+    print(colorize("\n=== Summary ===", Colors.BOLD))
+    color = Colors.GREEN if ok == len(results) else Colors.YELLOW
+    print(colorize(f"{written}/{len(results)} skills written, {ok} complete and valid", color))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render many skills from templates using a JSON or CSV spec"
+    )
+    parser.add_argument(
+        "spec",
+        nargs="?",
+        help="JSON or CSV file with one entry per skill"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=".",
+        help="Directory the skills are created under (default: current directory)"
+    )
+    parser.add_argument(
+        "-t", "--template",
+        help=f"Template for entries without one ({', '.join(available_templates())})"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Overwrite existing SKILL.md files"
+    )
+    parser.add_argument(
+        "--no-validate",
+        action="store_true",
+        help="Skip validating the generated skills"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="Parallel writers (default: min(8, CPU count))"
+    )
+    parser.add_argument(
+        "--placeholders",
+        metavar="TEMPLATE",
+        help="List the placeholders a template uses and exit"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON"
+    )
+
+    args = parser.parse_args()
+
+    if args.placeholders:
+        try:
+            template = load_template(args.placeholders)
+        except TemplateError as e:
+            print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            sys.exit(2)
+        if args.json:
+            print(json.dumps({"template": template.source, "placeholders": template.placeholders}, indent=2))
+        else:
+            print('\n'.join(template.placeholders))
+        sys.exit(0)
+
+    if not args.spec:
+        parser.error("a spec file is required unless --placeholders is given")
+
+    try:
+        entries = load_spec(Path(args.spec))
+    except (OSError, ValueError) as e:
+        print(colorize(f"Error: could not read spec: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+
+    scaffolder = SkillScaffolder(args.output, args.template, args.force,
+                                 not args.no_validate, args.workers)
+    results = scaffolder.scaffold(entries)
+    all_ok = all(r.ok for r in results)
+
+    if args.json:
+        print(json.dumps({
+            "all_ok": all_ok,
+            "skills": [r.to_dict() for r in results],
+        }, indent=2))
+    else:
+        print_results(results)
+
+    sys.exit(0 if all_ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -9,17 +9,32 @@ Scoring breakdown (100 points total):
 - Progressive Disclosure: 15 pts
 - Examples: 10 pts
 - Cross-Platform: 10 pts
+
+Each skill is measured once into a feature vector (skill_features.py) and
+scored by a rubric (skill_rubric.py); --rubric swaps in another one and
+--rescore applies it to every skill in a --feature-cache without reading
+any skill.
 """
 
-import os
 import sys
-import re
 import json
+import time
+import zipfile
 import argparse
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+from skill_frontmatter import FrontmatterError, parse_frontmatter
+from skill_features import FeatureCache, extract_features
+from skill_limits import (ResourceLimitExceeded, ResourceLimits, add_limit_arguments, check_content,
+                          check_file, limits_from_args, run_limited)
+from skill_metrics import SCORE_BUCKETS, Metrics, add_metrics_argument
+from skill_rubric import VECTORIZED, DEFAULT_RUBRIC, RubricError, load_rubric, score_features, score_matrix
+from skill_shard import add_shard_arguments, record_costs, shard_info, shard_paths, skill_key
+from skill_tree import DiskTree, SkillTree, ZipTree
+
 # ANSI colors
 class Colors:
     GREEN = '\033[92m'
@@ -51,544 +66,138 @@ class ScoreCategory:
 class SkillScorer:
     """Score Claude Code skills on quality metrics."""
 
-    def __init__(self, skill_path: str):
-        self.skill_path = Path(skill_path).resolve()
+    def __init__(self, skill_path: str, tree: Optional[SkillTree] = None, rubric: Optional[Dict] = None,
+                 feature_cache: Optional[FeatureCache] = None, limits: Optional[ResourceLimits] = None):
+        # A tree given up front (e.g. a MemoryTree) replaces the filesystem
+        self.tree = tree
+        self.skill_path = Path(skill_path) if tree is not None else Path(skill_path).resolve()
         self.skill_md_path = None
         self.content = ""
         self.frontmatter = {}
         self.body = ""
+        self.body_lower = ""
+        self.parse_error: Optional[FrontmatterError] = None
         self.categories: List[ScoreCategory] = []
+        self.rubric = rubric or DEFAULT_RUBRIC
+        self.feature_cache = feature_cache
+        self.features: Optional[Dict[str, float]] = None
+        self.limits = limits
 
     def find_skill_file(self) -> bool:
         """Locate the SKILL.md file."""
+        if self.tree is not None:
+            if self.tree.is_file("SKILL.md"):
+                self.skill_md_path = self.skill_path / "SKILL.md"
+            return self.skill_md_path is not None
+
         if self.skill_path.is_file() and self.skill_path.name == "SKILL.md":
             self.skill_md_path = self.skill_path
             self.skill_path = self.skill_path.parent
+        elif self.skill_path.is_file() and self.skill_path.suffix.lower() == ".zip":
+            # A packaged skill, read in place from the archive
+            try:
+                self.tree = ZipTree(self.skill_path)
+            except (OSError, zipfile.BadZipFile):
+                return False
+            if self.tree.is_file("SKILL.md"):
+                self.skill_md_path = self.skill_path / "SKILL.md"
+            return self.skill_md_path is not None
         elif self.skill_path.is_dir():
             skill_file = self.skill_path / "SKILL.md"
             if skill_file.exists():
                 self.skill_md_path = skill_file
+        if self.skill_md_path is not None:
+            self.tree = DiskTree(self.skill_path)
         return self.skill_md_path is not None
 
-    def parse_frontmatter(self) -> bool:
-        """Parse YAML frontmatter from SKILL.md."""
+    def read_skill_file(self) -> bool:
+        """Read SKILL.md into self.content.
+
+        Raises ResourceLimitExceeded if it is over self.limits.
+        """
+        if self.limits:
+            check_file(self.tree, "SKILL.md", self.limits)
         try:
-            with open(self.skill_md_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
+            self.content = self.tree.read_text("SKILL.md")
         except Exception:
             return False
-
-        if not self.content.startswith('---'):
-            self.body = self.content
-            return True
-
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
-            self.body = self.content
-            return True
-
-        frontmatter_text = parts[1].strip()
-        self.body = parts[2].strip()
-
-        # Simple YAML parsing
-        current_key = None
-        current_value = []
-        in_multiline = False
-
-        for line in frontmatter_text.split('\n'):
-            if not line.startswith(' ') and ':' in line:
-                if current_key and in_multiline:
-                    self.frontmatter[current_key] = '\n'.join(current_value)
-
-                key_part = line.split(':', 1)
-                current_key = key_part[0].strip()
-                value = key_part[1].strip() if len(key_part) > 1 else ""
-
-                if value == '|':
-                    in_multiline = True
-                    current_value = []
-                elif value.startswith('[') or value.startswith('{'):
-                    self.frontmatter[current_key] = value
-                    current_key = None
-                elif value:
-                    self.frontmatter[current_key] = value.strip('"\'')
-                    current_key = None
-                else:
-                    in_multiline = False
-                    current_value = []
-            elif current_key and in_multiline:
-                current_value.append(line.strip())
-
-        if current_key and in_multiline:
-            self.frontmatter[current_key] = '\n'.join(current_value)
-
+        if self.limits:
+            check_content(self.content, self.limits)
         return True
 
-    def score_structure(self) -> ScoreCategory:
-        """Score: Structure (15 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        # SKILL.md exists (5 points)
-        if self.skill_md_path and self.skill_md_path.exists():
-            points += 5
-            breakdown.append("+5: SKILL.md exists")
-        else:
-            breakdown.append("+0: SKILL.md missing")
-            recommendations.append("Create a SKILL.md file")
-
-        # references/ directory (4 points)
-        references_dir = self.skill_path / "references"
-        if references_dir.exists() and any(references_dir.iterdir()):
-            points += 4
-            breakdown.append("+4: references/ directory with content")
-        elif "references/" in self.content:
-            points += 2
-            breakdown.append("+2: references/ mentioned but directory missing")
-            recommendations.append("Create references/ directory")
-        else:
-            breakdown.append("+0: No references/ structure")
-            recommendations.append("Consider adding references/ for documentation")
-
-        # scripts/ directory (4 points)
-        scripts_dir = self.skill_path / "scripts"
-        if scripts_dir.exists() and any(scripts_dir.iterdir()):
-            # Check if scripts are executable
-            all_executable = True
-            for script in scripts_dir.glob('*'):
-                if script.suffix in ['.sh', '.py'] and not os.access(script, os.X_OK):
-                    all_executable = False
-
-            if all_executable:
-                points += 4
-                breakdown.append("+4: scripts/ with executable files")
-            else:
-                points += 3
-                breakdown.append("+3: scripts/ exists but some not executable")
-                recommendations.append("Make scripts executable: chmod +x scripts/*")
-        elif "scripts/" in self.content:
-            points += 1
-            breakdown.append("+1: scripts/ mentioned but directory missing")
-            recommendations.append("Create scripts/ directory")
-        else:
-            breakdown.append("+0: No scripts/ (may not be needed)")
-
-        # Clean directory structure (2 points)
-        unwanted = ['.DS_Store', 'Thumbs.db', '__pycache__', '.pyc']
-        has_unwanted = any((self.skill_path / u).exists() for u in unwanted)
-        if not has_unwanted:
-            points += 2
-            breakdown.append("+2: Clean directory (no junk files)")
-        else:
-            breakdown.append("+0: Contains unwanted files")
-            recommendations.append("Remove .DS_Store, __pycache__, etc.")
-
-        return ScoreCategory("Structure", 15, points, breakdown, recommendations)
-
-    def score_description(self) -> ScoreCategory:
-        """Score: Description (25 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        description = self.frontmatter.get('description', '')
-
-        # Has name field (3 points)
-        name = self.frontmatter.get('name', '')
-        if name and re.match(r'^[a-z0-9-]+$', name):
-            points += 3
-            breakdown.append("+3: Valid name field")
-        elif name:
-            points += 1
-            breakdown.append("+1: Name field exists but format incorrect")
-            recommendations.append("Use lowercase-with-dashes format for name")
-        else:
-            breakdown.append("+0: Missing name field")
-            recommendations.append("Add 'name' to frontmatter")
-
-        # Description length (5 points)
-        desc_len = len(description)
-        if desc_len >= 100:
-            points += 5
-            breakdown.append("+5: Description is comprehensive")
-        elif desc_len >= 50:
-            points += 3
-            breakdown.append("+3: Description is adequate")
-            recommendations.append("Expand description with more trigger phrases")
-        elif desc_len >= 20:
-            points += 1
-            breakdown.append("+1: Description is minimal")
-            recommendations.append("Add more detail and trigger phrases")
-        else:
-            breakdown.append("+0: Description too short")
-            recommendations.append("Write comprehensive description (100+ chars)")
-
-        # Trigger phrases (8 points)
-        trigger_patterns = [
-            r'[Tt]riggers?\s+for',
-            r'[Aa]ctivates?\s+(?:for|when)',
-            r'[Uu]se\s+when',
-            r'"[^"]+",?\s*"[^"]+"',  # Quoted phrases
-        ]
-        trigger_count = sum(1 for p in trigger_patterns if re.search(p, description))
-
-        if trigger_count >= 2:
-            points += 8
-            breakdown.append("+8: Multiple trigger patterns found")
-        elif trigger_count == 1:
-            points += 4
-            breakdown.append("+4: One trigger pattern found")
-            recommendations.append("Add more trigger phrases for better auto-detection")
-        else:
-            breakdown.append("+0: No trigger phrases")
-            recommendations.append("Add 'Triggers for: \"phrase1\", \"phrase2\"'")
-
-        # Specificity (5 points)
-        specific_indicators = ['when', 'for', 'to', 'that', 'which']
-        generic_words = ['help', 'assist', 'support', 'various', 'many', 'general']
-
-        specific_count = sum(1 for w in specific_indicators if w in description.lower())
-        generic_count = sum(1 for w in generic_words if w in description.lower())
-
-        specificity_score = specific_count - generic_count
-
-        if specificity_score >= 2:
-            points += 5
-            breakdown.append("+5: Description is specific")
-        elif specificity_score >= 0:
-            points += 3
-            breakdown.append("+3: Description moderately specific")
-            recommendations.append("Make description more specific")
-        else:
-            points += 1
-            breakdown.append("+1: Description is too generic")
-            recommendations.append("Avoid generic words like 'help', 'various'")
-
-        # Context field if needed (4 points)
-        has_context = 'context' in self.frontmatter
-        is_conversational = any(word in self.body.lower() for word in ['you are', 'your role', 'persona'])
-
-        if is_conversational and has_context:
-            points += 4
-            breakdown.append("+4: context:fork properly specified")
-        elif is_conversational and not has_context:
-            points += 1
-            breakdown.append("+1: Conversational skill but missing context:fork")
-            recommendations.append("Add 'context: fork' for conversational skills")
-        elif not is_conversational:
-            points += 4
-            breakdown.append("+4: Non-conversational (context not required)")
-
-        return ScoreCategory("Description", 25, points, breakdown, recommendations)
-
-    def score_content(self) -> ScoreCategory:
-        """Score: Content (25 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        # Headers/structure (6 points)
-        h1_count = len(re.findall(r'^#\s', self.body, re.MULTILINE))
-        h2_count = len(re.findall(r'^##\s', self.body, re.MULTILINE))
-        h3_count = len(re.findall(r'^###\s', self.body, re.MULTILINE))
-
-        total_headers = h1_count + h2_count + h3_count
-
-        if h1_count == 1 and h2_count >= 3:
-            points += 6
-            breakdown.append("+6: Well-structured with proper header hierarchy")
-        elif total_headers >= 4:
-            points += 4
-            breakdown.append("+4: Good header structure")
-        elif total_headers >= 2:
-            points += 2
-            breakdown.append("+2: Basic structure")
-            recommendations.append("Add more section headers")
-        else:
-            breakdown.append("+0: Poor structure")
-            recommendations.append("Add section headers (##, ###)")
-
-        # Code blocks (6 points)
-        code_blocks = re.findall(r'```(\w*)\n[\s\S]*?```', self.body)
-
-        if len(code_blocks) >= 4:
-            points += 6
-            breakdown.append("+6: Excellent code examples")
-        elif len(code_blocks) >= 2:
-            points += 4
-            breakdown.append("+4: Good code examples")
-        elif len(code_blocks) >= 1:
-            points += 2
-            breakdown.append("+2: Some code examples")
-            recommendations.append("Add more code examples")
-        else:
-            breakdown.append("+0: No code examples")
-            recommendations.append("Add code examples with ```language blocks")
-
-        # Imperative form (5 points)
-        passive_patterns = ['you should', 'you can', 'you will', 'you may', 'you need to']
-        imperative_patterns = ['run', 'create', 'add', 'use', 'check', 'verify', 'ensure']
-
-        passive_count = sum(len(re.findall(p, self.body.lower())) for p in passive_patterns)
-        imperative_count = sum(len(re.findall(rf'\b{p}\b', self.body.lower())) for p in imperative_patterns)
-
-        ratio = imperative_count / (passive_count + 1)
-
-        if ratio >= 3:
-            points += 5
-            breakdown.append("+5: Strong imperative form")
-        elif ratio >= 1.5:
-            points += 3
-            breakdown.append("+3: Good imperative form")
-            recommendations.append("Reduce passive voice")
-        elif ratio >= 0.5:
-            points += 1
-            breakdown.append("+1: Too much passive voice")
-            recommendations.append("Use imperative: 'Run tests' not 'You should run tests'")
-        else:
-            breakdown.append("+0: Mostly passive voice")
-            recommendations.append("Rewrite in imperative form")
-
-        # Tables for organization (4 points)
-        table_count = len(re.findall(r'^\|.*\|$', self.body, re.MULTILINE))
-
-        if table_count >= 6:
-            points += 4
-            breakdown.append("+4: Good use of tables")
-        elif table_count >= 2:
-            points += 2
-            breakdown.append("+2: Some table usage")
-        else:
-            breakdown.append("+0: No tables")
-            recommendations.append("Consider adding tables for structured info")
-
-        # Lists for steps (4 points)
-        bullet_count = len(re.findall(r'^[-*]\s', self.body, re.MULTILINE))
-        numbered_count = len(re.findall(r'^\d+\.\s', self.body, re.MULTILINE))
-
-        list_count = bullet_count + numbered_count
-
-        if list_count >= 8:
-            points += 4
-            breakdown.append("+4: Good use of lists")
-        elif list_count >= 4:
-            points += 2
-            breakdown.append("+2: Some list usage")
-        else:
-            breakdown.append("+0: Few lists")
-            recommendations.append("Use lists for steps and options")
-
-        return ScoreCategory("Content", 25, points, breakdown, recommendations)
-
-    def score_progressive_disclosure(self) -> ScoreCategory:
-        """Score: Progressive Disclosure (15 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        line_count = len(self.content.split('\n'))
-
-        # Main file length (8 points)
-        if line_count <= 200:
-            points += 8
-            breakdown.append("+8: Concise main file (<200 lines)")
-        elif line_count <= 350:
-            points += 6
-            breakdown.append("+6: Good main file length (<350 lines)")
-        elif line_count <= 500:
-            points += 4
-            breakdown.append("+4: Acceptable length (<500 lines)")
-        elif line_count <= 700:
-            points += 2
-            breakdown.append("+2: Main file is long")
-            recommendations.append("Move content to references/")
-        else:
-            breakdown.append(f"+0: Main file too long ({line_count} lines)")
-            recommendations.append("Significantly reduce SKILL.md size")
-
-        # References usage (5 points)
-        references_dir = self.skill_path / "references"
-        ref_mentions = len(re.findall(r'references/', self.content))
-
-        if references_dir.exists():
-            ref_files = list(references_dir.glob('*.md'))
-            if len(ref_files) >= 2 and ref_mentions >= 2:
-                points += 5
-                breakdown.append("+5: Good use of references/")
-            elif len(ref_files) >= 1:
-                points += 3
-                breakdown.append("+3: Some use of references/")
-            else:
-                points += 1
-                breakdown.append("+1: references/ exists but empty")
-                recommendations.append("Add documentation to references/")
-        elif line_count > 300:
-            breakdown.append("+0: Long file without references/")
-            recommendations.append("Create references/ folder for details")
-        else:
-            points += 3
-            breakdown.append("+3: Short file (references not required)")
-
-        # No duplicate content (2 points)
-        # Simple check: look for repeated paragraphs
-        paragraphs = [p.strip() for p in self.body.split('\n\n') if len(p.strip()) > 50]
-        unique_paragraphs = set(paragraphs)
-
-        if len(paragraphs) == len(unique_paragraphs):
-            points += 2
-            breakdown.append("+2: No duplicate content")
-        else:
-            breakdown.append("+0: Some duplicate content")
-            recommendations.append("Remove duplicate paragraphs")
-
-        return ScoreCategory("Progressive Disclosure", 15, points, breakdown, recommendations)
-
-    def score_examples(self) -> ScoreCategory:
-        """Score: Examples (10 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        # Count example sections
-        example_headers = len(re.findall(r'^#{1,3}\s*[Ee]xample', self.body, re.MULTILINE))
-        example_mentions = len(re.findall(r'\b[Ee]xample\s*\d*:', self.body))
-
-        total_examples = example_headers + example_mentions
-
-        # Number of examples (5 points)
-        if total_examples >= 3:
-            points += 5
-            breakdown.append("+5: Multiple examples provided")
-        elif total_examples >= 1:
-            points += 3
-            breakdown.append("+3: Some examples")
-            recommendations.append("Add more examples (aim for 3+)")
-        else:
-            breakdown.append("+0: No examples")
-            recommendations.append("Add example sections")
-
-        # Examples with expected output (3 points)
-        output_patterns = ['output', 'result', 'returns', 'produces', 'expected']
-        examples_with_output = sum(1 for p in output_patterns if p in self.body.lower())
-
-        if examples_with_output >= 2:
-            points += 3
-            breakdown.append("+3: Examples show expected outputs")
-        elif examples_with_output >= 1:
-            points += 1
-            breakdown.append("+1: Some examples show output")
-            recommendations.append("Add expected outputs to examples")
-        else:
-            breakdown.append("+0: Examples don't show outputs")
-            recommendations.append("Show expected output for each example")
-
-        # Realistic examples (2 points)
-        placeholder_patterns = ['foo', 'bar', 'baz', 'xxx', 'example.com', 'lorem']
-        placeholder_count = sum(len(re.findall(p, self.body.lower())) for p in placeholder_patterns)
-
-        if placeholder_count <= 1:
-            points += 2
-            breakdown.append("+2: Realistic examples")
-        elif placeholder_count <= 3:
-            points += 1
-            breakdown.append("+1: Some placeholder text in examples")
-            recommendations.append("Use realistic values instead of foo/bar")
-        else:
-            breakdown.append("+0: Too many placeholders")
-            recommendations.append("Replace foo/bar/example.com with realistic values")
-
-        return ScoreCategory("Examples", 10, points, breakdown, recommendations)
-
-    def score_cross_platform(self) -> ScoreCategory:
-        """Score: Cross-Platform (10 points)"""
-        points = 0.0
-        breakdown = []
-        recommendations = []
-
-        # agentskills.io fields (5 points)
-        agentskills_fields = {
-            'version': 1,
-            'platforms': 1.5,
-            'inputs': 1,
-            'outputs': 1,
-            'tags': 0.5,
-        }
+    def parse_frontmatter(self, content: Optional[str] = None) -> bool:
+        """Parse YAML frontmatter from SKILL.md (or from already-read content)."""
+        if content is not None:
+            self.content = content
+        elif not self.read_skill_file():
+            return False
 
-        field_points = 0
-        for field, pts in agentskills_fields.items():
-            if field in self.frontmatter:
-                field_points += pts
-
-        if field_points >= 4:
-            points += 5
-            breakdown.append("+5: Full agentskills.io compliance")
-        elif field_points >= 2:
-            points += field_points
-            breakdown.append(f"+{field_points}: Partial agentskills.io fields")
-            recommendations.append("Add more agentskills.io fields")
-        else:
-            breakdown.append("+0: No agentskills.io fields")
-            recommendations.append("Consider adding: version, platforms, tags")
+        try:
+            data, self.body = parse_frontmatter(self.content)
+        except FrontmatterError as e:
+            self.parse_error = e
+            return False
+        # Keys without a value are absent, as before
+        self.frontmatter = {k: v for k, v in data.items() if v is not None}
+        # Lowercased once; several checks search it case-insensitively
+        self.body_lower = self.body.lower()
+        return True
 
-        # manifest.json (3 points)
-        manifest_path = self.skill_path / "manifest.json"
-        if manifest_path.exists():
-            try:
-                with open(manifest_path) as f:
-                    manifest = json.load(f)
-                if 'name' in manifest and 'description' in manifest:
-                    points += 3
-                    breakdown.append("+3: Valid manifest.json")
-                else:
-                    points += 1
-                    breakdown.append("+1: manifest.json incomplete")
-                    recommendations.append("Add required fields to manifest.json")
-            except json.JSONDecodeError:
-                breakdown.append("+0: Invalid manifest.json")
-                recommendations.append("Fix manifest.json syntax")
-        else:
-            breakdown.append("+0: No manifest.json")
-            recommendations.append("Add manifest.json for registry listing")
-
-        # Platform-agnostic content (2 points)
-        claude_specific = ['claude code', 'claude-code', 'anthropic']
-        specific_count = sum(len(re.findall(p, self.body.lower())) for p in claude_specific)
-
-        if specific_count <= 2:
-            points += 2
-            breakdown.append("+2: Platform-agnostic content")
-        elif specific_count <= 5:
-            points += 1
-            breakdown.append("+1: Some Claude-specific references")
-            recommendations.append("Use platform-neutral language where possible")
-        else:
-            breakdown.append("+0: Heavy Claude-specific content")
-            recommendations.append("Make content more platform-agnostic")
+    def cached_features(self) -> bool:
+        """Take the features of an unchanged skill from the feature cache."""
+        if self.feature_cache is not None and self.tree.root is not None:
+            self.features = self.feature_cache.get(self.skill_path)
+        return self.features is not None
 
-        return ScoreCategory("Cross-Platform", 10, points, breakdown, recommendations)
+    def extract_features(self) -> Dict[str, float]:
+        """Measure the parsed skill (see skill_features.FEATURE_NAMES)."""
+        return extract_features(self.tree, self.content, self.frontmatter, self.body, self.body_lower)
 
     def calculate_score(self) -> Tuple[float, List[ScoreCategory]]:
         """Calculate total score."""
         if not self.find_skill_file():
             return 0, []
 
-        if not self.parse_frontmatter():
+        if not self.cached_features() and not self.parse_frontmatter():
             return 0, []
 
+        return self.score_categories()
+
+    def score_categories(self) -> Tuple[float, List[ScoreCategory]]:
+        """Score an already located and parsed (or cached) skill under the rubric."""
+        if self.features is None:
+            self.features = self.extract_features()
+            if self.feature_cache is not None and self.tree.root is not None:
+                self.feature_cache.put(self.skill_path, self.features)
+
+        total, results = score_features(self.features, self.rubric)
         self.categories = [
-            self.score_structure(),
-            self.score_description(),
-            self.score_content(),
-            self.score_progressive_disclosure(),
-            self.score_examples(),
-            self.score_cross_platform(),
+            ScoreCategory(r["name"], r["max"], r["earned"], r["breakdown"], r["recommendations"])
+            for r in results
         ]
-
-        total = sum(c.earned_points for c in self.categories)
         return total, self.categories
 
-    def get_grade(self, score: float) -> Tuple[str, str]:
+    def to_dict(self, score: float) -> Dict:
+        """Build the JSON report for this skill."""
+        return {
+            "skill_path": str(self.skill_path),
+            "score": round(score, 1),
+            "grade": self.get_grade(score)[0],
+            "categories": [
+                {
+                    "name": c.name,
+                    "earned": c.earned_points,
+                    "max": c.max_points,
+                    "percentage": round(c.percentage, 1),
+                    "breakdown": c.breakdown,
+                    "recommendations": c.recommendations
+                }
+                for c in self.categories
+            ]
+        }
+
+    @staticmethod
+    def get_grade(score: float) -> Tuple[str, str]:
         """Get letter grade and color."""
         if score >= 90:
             return 'A', Colors.GREEN
@@ -606,7 +215,8 @@ class SkillScorer:
         score, categories = self.calculate_score()
 
         if not categories:
-            print(colorize("Error: Could not analyze skill", Colors.RED))
+            detail = f": frontmatter error at {self.parse_error}" if self.parse_error else ""
+            print(colorize(f"Error: Could not analyze skill{detail}", Colors.RED))
             return False
 
         grade, grade_color = self.get_grade(score)
@@ -659,53 +269,281 @@ class SkillScorer:
 
         return score >= 80
 
+def rescore(cache: FeatureCache, rubric: Dict, rubric_name: str, as_json: bool) -> List[float]:
+    """Score every skill in the feature cache under a rubric, without reading any skill."""
+    paths, rows = cache.matrix()
+    start = time.perf_counter()
+    scores = score_matrix(rows, rubric)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    totals = scores["total"]
+    categories = [cat["name"] for cat in rubric["categories"]]
+
+    if as_json:
+        print(json.dumps({
+            "rubric": rubric_name,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "skills": [
+                {
+                    "skill_path": path,
+                    "score": round(totals[i], 1),
+                    "grade": SkillScorer.get_grade(totals[i])[0],
+                    "categories": {name: scores[name][i] for name in categories},
+                }
+                for i, path in enumerate(paths)
+            ],
+        }, indent=2))
+        return totals
+
+    print(colorize(f"\n=== Rescore: {rubric_name} ===\n", Colors.BOLD))
+    engine = "NumPy" if VECTORIZED else "pure Python"
+    print(f"Skills: {len(paths)} scored in {elapsed_ms:.1f} ms ({engine})")
+    if not paths:
+        print("The feature cache is empty; score some skills with --feature-cache first")
+        return totals
+    print(f"Mean score: {sum(totals) / len(totals):.1f}")
+    grades = {}
+    for total in totals:
+        grade = SkillScorer.get_grade(total)[0]
+        grades[grade] = grades.get(grade, 0) + 1
+    print("Grades: " + ", ".join(f"{g} {grades.get(g, 0)}" for g in "ABCDF"))
+    lowest = sorted(range(len(paths)), key=lambda i: (totals[i], paths[i]))[:5]
+    print(colorize("\nLowest scores:", Colors.BOLD))
+    for i in lowest:
+        print(f"  {totals[i]:5.1f}  {paths[i]}")
+    return totals
+
+def score_limited(scorer: SkillScorer, limits: ResourceLimits) -> float:
+    """scorer.calculate_score() under the resource limits; raises ResourceLimitExceeded.
+
+    Results are copied back onto the scorer, since with a memory limit
+    scoring runs in a forked process (which cannot fill the feature cache).
+    """
+    def run():
+        score, categories = scorer.calculate_score()
+        return score, categories, scorer.features, scorer.skill_path
+
+    score, scorer.categories, scorer.features, scorer.skill_path = run_limited(run, limits)
+    return score
+
+def record_score_metrics(metrics: Metrics, score: float, categories: List[ScoreCategory], min_score: float):
+    """Count a scored skill into the score histograms."""
+    if not categories:
+        metrics.add("skills_processed", result="error")
+        return
+    metrics.add("skills_processed", result="failed" if min_score and score < min_score else "passed")
+    metrics.observe("score", score, SCORE_BUCKETS)
+    for category in categories:
+        metrics.observe("score_category_percent", category.percentage, SCORE_BUCKETS, category=category.name)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Score Claude Code skill quality (0-100)"
     )
     parser.add_argument(
         "path",
-        help="Path to skill directory or SKILL.md file"
+        nargs="*",
+        help="Path to skill directory or SKILL.md file (with --ndjson: roots to search for skills)"
     )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Discover skills under the given paths and stream one JSON line per skill"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker threads per pipeline stage with --ndjson (default: 4)"
+    )
+    parser.add_argument(
+        "--changed",
+        metavar="REV_RANGE",
+        help="Only score skills under the given paths touched by a git revision range (e.g. main...HEAD)"
+    )
+    parser.add_argument(
+        "--rubric",
+        metavar="FILE",
+        help="Score with a JSON rubric instead of the default (see --dump-rubric)"
+    )
+    parser.add_argument(
+        "--dump-rubric",
+        action="store_true",
+        help="Print the default rubric as JSON and exit"
+    )
+    parser.add_argument(
+        "--feature-cache",
+        metavar="FILE",
+        help="Keep each skill's features in FILE and reuse them while the skill is unchanged"
+    )
+    parser.add_argument(
+        "--rescore",
+        action="store_true",
+        help="Score every skill in --feature-cache under --rubric without reading the skills"
+    )
     parser.add_argument(
         "--min-score",
         type=float,
         default=0,
         help="Exit with error if score is below this value"
     )
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_metrics_argument(parser)
 
     args = parser.parse_args()
+    limits = limits_from_args(parser, args)
+    metrics = Metrics("score")
+
+    if args.dump_rubric:
+        print(json.dumps(DEFAULT_RUBRIC, indent=2))
+        sys.exit(0)
+
+    rubric = DEFAULT_RUBRIC
+    if args.rubric:
+        try:
+            rubric = load_rubric(Path(args.rubric))
+        except RubricError as e:
+            print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            sys.exit(2)
+    cache = FeatureCache(Path(args.feature_cache)) if args.feature_cache else None
+
+    if args.rescore:
+        if cache is None:
+            parser.error("--rescore needs --feature-cache")
+        with metrics.phase("score"):
+            totals = rescore(cache, rubric, args.rubric or "default rubric", args.json)
+        for total in totals:
+            metrics.add("skills_processed", result="failed" if args.min_score and total < args.min_score else "passed")
+            metrics.observe("score", total, SCORE_BUCKETS)
+        metrics.write(args.metrics)
+        sys.exit(1 if args.min_score and any(t < args.min_score for t in totals) else 0)
+
+    batch = len(args.path) > 1
+    if args.changed:
+        from skill_git import GitError, changed_skills
+        try:
+            with metrics.phase("discover"):
+                args.path = [str(p) for p in changed_skills(args.changed, args.path or ["."])]
+        except GitError as e:
+            print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            sys.exit(2)
+        batch = True
+        if not args.path:
+            if args.json:
+                print(json.dumps({"skills": []}, indent=2))
+            elif not args.ndjson:
+                print(f"No skills changed in {args.changed}")
+            metrics.write(args.metrics)
+            sys.exit(0)
+    elif not args.path:
+        parser.error("a path is required unless --changed is given")
+    if args.shard:
+        with metrics.phase("discover"):
+            args.path = shard_paths(args)
+        batch = True
+        if not args.json and not args.ndjson:
+            print(f"Shard {args.shard}: {len(args.path)} skills")
+    # Seconds per skill, for --record-costs
+    skill_costs: Dict[str, float] = {}
+    costs_lock = threading.Lock()
+
+    if args.ndjson:
+        from skill_pipeline import StreamingPipeline, emit_ndjson
+
+        def read(path):
+            scorer = SkillScorer(str(path), rubric=rubric, feature_cache=cache, limits=limits)
+            if not scorer.find_skill_file():
+                raise OSError(f"could not read {path}")
+            if not scorer.cached_features() and not scorer.read_skill_file():
+                raise OSError(f"could not read {path}")
+            return scorer
+
+        def parse(scorer):
+            if scorer.features is None and not scorer.parse_frontmatter(scorer.content):
+                raise scorer.parse_error
+            return scorer
+
+        def check(scorer):
+            start = time.perf_counter()
+            score, categories = scorer.score_categories()
+            with costs_lock:
+                skill_costs[skill_key(scorer.skill_path)] = time.perf_counter() - start
+            record_score_metrics(metrics, score, categories, args.min_score)
+            return scorer.to_dict(score)
+
+        below_minimum = 0
+
+        def on_record(record):
+            nonlocal below_minimum
+            if "error" in record:
+                metrics.add("skills_processed", result="error")
+            if "error" in record or (args.min_score and record["score"] < args.min_score):
+                below_minimum += 1
+
+        pipeline = StreamingPipeline(read, parse, check, workers=args.workers, limits=limits)
+        with metrics.phase("score"):
+            emit_ndjson(pipeline.run(args.path), on_record=on_record)
+            if args.shard:
+                # Trailer for merge-reports.py; a stream cut short has none
+                emit_ndjson([{"tool": "score", "shard": shard_info(args, len(args.path), not below_minimum)}])
+        with metrics.phase("save"):
+            if cache is not None:
+                cache.save()
+            if args.record_costs:
+                record_costs(args.record_costs, skill_costs)
+        metrics.cache("features", cache)
+        metrics.write(args.metrics)
+        sys.exit(1 if below_minimum else 0)
+
+    reports = []
+    below_minimum = 0
+
+    with metrics.phase("score"):
+        for path in args.path:
+            scorer = SkillScorer(path, rubric=rubric, feature_cache=cache, limits=limits)
+            start = time.perf_counter()
+            try:
+                score = score_limited(scorer, limits)
+            except ResourceLimitExceeded as e:
+                below_minimum += 1
+                metrics.add("skills_processed", result="error")
+                if args.json:
+                    reports.append(e.to_dict(scorer.skill_path))
+                else:
+                    print(colorize(f"[LIMIT] {scorer.skill_path}: {e}", Colors.RED))
+                continue
+            finally:
+                skill_costs[skill_key(scorer.skill_path)] = time.perf_counter() - start
+            record_score_metrics(metrics, score, scorer.categories, args.min_score)
+
+            if args.json:
+                reports.append(scorer.to_dict(score))
+            else:
+                scorer.print_results()
 
-    scorer = SkillScorer(args.path)
-    score, categories = scorer.calculate_score()
+            if args.min_score and score < args.min_score:
+                below_minimum += 1
+
+    with metrics.phase("save"):
+        if cache is not None:
+            cache.save()
+        if args.record_costs:
+            record_costs(args.record_costs, skill_costs)
+    metrics.cache("features", cache)
+    metrics.write(args.metrics)
 
     if args.json:
-        output = {
-            "skill_path": str(scorer.skill_path),
-            "score": round(score, 1),
-            "grade": scorer.get_grade(score)[0],
-            "categories": [
-                {
-                    "name": c.name,
-                    "earned": c.earned_points,
-                    "max": c.max_points,
-                    "percentage": round(c.percentage, 1),
-                    "breakdown": c.breakdown,
-                    "recommendations": c.recommendations
-                }
-                for c in categories
-            ]
-        }
+        output = {"skills": reports} if batch else reports[0]
+        if args.shard:
+            output["shard"] = shard_info(args, len(args.path), not below_minimum)
         print(json.dumps(output, indent=2))
-    else:
-        scorer.print_results()
 
-    if args.min_score and score < args.min_score:
+    if below_minimum:
         sys.exit(1)
 
     sys.exit(0)
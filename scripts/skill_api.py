@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Skill API - Validate and score skill content in memory
+
+Importable entry points for services that check drafts without writing
+them to disk. Skill content and an optional virtual file listing go in,
+JSON-ready dicts come out; nothing is printed and nothing is read from
+the filesystem. Every call builds its own validator and scorer, so the
+functions are safe to call from many threads at once.
+
+    from skill_api import review_content
+
+    report = review_content(draft, {"references/guide.md": guide})
+    report["validation"]["all_passed"], report["score"]["score"]
+
+The same checks as validate-skill.py and score-skill.py run, through a
+MemoryTree instead of the skill directory.
+"""
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, Iterable, Optional, Union
+
+from skill_tree import MemoryTree, SkillTree
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+def load_script(filename: str) -> ModuleType:
+    """Import a hyphenated script such as validate-skill.py as a module."""
+    name = filename[:-3].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Loaded once at import, before any worker thread can race on it
+_validate_skill = load_script("validate-skill.py")
+_score_skill = load_script("score-skill.py")
+
+Files = Optional[Dict[str, Union[str, bytes]]]
+
+def make_tree(content: str, files: Files = None, name: str = "skill",
+              executable: Iterable[str] = ()) -> MemoryTree:
+    """Build a MemoryTree from SKILL.md content and other files by relative path."""
+    return MemoryTree.from_content(content, files, name=name, executable=executable)
+
+def _validator(tree: SkillTree):
+    return _validate_skill.SkillValidator(tree.name, tree=tree)
+
+def _scorer(tree: SkillTree):
+    return _score_skill.SkillScorer(tree.name, tree=tree)
+
+def _score_error(scorer, message: str) -> Dict:
+    return {"skill_path": str(scorer.skill_path), "score": 0, "grade": "F",
+            "categories": [], "error": message}
+
+def validate_tree(tree: SkillTree, fail_fast: bool = False) -> Dict:
+    """Run the 7-point validation over a tree; returns validate-skill.py's JSON report."""
+    validator = _validator(tree)
+    all_passed, _ = validator.validate(fail_fast=fail_fast)
+    return validator.to_dict(all_passed)
+
+def score_tree(tree: SkillTree) -> Dict:
+    """Score a tree; returns score-skill.py's JSON report."""
+    scorer = _scorer(tree)
+    score, categories = scorer.calculate_score()
+    if not categories:
+        error = scorer.parse_error
+        return _score_error(scorer, f"frontmatter error at {error}" if error else "SKILL.md not found")
+    return scorer.to_dict(score)
+
+def review_tree(tree: SkillTree, fail_fast: bool = False) -> Dict:
+    """Validate and score a tree, parsing SKILL.md once for both."""
+    validator = _validator(tree)
+    all_passed, _ = validator.validate(fail_fast=fail_fast)
+    report = {"validation": validator.to_dict(all_passed)}
+
+    scorer = _scorer(tree)
+    if validator.skill_md_path is None or validator.parse_error is not None:
+        error = validator.parse_error
+        report["score"] = _score_error(scorer, f"frontmatter error at {error}" if error else "SKILL.md not found")
+        return report
+    scorer.skill_md_path = validator.skill_md_path
+    scorer.content = validator.content
+    scorer.frontmatter = validator.frontmatter
+    scorer.body = validator.body
+    scorer.body_lower = validator.body_lower
+    score, _ = scorer.score_categories()
+    report["score"] = scorer.to_dict(score)
+    return report
+
+def validate_content(content: str, files: Files = None, name: str = "skill",
+                     executable: Iterable[str] = (), fail_fast: bool = False) -> Dict:
+    """Validate SKILL.md content plus optional {relative path: content} files."""
+    return validate_tree(make_tree(content, files, name, executable), fail_fast)
+
+def score_content(content: str, files: Files = None, name: str = "skill",
+                  executable: Iterable[str] = ()) -> Dict:
+    """Score SKILL.md content plus optional {relative path: content} files."""
+    return score_tree(make_tree(content, files, name, executable))
+
+def review_content(content: str, files: Files = None, name: str = "skill",
+                   executable: Iterable[str] = (), fail_fast: bool = False) -> Dict:
+    """Validate and score SKILL.md content: {"validation": ..., "score": ...}."""
+    return review_tree(make_tree(content, files, name, executable), fail_fast)
@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+"""
+Skill Archive - Parallel ZIP writing for skill packages
+
+zipfile compresses entries one after another on one core. Here each entry
+is read and deflated on a thread pool (zlib releases the GIL), producing
+raw deflate streams that are then written to the archive strictly in the
+order given. The output is a standard ZIP (with ZIP64 records only when
+sizes or counts need them) that unzip and zipfile read as usual.
+
+In-flight work is bounded by bytes, so a large skill never needs more
+than roughly max_pending_bytes of file data in memory at once. A single
+file larger than that is deflated in chunks into a temporary file.
+
+TarStreamWriter writes the same entries, in the same order and with the
+same timestamps and modes, as a compressed tar stream (tar.gz, tar.xz,
+or tar.zst where zstd is available). The whole stream is compressed as
+one, which suits many small markdown files better than per-entry
+deflate. Neither writer ever seeks, so both can write to a pipe.
+"""
+
+import io
+import os
+import gzip
+import json
+import lzma
+import time
+import zlib
+import shutil
+import calendar
+import tempfile
+import struct
+import hashlib
+import tarfile
+import zipfile
+import threading
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Iterable, List, Optional, Tuple, Union
+
+try:
+    from compression import zstd  # Python 3.14+
+except ImportError:
+    zstd = None
+
+from skill_store import DeflateCache
+
+DEFAULT_LEVEL = 6
+DEFAULT_PENDING_BYTES = 256 * 1024 * 1024
+ZIP_CHUNK = 1024 * 1024
+
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP_COUNT_LIMIT = 0xFFFF
+# Version needed: 2.0 for deflate, 4.5 for ZIP64; made by UNIX so modes survive
+VERSION_DEFLATE = 20
+VERSION_ZIP64 = 45
+MADE_BY_UNIX = 3 << 8
+FLAG_UTF8 = 0x800
+
+TAR_FORMATS = ('tar.gz', 'tar.xz', 'tar.zst')
+ARCHIVE_FORMATS = ('zip',) + TAR_FORMATS
+# Whole-stream compression levels: best ratio short of xz's memory-hungry presets
+TAR_LEVELS = {'tar.gz': 9, 'tar.xz': 6, 'tar.zst': 19}
+TAR_CHUNK = 1024 * 1024
+
+def source_date_epoch() -> Optional[int]:
+    """SOURCE_DATE_EPOCH from the environment, if set to an integer."""
+    try:
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    except (KeyError, ValueError):
+        return None
+
+def entry_time(timestamp: float, utc: bool = False) -> Tuple[int, int, int, int, int, int]:
+    """ZIP date_time of a timestamp, clamped to the years a ZIP can record."""
+    date_time = (time.gmtime if utc else time.localtime)(timestamp)[0:6]
+    if date_time[0] < 1980:
+        return (1980, 1, 1, 0, 0, 0)
+    if date_time[0] > 2107:
+        return (2107, 12, 31, 23, 59, 59)
+    return date_time
+
+@dataclass
+class ArchiveEntry:
+    """One file to archive, from disk (path) or generated in memory (data)."""
+    arcname: str
+    path: Optional[Path] = None
+    data: Optional[bytes] = None
+    date_time: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0)
+    mode: int = 0o100644
+    # date_time is UTC rather than local time
+    utc: bool = False
+
+    @classmethod
+    def from_file(cls, path: Path, arcname: str, clamp: Optional[int] = None) -> "ArchiveEntry":
+        """Entry carrying the file's mtime and permission bits, as zipfile.write does.
+
+        With clamp (SOURCE_DATE_EPOCH), later mtimes are clamped to it and
+        times are taken in UTC, so the entry does not depend on the time zone.
+        """
+        st = os.stat(path)
+        if clamp is None:
+            date_time = entry_time(st.st_mtime)
+        else:
+            date_time = entry_time(min(st.st_mtime, clamp), utc=True)
+        return cls(arcname, path=Path(path), date_time=date_time, mode=st.st_mode & 0xFFFF, utc=clamp is not None)
+
+    @classmethod
+    def from_bytes(cls, arcname: str, data: bytes, timestamp: Optional[float] = None,
+                   utc: bool = False) -> "ArchiveEntry":
+        """Generated entry stamped with timestamp, or the current time as zipfile.writestr does."""
+        return cls(arcname, data=data, date_time=entry_time(time.time() if timestamp is None else timestamp, utc), utc=utc)
+
+    def size_hint(self) -> int:
+        if self.data is not None:
+            return len(self.data)
+        try:
+            return os.stat(self.path).st_size
+        except OSError:
+            return 0
+
+@dataclass
+class CompressedEntry:
+    """An entry's payload ready to be copied into the archive.
+
+    payload is the bytes themselves, or for a streamed entry an open file
+    positioned at its first byte.
+    """
+    entry: ArchiveEntry
+    crc: int
+    file_size: int
+    compress_size: int
+    method: int
+    payload: Union[bytes, BinaryIO]
+    sha256: str = ""
+    offset: int = 0
+
+def compress_entry(entry: ArchiveEntry, level: int = DEFAULT_LEVEL,
+                   cache: Optional[DeflateCache] = None,
+                   max_bytes: Optional[int] = None) -> CompressedEntry:
+    """Read and deflate one entry; stores it instead when deflate does not help.
+
+    With a cache, content already compressed (same SHA-256) is reused
+    instead of being deflated again. A file larger than max_bytes is
+    streamed instead (see compress_streamed) and bypasses the cache.
+    """
+    if entry.data is None and max_bytes is not None and entry.size_hint() > max_bytes:
+        return compress_streamed(entry, level)
+    if entry.data is not None:
+        data = entry.data
+    else:
+        with open(entry.path, 'rb') as f:
+            data = f.read()
+    crc = zlib.crc32(data)
+    digest = hashlib.sha256(data).hexdigest()
+    cached = cache.get(digest, level) if cache is not None else None
+    if cached is not None:
+        method, payload = cached
+        if method == zipfile.ZIP_STORED:
+            payload = data
+        return CompressedEntry(entry, crc, len(data), len(payload), method, payload, digest)
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    if len(payload) >= len(data):
+        if cache is not None:
+            cache.put(digest, level, zipfile.ZIP_STORED, b'')
+        return CompressedEntry(entry, crc, len(data), len(data), zipfile.ZIP_STORED, data, digest)
+    if cache is not None:
+        cache.put(digest, level, zipfile.ZIP_DEFLATED, payload)
+    return CompressedEntry(entry, crc, len(data), len(payload), zipfile.ZIP_DEFLATED, payload, digest)
+
+def compress_streamed(entry: ArchiveEntry, level: int = DEFAULT_LEVEL) -> CompressedEntry:
+    """Deflate a file entry in chunks into a temporary file, never holding it in memory.
+
+    When deflate does not help, the payload is the source file itself,
+    reopened at its start.
+    """
+    crc = 0
+    digest = hashlib.sha256()
+    file_size = 0
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    spool = tempfile.TemporaryFile()
+    try:
+        with open(entry.path, 'rb') as f:
+            for chunk in iter(lambda: f.read(ZIP_CHUNK), b''):
+                crc = zlib.crc32(chunk, crc)
+                digest.update(chunk)
+                file_size += len(chunk)
+                spool.write(compressor.compress(chunk))
+        spool.write(compressor.flush())
+        compress_size = spool.tell()
+        if compress_size >= file_size:
+            spool.close()
+            return CompressedEntry(entry, crc, file_size, file_size, zipfile.ZIP_STORED,
+                                   open(entry.path, 'rb'), digest.hexdigest())
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return CompressedEntry(entry, crc, file_size, compress_size, zipfile.ZIP_DEFLATED,
+                           spool, digest.hexdigest())
+
+def _dos_time(date_time) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    return ((year - 1980) << 9 | month << 5 | day,
+            hour << 11 | minute << 5 | second // 2)
+
+class ParallelZipWriter:
+    """Write a ZIP whose entries are compressed concurrently.
+
+    Entries are submitted in order; at most max_pending_bytes of entry data
+    is queued or compressing at once, and results are written as soon as
+    every earlier entry has been written, so the byte layout is identical
+    for any worker count. A DeflateCache shared between writers lets
+    identical files in different packages be compressed once.
+    """
+
+    def __init__(self, fp: BinaryIO, workers: Optional[int] = None, level: int = DEFAULT_LEVEL,
+                 max_pending_bytes: int = DEFAULT_PENDING_BYTES, cache: Optional[DeflateCache] = None):
+        self.fp = fp
+        self.cache = cache
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.level = level
+        self.max_pending_bytes = max_pending_bytes
+        self.written: List[CompressedEntry] = []
+        self.offset = 0
+
+    def write_entries(self, entries: Iterable[ArchiveEntry]) -> List[CompressedEntry]:
+        """Compress and append entries in order; returns what was written."""
+        pending = deque()
+        pending_bytes = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for entry in entries:
+                size = entry.size_hint()
+                while pending and pending_bytes + size > self.max_pending_bytes:
+                    future, done_size = pending.popleft()
+                    self._write_local(future.result())
+                    pending_bytes -= done_size
+                pending.append((pool.submit(compress_entry, entry, self.level, self.cache,
+                                            self.max_pending_bytes), size))
+                pending_bytes += size
+            while pending:
+                future, _ = pending.popleft()
+                self._write_local(future.result())
+        return self.written
+
+    def _write_local(self, item: CompressedEntry):
+        name = item.entry.arcname.encode('utf-8')
+        date, dostime = _dos_time(item.entry.date_time)
+        zip64 = item.file_size > ZIP64_LIMIT or item.compress_size > ZIP64_LIMIT
+        extra = b''
+        if zip64:
+            extra = struct.pack('<HHQQ', 0x0001, 16, item.file_size, item.compress_size)
+        header = struct.pack(
+            '<IHHHHHIIIHH', 0x04034b50,
+            VERSION_ZIP64 if zip64 else VERSION_DEFLATE, FLAG_UTF8, item.method,
+            dostime, date, item.crc,
+            ZIP64_LIMIT if zip64 else item.compress_size,
+            ZIP64_LIMIT if zip64 else item.file_size,
+            len(name), len(extra),
+        )
+        item.offset = self.offset
+        self.fp.write(header + name + extra)
+        if isinstance(item.payload, bytes):
+            self.fp.write(item.payload)
+        else:
+            self._copy_payload(item)
+        self.offset += len(header) + len(name) + len(extra) + item.compress_size
+        # The payload is no longer needed once it is on disk
+        item.payload = b''
+        self.written.append(item)
+
+    def _copy_payload(self, item: CompressedEntry):
+        # Exactly compress_size bytes: a source file that grew since it was read must not leak in
+        with item.payload as f:
+            remaining = item.compress_size
+            while remaining:
+                chunk = f.read(min(ZIP_CHUNK, remaining))
+                if not chunk:
+                    raise OSError(f"{item.entry.path} changed while it was being archived")
+                self.fp.write(chunk)
+                remaining -= len(chunk)
+
+    def close(self):
+        """Write the central directory and end records."""
+        start = self.offset
+        for item in self.written:
+            name = item.entry.arcname.encode('utf-8')
+            date, dostime = _dos_time(item.entry.date_time)
+            fields = []
+            file_size, compress_size, offset = item.file_size, item.compress_size, item.offset
+            if file_size > ZIP64_LIMIT:
+                fields.append(file_size)
+                file_size = ZIP64_LIMIT
+            if compress_size > ZIP64_LIMIT:
+                fields.append(compress_size)
+                compress_size = ZIP64_LIMIT
+            if offset > ZIP64_LIMIT:
+                fields.append(offset)
+                offset = ZIP64_LIMIT
+            extra = struct.pack('<HH' + 'Q' * len(fields), 0x0001, 8 * len(fields), *fields) if fields else b''
+            version = VERSION_ZIP64 if fields else VERSION_DEFLATE
+            record = struct.pack(
+                '<IHHHHHHIIIHHHHHII', 0x02014b50,
+                MADE_BY_UNIX | version, version, FLAG_UTF8, item.method,
+                dostime, date, item.crc, compress_size, file_size,
+                len(name), len(extra), 0, 0, 0,
+                (item.entry.mode & 0xFFFF) << 16, offset,
+            )
+            self.fp.write(record + name + extra)
+            self.offset += len(record) + len(name) + len(extra)
+
+        size = self.offset - start
+        count = len(self.written)
+        if count > ZIP_COUNT_LIMIT or size > ZIP64_LIMIT or start > ZIP64_LIMIT:
+            end64 = self.offset
+            self.fp.write(struct.pack('<IQHHIIQQQQ', 0x06064b50, 44, MADE_BY_UNIX | VERSION_ZIP64,
+                                      VERSION_ZIP64, 0, 0, count, count, size, start))
+            self.fp.write(struct.pack('<IIQI', 0x07064b50, 0, end64, 1))
+            count, size, start = min(count, ZIP_COUNT_LIMIT), min(size, ZIP64_LIMIT), min(start, ZIP64_LIMIT)
+        self.fp.write(struct.pack('<IHHHHIIH', 0x06054b50, 0, 0, count, count, size, start, 0))
+
+def write_zip(zip_path: Path, entries: Iterable[ArchiveEntry], workers: Optional[int] = None,
+              level: int = DEFAULT_LEVEL) -> List[CompressedEntry]:
+    """Create zip_path from entries, compressing them in parallel."""
+    with open(zip_path, 'wb') as f:
+        writer = ParallelZipWriter(f, workers, level)
+        written = writer.write_entries(entries)
+        writer.close()
+    return written
+
+def zstd_command() -> Optional[str]:
+    """The zstd binary used for tar.zst when the zstd module is unavailable."""
+    return shutil.which('zstd')
+
+def available_formats() -> Tuple[str, ...]:
+    """Archive formats this host can write."""
+    if zstd is None and zstd_command() is None:
+        return tuple(fmt for fmt in ARCHIVE_FORMATS if fmt != 'tar.zst')
+    return ARCHIVE_FORMATS
+
+def _dos_mtime(date_time, utc: bool = False) -> int:
+    """Epoch seconds of a local (or UTC) date_time, at the 2-second resolution the ZIP records."""
+    year, month, day, hour, minute, second = date_time
+    fields = (year, month, day, hour, minute, second - second % 2, 0, 0, -1)
+    return calendar.timegm(fields) if utc else int(time.mktime(fields))
+
+@dataclass
+class StreamedEntry:
+    """An entry written to a tar stream."""
+    entry: ArchiveEntry
+    file_size: int
+    sha256: str
+
+class CountingWriter:
+    """File-like wrapper counting the bytes written through it (pipes have no size)."""
+
+    def __init__(self, fp: BinaryIO):
+        self.fp = fp
+        self.count = 0
+
+    def write(self, data) -> int:
+        self.fp.write(data)
+        self.count += len(data)
+        return len(data)
+
+    def flush(self):
+        self.fp.flush()
+
+class _HashingReader:
+    """File-like wrapper hashing what tarfile reads through it."""
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.f.read(size)
+        self.hash.update(data)
+        return data
+
+class TarStreamWriter:
+    """Write a compressed tar stream of entries, in order, without seeking.
+
+    Entries carry the same order, modification times (at ZIP resolution)
+    and permission bits as ParallelZipWriter would give them, with owner
+    and group cleared, so the archive depends only on the skill. For
+    tar.zst the zstd module is used when Python has it, otherwise the
+    zstd binary compresses the stream through a pipe.
+    """
+
+    def __init__(self, fp: BinaryIO, fmt: str, level: Optional[int] = None):
+        if fmt not in TAR_FORMATS:
+            raise ValueError(f"not a tar format: {fmt}")
+        self.fp = fp
+        self.written: List[StreamedEntry] = []
+        self._process = None
+        self._pump = None
+        self._pump_error: Optional[BaseException] = None
+        level = TAR_LEVELS[fmt] if level is None else level
+        if fmt == 'tar.gz':
+            # mtime=0 and no file name keep the gzip header reproducible
+            self._stream = gzip.GzipFile(filename='', mode='wb', compresslevel=level, fileobj=fp, mtime=0)
+        elif fmt == 'tar.xz':
+            self._stream = lzma.LZMAFile(fp, 'wb', preset=level)
+        elif zstd is not None:
+            self._stream = zstd.ZstdFile(fp, 'wb', level=level)
+        else:
+            command = zstd_command()
+            if command is None:
+                raise OSError("tar.zst needs the zstd command or Python's compression.zstd module")
+            self._process = subprocess.Popen([command, '-q', '-c', f'-{level}'],
+                                             stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._pump = threading.Thread(target=self._copy_output, daemon=True)
+            self._pump.start()
+            self._stream = self._process.stdin
+        self.tar = tarfile.open(fileobj=self._stream, mode='w|', format=tarfile.PAX_FORMAT)
+
+    def _copy_output(self):
+        try:
+            for chunk in iter(lambda: self._process.stdout.read(TAR_CHUNK), b''):
+                self.fp.write(chunk)
+        except BaseException as e:
+            self._pump_error = e
+            # Unblock the writer side; close() reports the error
+            self._process.kill()
+
+    def _member(self, entry: ArchiveEntry, size: int) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(entry.arcname)
+        info.size = size
+        info.mtime = _dos_mtime(entry.date_time, entry.utc)
+        info.mode = entry.mode & 0o7777
+        info.uid = info.gid = 0
+        info.uname = info.gname = ''
+        return info
+
+    def write_entries(self, entries: Iterable[ArchiveEntry]) -> List[StreamedEntry]:
+        """Append entries in order; returns what was written."""
+        for entry in entries:
+            if entry.data is not None:
+                reader = _HashingReader(io.BytesIO(entry.data))
+                self.tar.addfile(self._member(entry, len(entry.data)), reader)
+                size = len(entry.data)
+            else:
+                with open(entry.path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    reader = _HashingReader(f)
+                    self.tar.addfile(self._member(entry, size), reader)
+            self.written.append(StreamedEntry(entry, size, reader.hash.hexdigest()))
+        return self.written
+
+    def close(self):
+        """Write the end-of-archive blocks and flush the compressor."""
+        self.tar.close()
+        self._stream.close()
+        if self._process is not None:
+            self._pump.join()
+            code = self._process.wait()
+            if self._pump_error is not None:
+                raise self._pump_error
+            if code != 0:
+                raise OSError(f"zstd exited with status {code}")
+
+SAMPLE_BYTES = 256 * 1024
+# Local header (30) + central directory record (46) per entry, plus the name twice
+ENTRY_OVERHEAD = 76
+END_RECORD_SIZE = 22
+
+@dataclass
+class SizeEstimate:
+    """Raw and estimated compressed size of one file, without archiving it."""
+    arcname: str
+    size: int
+    compressed: int
+    exact: bool
+
+    @property
+    def archived(self) -> int:
+        """Bytes the entry adds to the archive, headers included."""
+        return self.compressed + ENTRY_OVERHEAD + 2 * len(self.arcname.encode('utf-8'))
+
+def estimate_entry(path: Path, arcname: str, level: int = DEFAULT_LEVEL,
+                   sample_bytes: int = SAMPLE_BYTES) -> SizeEstimate:
+    """Estimate a file's compressed size by deflating only its first sample_bytes.
+
+    Files no larger than the sample are compressed whole, so their estimate
+    is exact. For larger files the sample's ratio is applied to the full
+    size, capped at the raw size since such entries would be stored.
+    """
+    size = os.stat(path).st_size
+    with open(path, 'rb') as f:
+        sample = f.read(sample_bytes)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    payload = len(compressor.compress(sample)) + len(compressor.flush())
+    exact = len(sample) >= size
+    compressed = payload if exact else round(size * payload / max(1, len(sample)))
+    return SizeEstimate(arcname, size, min(compressed, size), exact)
+
+VERIFY_CHUNK = 1024 * 1024
+MAX_MANIFEST_BYTES = 16 * 1024 * 1024
+
+@dataclass
+class VerifyReport:
+    """Result of verifying a package: problems found and what was checked."""
+    zip_path: Path
+    name: Optional[str] = None
+    entries: int = 0
+    bytes_checked: int = 0
+    hashes_checked: int = 0
+    issues: List[str] = None
+
+    def __post_init__(self):
+        if self.issues is None:
+            self.issues = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+    def to_dict(self) -> dict:
+        return {
+            "package_path": str(self.zip_path),
+            "name": self.name,
+            "ok": self.ok,
+            "entries": self.entries,
+            "bytes_checked": self.bytes_checked,
+            "hashes_checked": self.hashes_checked,
+            "issues": self.issues,
+        }
+
+def _read_manifest(zf: zipfile.ZipFile, info: zipfile.ZipInfo, issues: List[str]) -> dict:
+    if info.file_size > MAX_MANIFEST_BYTES:
+        issues.append(f"{info.filename}: too large to be a manifest ({info.file_size} bytes)")
+        return {}
+    try:
+        manifest = json.loads(zf.read(info).decode('utf-8'))
+    except (ValueError, zipfile.BadZipFile, zlib.error) as e:
+        issues.append(f"{info.filename}: unreadable manifest ({e})")
+        return {}
+    if not isinstance(manifest, dict):
+        issues.append(f"{info.filename}: manifest is not a JSON object")
+        return {}
+    return manifest
+
+def unsafe_name(name: str) -> bool:
+    """True if an entry name could escape, or resolve to, the directory it is extracted into.
+
+    Empty and '.' components are rejected as well as '..': './SKILL.md'
+    would make the extraction directory itself the skill. A directory
+    entry's trailing '/' is the only empty component allowed.
+    """
+    if name.startswith('/') or '\\' in name:
+        return True
+    parts = name.split('/')
+    if name.endswith('/'):
+        parts.pop()
+    return any(part in ('', '.', '..') for part in parts)
+
+def read_layout(zf: zipfile.ZipFile) -> Tuple[Optional[str], dict, List[str]]:
+    """Return (skill name, manifest, structural issues) of an open package.
+
+    Reads only the central directory and manifest.json. The skill name is
+    always the single top-level directory, whatever the manifest says.
+    Issues cover duplicate entries, unsafe paths, more than one top-level
+    entry, an unreadable manifest and a missing <name>/SKILL.md.
+    """
+    issues = []
+    seen = set()
+    tops = set()
+    for info in zf.infolist():
+        name = info.filename
+        if name in seen:
+            issues.append(f"{name}: duplicate entry")
+        seen.add(name)
+        if unsafe_name(name):
+            issues.append(f"{name}: unsafe path")
+        tops.add(name.split('/')[0])
+
+    manifests = [i for i in zf.infolist() if i.filename.count('/') == 1 and i.filename.endswith('/manifest.json')]
+    manifest = _read_manifest(zf, manifests[0], issues) if manifests else {}
+    name = None
+    if len(tops) == 1:
+        name = next(iter(tops))
+        if name in ('', '.', '..'):
+            issues.append(f"top-level directory {name!r} is not a skill name")
+            name = None
+    elif tops:
+        issues.append(f"expected one top-level directory, found {len(tops)}: {', '.join(sorted(tops))}")
+
+    if name and f"{name}/SKILL.md" not in seen:
+        issues.append(f"{name}/SKILL.md not found")
+    return name, manifest, issues
+
+def recorded_files(manifest: dict) -> dict:
+    """The manifest's {relative path: {"size", "sha256"}} map, or {}."""
+    files = manifest.get("files")
+    return files if isinstance(files, dict) else {}
+
+def verify_zip(zip_path: Path) -> VerifyReport:
+    """Stream every entry of a skill package once and check it.
+
+    Checks CRC-32 and size of every entry, SHA-256 and size against the
+    manifest's "files" map when present, that <name>/SKILL.md exists and
+    that no entry would escape the extraction directory. Entries are read
+    in fixed-size chunks and nothing is written to disk, so memory does
+    not grow with entry size.
+    """
+    report = VerifyReport(Path(zip_path))
+    try:
+        zf = zipfile.ZipFile(zip_path)
+    except (OSError, zipfile.BadZipFile) as e:
+        report.issues.append(f"not a readable zip archive: {e}")
+        return report
+
+    with zf:
+        infos = zf.infolist()
+        report.entries = len(infos)
+        report.name, manifest, report.issues = read_layout(zf)
+        # Installs go by the directory, so a differing manifest name is reported, not fatal there
+        if report.name and manifest.get("name") and str(manifest["name"]) != report.name:
+            report.issues.append(f"manifest name {manifest['name']!r} does not match directory {report.name!r}")
+
+        recorded = recorded_files(manifest)
+        prefix = f"{report.name}/" if report.name else ""
+        archived = set()
+        for info in infos:
+            if info.is_dir():
+                continue
+            rel = info.filename[len(prefix):] if info.filename.startswith(prefix) else info.filename
+            archived.add(rel)
+            listed = rel in recorded
+            expected = recorded.get(rel)
+            if listed and not isinstance(expected, dict):
+                report.issues.append(f"{info.filename}: malformed manifest entry (expected an object)")
+                expected = None
+            digest = hashlib.sha256() if expected else None
+            size = 0
+            try:
+                with zf.open(info) as stream:
+                    while True:
+                        chunk = stream.read(VERIFY_CHUNK)
+                        if not chunk:
+                            break
+                        size += len(chunk)
+                        if digest is not None:
+                            digest.update(chunk)
+            except (zipfile.BadZipFile, zlib.error, EOFError, OSError) as e:
+                # zipfile raises BadZipFile on a CRC mismatch once the entry is read to the end
+                report.issues.append(f"{info.filename}: {e}")
+                continue
+            report.bytes_checked += size
+            if size != info.file_size:
+                report.issues.append(f"{info.filename}: size {size} does not match header ({info.file_size})")
+            if expected:
+                report.hashes_checked += 1
+                if expected.get("size") is not None and expected["size"] != size:
+                    report.issues.append(f"{info.filename}: size {size} does not match manifest ({expected['size']})")
+                if expected.get("sha256") and expected["sha256"] != digest.hexdigest():
+                    report.issues.append(f"{info.filename}: SHA-256 does not match manifest")
+            elif recorded and not listed and rel != "manifest.json":
+                report.issues.append(f"{info.filename}: not listed in manifest")
+
+        for rel in sorted(set(recorded) - archived):
+            report.issues.append(f"{prefix}{rel}: listed in manifest but missing from archive")
+
+    return report
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Skill Features - Raw measurements that skill scores are computed from
+
+Feature extraction is separated from scoring: extract_features() turns a
+parsed skill into a flat {name: number} vector (header counts, code
+blocks, passive/imperative counts, table rows, line count, manifest
+state, ...) and a rubric (skill_rubric.py) turns vectors into points.
+
+FeatureCache keeps vectors on disk keyed by skill path and a stat
+fingerprint of the files they depend on, so unchanged skills are never
+re-read or re-parsed, and a whole corpus can be rescored under a new
+rubric from the cache alone.
+"""
+
+import os
+import re
+import json
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from skill_frontmatter import as_text
+from skill_tree import SkillTree
+
+CACHE_VERSION = 1
+
+FEATURE_NAMES = [
+    # Structure
+    "has_skill_md", "references_nonempty", "references_mentioned",
+    "scripts_nonempty", "scripts_all_executable", "scripts_mentioned", "has_unwanted",
+    # Description
+    "has_name", "name_valid", "description_length", "trigger_patterns",
+    "specific_words", "generic_words", "specificity", "conversational", "has_context",
+    # Content
+    "h1", "h2", "h3", "headers", "code_blocks",
+    "passive_phrases", "imperative_verbs", "imperative_ratio", "table_rows", "list_items",
+    # Progressive disclosure
+    "line_count", "references_exists", "reference_md_files", "reference_mentions", "duplicate_paragraphs",
+    # Examples
+    "examples", "output_words", "placeholders",
+    # Cross-platform
+    "agentskills_points", "manifest_state", "platform_mentions",
+]
+
+# manifest_state values
+MANIFEST_MISSING, MANIFEST_INVALID, MANIFEST_INCOMPLETE, MANIFEST_VALID = 0, 1, 2, 3
+
+UNWANTED = ['.DS_Store', 'Thumbs.db', '__pycache__', '.pyc']
+TRIGGER_PATTERNS = [
+    re.compile(r'[Tt]riggers?\s+for'),
+    re.compile(r'[Aa]ctivates?\s+(?:for|when)'),
+    re.compile(r'[Uu]se\s+when'),
+]
+SPECIFIC_WORDS = ['when', 'for', 'to', 'that', 'which']
+GENERIC_WORDS = ['help', 'assist', 'support', 'various', 'many', 'general']
+CONVERSATIONAL_WORDS = ['you are', 'your role', 'persona']
+PASSIVE_RE = re.compile('you should|you can|you will|you may|you need to')
+IMPERATIVE_RE = re.compile(r'\b(?:run|create|add|use|check|verify|ensure)\b')
+OUTPUT_WORDS = ['output', 'result', 'returns', 'produces', 'expected']
+PLACEHOLDER_RE = re.compile('foo|bar|baz|xxx|example.com|lorem')
+PLATFORM_RE = re.compile('claude code|claude-code|anthropic')
+AGENTSKILLS_FIELDS = {'version': 1, 'platforms': 1.5, 'inputs': 1, 'outputs': 1, 'tags': 0.5}
+
+H1_RE = re.compile(r'^#\s', re.MULTILINE)
+H2_RE = re.compile(r'^##\s', re.MULTILINE)
+H3_RE = re.compile(r'^###\s', re.MULTILINE)
+CODE_FENCE = '```'
+CODE_OPENING_RE = re.compile(r'```\w*\n')
+QUOTE_SEPARATOR_RE = re.compile(r',?\s*')
+TABLE_ROW_RE = re.compile(r'^\|.*\|$', re.MULTILINE)
+BULLET_RE = re.compile(r'^[-*]\s', re.MULTILINE)
+NUMBERED_RE = re.compile(r'^\d+\.\s', re.MULTILINE)
+EXAMPLE_HEADER_RE = re.compile(r'^#{1,3}\s*[Ee]xample', re.MULTILINE)
+EXAMPLE_MENTION_RE = re.compile(r'\b[Ee]xample\s*\d*:')
+NAME_RE = re.compile(r'^[a-z0-9-]+$')
+
+def has_quoted_pair(text: str) -> bool:
+    """Whether text has two adjacent quoted phrases, like "review PR", "check diff".
+
+    Same answer as searching r'"[^"]+",?\\s*"[^"]+"', but in one pass over
+    the quote-separated segments: the regex retries from every quote and
+    backtracks through each run of text it fails on.
+    """
+    parts = text.split('"')
+    for i in range(len(parts) - 4):
+        if parts[i + 1] and parts[i + 3] and QUOTE_SEPARATOR_RE.fullmatch(parts[i + 2]):
+            return True
+    return False
+
+def count_code_blocks(body: str) -> int:
+    """Count fenced code blocks: ``` plus an optional info word and newline, up to the next ```.
+
+    Same count as findall(r'```(\\w*)\\n[\\s\\S]*?```'), whose lazy tail
+    rescans to the end of the text from every fence that is never closed.
+    Openings are found by a regex with no such tail and closings by
+    str.find, so each character is examined a bounded number of times.
+    """
+    count = 0
+    pos = 0
+    while True:
+        opening = CODE_OPENING_RE.search(body, pos)
+        if not opening:
+            return count
+        end = body.find(CODE_FENCE, opening.end())
+        if end == -1:
+            # No later opening can be closed either
+            return count
+        count += 1
+        pos = end + len(CODE_FENCE)
+
+def _manifest_state(tree: SkillTree) -> int:
+    if not tree.exists("manifest.json"):
+        return MANIFEST_MISSING
+    try:
+        manifest = json.loads(tree.read_text("manifest.json"))
+    except ValueError:
+        return MANIFEST_INVALID
+    try:
+        complete = 'name' in manifest and 'description' in manifest
+    except TypeError:
+        complete = False
+    return MANIFEST_VALID if complete else MANIFEST_INCOMPLETE
+
+def extract_features(tree: SkillTree, content: str, frontmatter: Dict, body: str,
+                     body_lower: Optional[str] = None) -> Dict[str, float]:
+    """Measure a parsed skill; returns a value for every name in FEATURE_NAMES."""
+    if body_lower is None:
+        body_lower = body.lower()
+    f: Dict[str, float] = {}
+
+    # Structure
+    f["has_skill_md"] = int(tree.is_file("SKILL.md"))
+    f["references_nonempty"] = int(tree.exists("references") and bool(tree.listdir("references")))
+    f["references_mentioned"] = int("references/" in content)
+    f["scripts_nonempty"] = int(tree.exists("scripts") and bool(tree.listdir("scripts")))
+    f["scripts_all_executable"] = int(all(
+        tree.is_executable(script) for script in tree.glob("scripts", '*') if script.endswith(('.sh', '.py'))
+    )) if f["scripts_nonempty"] else 0
+    f["scripts_mentioned"] = int("scripts/" in content)
+    f["has_unwanted"] = int(any(tree.exists(u) for u in UNWANTED))
+
+    # Description
+    description = as_text(frontmatter.get('description'))
+    description_lower = description.lower()
+    name = as_text(frontmatter.get('name'))
+    f["has_name"] = int(bool(name))
+    f["name_valid"] = int(bool(name) and NAME_RE.match(name) is not None)
+    f["description_length"] = len(description)
+    f["trigger_patterns"] = (sum(1 for p in TRIGGER_PATTERNS if p.search(description))
+                             + int(has_quoted_pair(description)))
+    f["specific_words"] = sum(1 for w in SPECIFIC_WORDS if w in description_lower)
+    f["generic_words"] = sum(1 for w in GENERIC_WORDS if w in description_lower)
+    f["specificity"] = f["specific_words"] - f["generic_words"]
+    f["conversational"] = int(any(word in body_lower for word in CONVERSATIONAL_WORDS))
+    f["has_context"] = int('context' in frontmatter)
+
+    # Content
+    f["h1"] = len(H1_RE.findall(body))
+    f["h2"] = len(H2_RE.findall(body))
+    f["h3"] = len(H3_RE.findall(body))
+    f["headers"] = f["h1"] + f["h2"] + f["h3"]
+    f["code_blocks"] = count_code_blocks(body)
+    f["passive_phrases"] = len(PASSIVE_RE.findall(body_lower))
+    f["imperative_verbs"] = len(IMPERATIVE_RE.findall(body_lower))
+    f["imperative_ratio"] = f["imperative_verbs"] / (f["passive_phrases"] + 1)
+    f["table_rows"] = len(TABLE_ROW_RE.findall(body))
+    f["list_items"] = len(BULLET_RE.findall(body)) + len(NUMBERED_RE.findall(body))
+
+    # Progressive disclosure
+    f["line_count"] = content.count('\n') + 1
+    f["references_exists"] = int(tree.exists("references"))
+    f["reference_md_files"] = len(tree.glob("references", '*.md')) if f["references_exists"] else 0
+    f["reference_mentions"] = content.count('references/')
+    paragraphs = [p.strip() for p in body.split('\n\n') if len(p.strip()) > 50]
+    f["duplicate_paragraphs"] = len(paragraphs) - len(set(paragraphs))
+
+    # Examples
+    f["examples"] = len(EXAMPLE_HEADER_RE.findall(body)) + len(EXAMPLE_MENTION_RE.findall(body))
+    f["output_words"] = sum(1 for w in OUTPUT_WORDS if w in body_lower)
+    f["placeholders"] = len(PLACEHOLDER_RE.findall(body_lower))
+
+    # Cross-platform: summed in field order, so 1 + 1.5 + ... matches the old arithmetic
+    points = 0
+    for field, pts in AGENTSKILLS_FIELDS.items():
+        if field in frontmatter:
+            points += pts
+    f["agentskills_points"] = points
+    f["manifest_state"] = _manifest_state(tree)
+    f["platform_mentions"] = len(PLATFORM_RE.findall(body_lower))
+    return f
+
+def fingerprint(skill_dir: Path) -> Optional[str]:
+    """Stat signature of everything the features of a skill on disk depend on.
+
+    SKILL.md and manifest.json by size and mtime; the skill, references/
+    and scripts/ directories by mtime (entries added or removed); each
+    script by mode. None if SKILL.md cannot be stat'ed.
+    """
+    parts = []
+    for rel in ("SKILL.md", "manifest.json", "", "references", "scripts"):
+        try:
+            st = os.stat(skill_dir / rel)
+        except OSError:
+            if rel == "SKILL.md":
+                return None
+            parts.append("-")
+            continue
+        parts.append(f"{st.st_size}:{st.st_mtime_ns}")
+    try:
+        with os.scandir(skill_dir / "scripts") as it:
+            parts.extend(f"{e.name}:{e.stat().st_mode:o}" for e in sorted(it, key=lambda e: e.name))
+    except OSError:
+        pass
+    return "|".join(parts)
+
+class FeatureCache:
+    """Feature vectors of many skills in one JSON file, keyed by skill path."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION and data.get("features") == FEATURE_NAMES:
+                self.entries = data.get("skills", {})
+        except (OSError, ValueError, AttributeError):
+            self.entries = {}
+
+    def get(self, skill_dir: Path) -> Optional[Dict[str, float]]:
+        """Cached features of a skill whose files are unchanged, else None."""
+        entry = self.entries.get(str(skill_dir))
+        if entry and entry.get("fingerprint") == fingerprint(skill_dir):
+            self.hits += 1
+            return dict(zip(FEATURE_NAMES, entry["values"]))
+        self.misses += 1
+        return None
+
+    def put(self, skill_dir: Path, features: Dict[str, float]):
+        stamp = fingerprint(skill_dir)
+        if stamp is None:
+            return
+        self.entries[str(skill_dir)] = {"fingerprint": stamp,
+                                        "values": [features[name] for name in FEATURE_NAMES]}
+        self.dirty = True
+
+    def matrix(self) -> Tuple[List[str], List[List[float]]]:
+        """Skill paths and their feature rows, in path order."""
+        paths = sorted(self.entries)
+        return paths, [self.entries[p]["values"] for p in paths]
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"version": CACHE_VERSION, "features": FEATURE_NAMES, "skills": self.entries},
+                      f, separators=(',', ':'))
+        os.replace(tmp_name, self.path)
+        self.dirty = False
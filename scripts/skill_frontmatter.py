@@ -0,0 +1,806 @@
+#!/usr/bin/env python3
+"""
+Skill Frontmatter - Dependency-free parser for SKILL.md frontmatter
+
+Parses the YAML subset skills use and returns typed values:
+- Nested block mappings and block sequences (including lists of mappings)
+- Flow sequences and mappings: [a, "b"], {key: value}
+- Literal (|) and folded (>) block scalars with -/+ chomping
+- Single- and double-quoted strings with escapes
+- Plain scalars typed as null, bool, int, float or str; numbers keep
+  their source text, so as_text() gives back "1.10" rather than "1.1"
+
+Errors are raised as FrontmatterError with the line and column in the
+original file. Anchors, aliases, tags and multi-document streams are not
+supported. Plain scalars may contain ': ' (e.g. "Use when: ..."), which
+strict YAML rejects, because existing skills rely on it, and a value
+starting with '{{' is a template placeholder rather than a flow mapping.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+class FrontmatterError(ValueError):
+    """Frontmatter syntax error with a position in the source file."""
+
+    def __init__(self, message: str, line: int, column: int):
+        super().__init__(f"line {line}, column {column}: {message}")
+        self.message = message
+        self.line = line
+        self.column = column
+
+_INT_RE = re.compile(r'[-+]?[0-9][0-9_]*\Z')
+_HEX_RE = re.compile(r'0x[0-9a-fA-F_]+\Z')
+_OCT_RE = re.compile(r'0o[0-7_]+\Z')
+_FLOAT_RE = re.compile(r'[-+]?(?:[0-9][0-9_]*\.[0-9_]*|\.[0-9_]+|[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)?\Z')
+_NULLS = {'', '~', 'null', 'Null', 'NULL'}
+_TRUE = {'true', 'True', 'TRUE'}
+_FALSE = {'false', 'False', 'FALSE'}
+_SPECIAL_FLOATS = {
+    '.inf': float('inf'), '.Inf': float('inf'), '.INF': float('inf'),
+    '+.inf': float('inf'), '-.inf': float('-inf'), '-.Inf': float('-inf'),
+    '.nan': float('nan'), '.NaN': float('nan'), '.NAN': float('nan'),
+}
+_ESCAPES = {
+    '0': '\0', 'a': '\a', 'b': '\b', 't': '\t', '\t': '\t', 'n': '\n', 'v': '\v',
+    'f': '\f', 'r': '\r', 'e': '\x1b', ' ': ' ', '"': '"', '/': '/', '\\': '\\',
+    'N': '\x85', '_': '\xa0', 'L': ' ', 'P': ' ',
+}
+_HEX_ESCAPES = {'x': 2, 'u': 4, 'U': 8}
+_DOUBLE_RUN = re.compile(r'[^"\\]*')
+_SKIPPED = {'': -1, '#': -1, '\t': -2}
+# Single-line flow sequence of plain scalars, e.g. [a, b, c]
+_SIMPLE_FLOW = re.compile(r'\[([^\[\]{}"\'#,]*(?:,[^\[\]{}"\'#,]*)*)\]\Z')
+# First characters that may make a plain scalar something other than a string
+_TYPED_START = frozenset('0123456789-+.~nNtTfF')
+# First characters of values that need more than a plain scalar
+_SPECIAL_START = frozenset('|>[{"\'&*!@`#%')
+# Line breaks in a quoted scalar, with the whitespace around them
+_LINE_BREAKS = re.compile(r'[ \t]*(?:\n[ \t]*)+')
+
+class _SourceText:
+    """Number from a plain scalar that renders as its source text, so
+    "1.10" stays "1.10" in str() and f-strings while comparing as 1.1."""
+
+    def __new__(cls, value, source: str):
+        number = super().__new__(cls, value)
+        number.source = source
+        return number
+
+    def __str__(self) -> str:
+        return self.source
+
+    def __format__(self, spec: str) -> str:
+        return self.source if not spec else super().__format__(spec)
+
+    def __reduce__(self):
+        return (type(self), (self.real, self.source))
+
+class PlainInt(_SourceText, int):
+    """An int from a plain scalar, e.g. 012 or 0x1F."""
+
+class PlainFloat(_SourceText, float):
+    """A float from a plain scalar, e.g. 1.10 or 1e3."""
+
+def _fold_breaks(text: str) -> str:
+    """Fold a quoted scalar's line breaks: one becomes a space, each blank line a newline."""
+    return _LINE_BREAKS.sub(lambda m: '\n' * (m.group().count('\n') - 1) or ' ', text)
+
+def resolve_plain(text: str) -> Any:
+    """Type a plain (unquoted) scalar the way YAML 1.2's core schema does."""
+    if not text:
+        return None
+    first = text[0]
+    if first not in _TYPED_START:
+        return text
+    if text in _NULLS:
+        return None
+    if first in 'tTfF':
+        if text in _TRUE:
+            return True
+        if text in _FALSE:
+            return False
+        return text
+    if first.isdigit() or first in '-+.':
+        if _INT_RE.match(text):
+            return PlainInt(int(text.replace('_', '')), text)
+        if _HEX_RE.match(text):
+            return PlainInt(int(text[2:].replace('_', ''), 16), text)
+        if _OCT_RE.match(text):
+            return PlainInt(int(text[2:].replace('_', ''), 8), text)
+        if _FLOAT_RE.match(text) and any(c.isdigit() for c in text):
+            return PlainFloat(float(text.replace('_', '')), text)
+        if text in _SPECIAL_FLOATS:
+            return PlainFloat(_SPECIAL_FLOATS[text], text)
+    return text
+
+def _strip_comment(text: str) -> str:
+    """Drop a trailing ' # comment' from a plain value."""
+    if '#' not in text:
+        return text
+    if text.startswith('#'):
+        return ''
+    index = text.find(' #')
+    if index < 0:
+        index = text.find('\t#')
+    return text[:index].rstrip() if index >= 0 else text
+
+def _find_colon(text: str) -> int:
+    """Index of the ':' separating a plain key from its value, or -1."""
+    start = 0
+    while True:
+        index = text.find(':', start)
+        if index < 0:
+            return -1
+        if index + 1 == len(text) or text[index + 1] in ' \t':
+            return index
+        start = index + 1
+
+class _Parser:
+    """Indentation-driven recursive descent over frontmatter lines."""
+
+    def __init__(self, text: str, first_line: int):
+        self.lines = lines = text.split('\n')
+        self.first_line = first_line
+        self.pos = 0
+        # Indentation per line: -1 for blank and comment lines, -2 for lines
+        # whose indentation contains a tab (blank, or an error if reached)
+        skipped = _SKIPPED.get
+        self.indents = indents = []
+        append = indents.append
+        for line in lines:
+            stripped = line.lstrip(' ')
+            append(skipped(stripped[:1], len(line) - len(stripped)))
+
+    # -- positions and errors ------------------------------------------------
+
+    def error(self, message: str, index: int, column: int = 0):
+        raise FrontmatterError(message, self.first_line + index, column + 1)
+
+    # -- line helpers --------------------------------------------------------
+
+    def next_content(self) -> Optional[int]:
+        """Advance past blank and comment lines; return the next line's indent."""
+        indents = self.indents
+        pos = self.pos
+        count = len(indents)
+        while pos < count and indents[pos] < 0:
+            if indents[pos] == -2 and self.lines[pos].strip():
+                line = self.lines[pos]
+                self.error("tabs are not allowed for indentation", pos, len(line) - len(line.lstrip(' ')))
+            pos += 1
+        self.pos = pos
+        return None if pos == count else indents[pos]
+
+    def rewrite(self, index: int, indent: int, text: str):
+        """Replace a line, e.g. to re-read '- key: value' as a mapping at the key's column."""
+        self.lines[index] = ' ' * indent + text
+        self.indents[index] = indent
+
+    @staticmethod
+    def is_sequence_item(stripped: str) -> bool:
+        return stripped[0] == '-' and (len(stripped) == 1 or stripped[1] in ' \t')
+
+    # -- block structures ----------------------------------------------------
+
+    def parse_document(self) -> Dict:
+        indent = self.next_content()
+        if indent is None:
+            return {}
+        stripped = self.lines[self.pos][indent:]
+        if self.is_sequence_item(stripped):
+            self.error("frontmatter must be a mapping, not a sequence", self.pos, indent)
+        result = self.parse_mapping(indent)
+        if self.next_content() is not None:
+            self.error("unexpected indentation", self.pos, self.next_content())
+        return result
+
+    def parse_block(self, indent: int) -> Any:
+        stripped = self.lines[self.pos][indent:]
+        if self.is_sequence_item(stripped):
+            return self.parse_sequence(indent)
+        return self.parse_mapping(indent)
+
+    def parse_mapping(self, indent: int) -> Dict:
+        result: Dict[str, Any] = {}
+        lines = self.lines
+        indents = self.indents
+        count = len(lines)
+        pos = self.pos
+        while True:
+            while pos < count and indents[pos] == -1:
+                pos += 1
+            if pos == count:
+                break
+            line = lines[pos]
+            colon = line.find(': ', indent) if indents[pos] == indent else -1
+            if colon > indent and line[indent] not in '"\'-?' and line[colon - 1] != ' ':
+                # Fast path: "key: value" with a plain key
+                key = line[indent:colon]
+                if key in result:
+                    self.error(f"duplicate key '{key}'", pos, indent)
+                rest = line[colon + 2:].strip()
+                following = pos + 1
+                first = rest[:1]
+                if (first and first not in _SPECIAL_START and '#' not in rest
+                        and self._ends_scalar(following, indent)):
+                    result[key] = rest if first not in _TYPED_START else resolve_plain(rest)
+                    pos = following
+                    continue
+                if (first in ('"', "'") and len(rest) > 1 and rest[-1] == first
+                        and rest.find(first, 1) == len(rest) - 1 and '\\' not in rest):
+                    # Single-line quoted string without escapes
+                    result[key] = rest[1:-1]
+                    pos = following
+                    continue
+                self.pos = following
+                column = len(line) - len(line[colon + 1:].lstrip())
+                result[key] = self.parse_value(rest, pos, column, indent, allow_same_indent_sequence=True)
+                pos = self.pos
+                continue
+
+            self.pos = pos
+            line_indent = self.next_content()
+            if line_indent is None or line_indent < indent:
+                return result
+            index = self.pos
+            if line_indent > indent:
+                self.error("unexpected indentation", index, line_indent)
+            stripped = lines[index][indent:]
+            if self.is_sequence_item(stripped):
+                self.error("expected a mapping key, found a sequence item", index, indent)
+
+            key, rest, rest_column = self.parse_key(stripped, index, indent)
+            if key in result:
+                self.error(f"duplicate key '{key}'", index, indent)
+            self.pos = index + 1
+            result[key] = self.parse_value(rest, index, rest_column, indent, allow_same_indent_sequence=True)
+            pos = self.pos
+        self.pos = pos
+        return result
+
+    def _ends_scalar(self, index: int, indent: int) -> bool:
+        """True if a plain scalar on the previous line cannot continue at index."""
+        indents = self.indents
+        count = len(indents)
+        while index < count and indents[index] == -1:
+            index += 1
+        return index == count or 0 <= indents[index] <= indent
+
+    def parse_key(self, stripped: str, index: int, indent: int) -> Tuple[str, str, int]:
+        """Split 'key: rest' and return (key, rest, column of rest)."""
+        if stripped[0] in '"\'':
+            key, end = self.parse_quoted(stripped, 0, index, indent)
+            after = stripped[end:].lstrip(' ')
+            if not after.startswith(':'):
+                self.error("expected ':' after quoted key", index, indent + end)
+            colon = len(stripped) - len(after)
+        else:
+            colon = _find_colon(stripped)
+            if colon < 0:
+                self.error("expected 'key: value'", index, indent)
+            key = stripped[:colon].rstrip()
+            if not key:
+                self.error("empty mapping key", index, indent)
+        rest = stripped[colon + 1:]
+        lead = len(rest) - len(rest.lstrip(' \t'))
+        return key, rest.strip(' \t'), indent + colon + 1 + lead
+
+    def parse_sequence(self, indent: int) -> List:
+        result = []
+        lines = self.lines
+        while True:
+            line_indent = self.next_content()
+            if line_indent is None or line_indent < indent:
+                return result
+            index = self.pos
+            line = lines[index]
+            stripped = line[indent:]
+            if line_indent > indent or not self.is_sequence_item(stripped):
+                if line_indent == indent:
+                    return result
+                self.error("unexpected indentation", index, line_indent)
+
+            rest = stripped[1:]
+            lead = len(rest) - len(rest.lstrip(' '))
+            rest = rest.strip(' \t')
+            item_indent = indent + 1 + lead
+
+            if rest and rest[0] not in '"\'[{|>#' and _find_colon(rest) >= 0:
+                # "- key: value" starts a mapping nested at the item's column
+                self.rewrite(index, item_indent, rest)
+                result.append(self.parse_mapping(item_indent))
+            elif rest and rest[0] in '"\'' and self._quoted_key(rest, index, item_indent):
+                self.rewrite(index, item_indent, rest)
+                result.append(self.parse_mapping(item_indent))
+            elif rest.startswith('- ') or rest == '-':
+                self.rewrite(index, item_indent, rest)
+                result.append(self.parse_sequence(item_indent))
+            elif (rest and rest[0] not in _SPECIAL_START and '#' not in rest
+                    and self._ends_scalar(index + 1, indent)):
+                self.pos = index + 1
+                result.append(resolve_plain(rest))
+            else:
+                self.pos += 1
+                result.append(self.parse_value(rest, index, item_indent, indent))
+
+    def _quoted_key(self, rest: str, index: int, column: int) -> bool:
+        _, end = self.parse_quoted(rest, 0, index, column)
+        return rest[end:].lstrip(' ').startswith(':')
+
+    def parse_value(self, rest: str, index: int, column: int, indent: int,
+                    allow_same_indent_sequence: bool = False) -> Any:
+        """Parse the value following a key or sequence dash."""
+        if not rest or rest[0] == '#':
+            nested = self.next_content()
+            if nested is None:
+                return None
+            stripped = self.lines[self.pos][nested:]
+            if nested > indent:
+                return self.parse_block(nested)
+            if nested == indent and allow_same_indent_sequence and self.is_sequence_item(stripped):
+                return self.parse_sequence(indent)
+            return None
+
+        first = rest[0]
+        if first in '|>':
+            return self.parse_block_scalar(rest, index, column, indent)
+        if first in '[{' and not rest.startswith('{{'):
+            return self.parse_flow_lines(rest, index, column, indent)
+        if first in '"\'':
+            value, end = self.parse_quoted_lines(rest, index, column, indent)
+            return value
+        if first in '&*!':
+            self.error("anchors, aliases and tags are not supported", index, column)
+        if first == '@' or first == '`':
+            self.error(f"plain scalars cannot start with '{first}'", index, column)
+        return self.parse_plain(rest, indent)
+
+    def parse_plain(self, rest: str, indent: int) -> Any:
+        """Plain scalar, folding more-indented continuation lines."""
+        text = _strip_comment(rest)
+        lines = self.lines
+        parts = [text]
+        # A comment ends the scalar; otherwise more-indented lines continue it
+        while self.pos < len(lines) and text == rest:
+            line = lines[self.pos]
+            stripped = line.lstrip(' ')
+            if not stripped:
+                # A blank line inside a multi-line plain scalar is a newline
+                look = self.pos + 1
+                while look < len(lines) and not lines[look].strip():
+                    look += 1
+                if look < len(lines) and len(lines[look]) - len(lines[look].lstrip(' ')) > indent:
+                    parts.append('\n' * (look - self.pos))
+                    self.pos = look
+                    continue
+                break
+            if len(line) - len(stripped) <= indent or stripped[0] == '#':
+                break
+            piece = _strip_comment(stripped.rstrip())
+            if _find_colon(piece) >= 0 and not piece.startswith(('"', "'")):
+                self.error("mapping values are not allowed in a multi-line plain scalar",
+                           self.pos, len(line) - len(stripped))
+            parts.append(piece)
+            self.pos += 1
+            if piece != stripped.rstrip():
+                break
+        if len(parts) == 1:
+            return resolve_plain(text)
+        folded = parts[0]
+        for part in parts[1:]:
+            if part.startswith('\n'):
+                folded += part
+            elif folded.endswith('\n'):
+                folded += part
+            else:
+                folded += ' ' + part
+        return folded
+
+    def parse_block_scalar(self, header: str, index: int, column: int, indent: int) -> str:
+        style = header[0]
+        chomp = 'clip'
+        explicit = None
+        for offset, char in enumerate(header[1:], 1):
+            if char == '-' and chomp == 'clip':
+                chomp = 'strip'
+            elif char == '+' and chomp == 'clip':
+                chomp = 'keep'
+            elif char.isdigit() and char != '0' and explicit is None:
+                explicit = int(char)
+            elif char in ' \t':
+                if _strip_comment(header[offset:].strip()):
+                    self.error("unexpected text after block scalar indicator", index, column + offset)
+                break
+            else:
+                self.error("invalid block scalar header", index, column + offset)
+
+        lines = self.lines
+        indents = self.indents
+        count = len(lines)
+        pos = self.pos
+        content_indent = indent + explicit if explicit else None
+        collected: List[str] = []
+        while pos < count:
+            line = lines[pos]
+            line_indent = indents[pos]
+            if line_indent < 0:
+                stripped = line.lstrip(' ')
+                if not stripped:
+                    collected.append('')
+                    pos += 1
+                    continue
+                line_indent = len(line) - len(stripped)
+            if content_indent is None:
+                if line_indent <= indent:
+                    break
+                content_indent = line_indent
+            if line_indent < content_indent:
+                if line_indent > indent:
+                    self.error("block scalar line is less indented than its first line", pos, line_indent)
+                break
+            collected.append(line[content_indent:])
+            pos += 1
+        self.pos = pos
+
+        # Trailing blank lines belong to chomping, not to the content. The
+        # empty string after the text's final newline is not a line
+        trailing = 0
+        while collected and collected[-1] == '':
+            collected.pop()
+            trailing += 1
+        if pos == count and trailing and lines[-1] == '':
+            trailing -= 1
+        if pos == count and not trailing and lines[-1] != '':
+            # The text ends inside the last line, which has no line break to keep
+            chomp = 'strip'
+        if style == '|':
+            text = '\n'.join(collected)
+        else:
+            text = self._fold(collected)
+
+        if not collected:
+            return '\n' * trailing if chomp == 'keep' else ''
+        if chomp == 'strip':
+            return text
+        if chomp == 'keep':
+            return text + '\n' * (trailing + 1)
+        return text + '\n'
+
+    @staticmethod
+    def _fold(lines: List[str]) -> str:
+        """Fold lines: single breaks become spaces, blank lines become breaks."""
+        out = ''
+        previous = None
+        for line in lines:
+            more_indented = line[:1] in (' ', '\t')
+            if previous is None:
+                out = line
+            elif line == '':
+                out += '\n'
+            elif previous == '' or more_indented or previous[:1] in (' ', '\t'):
+                if previous != '' and not out.endswith('\n'):
+                    out += '\n'
+                out += line
+            else:
+                out += ' ' + line
+            previous = line
+        return out
+
+    # -- quoted scalars ------------------------------------------------------
+
+    def parse_quoted(self, text: str, start: int, index: int, column: int) -> Tuple[str, int]:
+        """Parse a quoted scalar in text at start; return (value, end offset)."""
+        quote = text[start]
+        i = start + 1
+        if quote == "'":
+            out = []
+            while True:
+                end = text.find("'", i)
+                if end < 0:
+                    self.error("unterminated single-quoted string", index, column + start)
+                chunk = text[i:end]
+                out.append(_fold_breaks(chunk) if '\n' in chunk else chunk)
+                if text.startswith("''", end):
+                    out.append("'")
+                    i = end + 2
+                    continue
+                return ''.join(out), end + 1
+
+        out = []
+        length = len(text)
+        run = _DOUBLE_RUN.match
+        while True:
+            end = run(text, i).end()
+            chunk = text[i:end]
+            out.append(_fold_breaks(chunk) if '\n' in chunk else chunk)
+            if end >= length:
+                self.error("unterminated double-quoted string", index, column + start)
+            if text[end] == '"':
+                return ''.join(out), end + 1
+            if end + 1 >= length:
+                self.error("unterminated double-quoted string", index, column + start)
+            escape = text[end + 1]
+            if escape == '\n':
+                # Escaped line break: the lines join with nothing between them
+                i = end + 2
+            elif escape in _ESCAPES:
+                out.append(_ESCAPES[escape])
+                i = end + 2
+            elif escape in _HEX_ESCAPES:
+                digits = text[end + 2:end + 2 + _HEX_ESCAPES[escape]]
+                try:
+                    if len(digits) != _HEX_ESCAPES[escape]:
+                        raise ValueError
+                    out.append(chr(int(digits, 16)))
+                except ValueError:
+                    self.error(f"invalid \\{escape} escape", index, column + end)
+                i = end + 2 + _HEX_ESCAPES[escape]
+            else:
+                self.error(f"invalid escape '\\{escape}'", index, column + end)
+
+    def parse_quoted_lines(self, rest: str, index: int, column: int, indent: int) -> Tuple[str, int]:
+        """Quoted scalar that may continue on following, more-indented lines."""
+        text, spans = self._gather(rest, index, column, indent, self._quote_open)
+        value, end = self.parse_quoted(text, 0, index, column)
+        tail = _strip_comment(text[end:].strip())
+        if tail:
+            line, col = self._locate(spans, end)
+            self.error("unexpected text after quoted string", line, col)
+        return value, end
+
+    def _quote_open(self, text: str) -> bool:
+        quote = text[0]
+        if quote == "'":
+            return text.count("'") % 2 == 1
+        i = 1
+        while i < len(text):
+            if text[i] == '\\':
+                i += 2
+                continue
+            if text[i] == '"':
+                return False
+            i += 1
+        return True
+
+    # -- flow collections ----------------------------------------------------
+
+    def _gather(self, rest: str, index: int, column: int, indent: int, is_open,
+                closers: str = '') -> Tuple[str, List]:
+        """Join continuation lines while is_open(text) holds; keep offsets for errors.
+
+        Continuation lines must be indented past the parent, except lines
+        starting with one of closers (a flow collection's closing bracket).
+        """
+        spans = [(0, index, column)]
+        text = rest
+        lines = self.lines
+        while is_open(text) and self.pos < len(lines):
+            line = lines[self.pos]
+            stripped = line.strip()
+            line_indent = len(line) - len(line.lstrip(' '))
+            if stripped and line_indent <= indent and stripped[0] not in closers:
+                break
+            text += '\n'
+            spans.append((len(text), self.pos, line_indent))
+            text += stripped
+            self.pos += 1
+        return text, spans
+
+    @staticmethod
+    def _locate(spans: List, offset: int) -> Tuple[int, int]:
+        for start, line, col in reversed(spans):
+            if offset >= start:
+                return line, col + offset - start
+        return spans[0][1], spans[0][2]
+
+    def _flow_open(self, text: str) -> bool:
+        depth = 0
+        quote = None
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if quote:
+                if char == '\\' and quote == '"':
+                    i += 1
+                elif char == quote:
+                    quote = None
+            elif char in '"\'':
+                quote = char
+            elif char in '[{':
+                depth += 1
+            elif char in ']}':
+                depth -= 1
+            elif char == '#' and (i == 0 or text[i - 1] in ' \t\n'):
+                newline = text.find('\n', i)
+                if newline < 0:
+                    break
+                i = newline
+                continue
+            i += 1
+        return depth > 0
+
+    def parse_flow_lines(self, rest: str, index: int, column: int, indent: int) -> Any:
+        simple = _SIMPLE_FLOW.match(rest)
+        if simple:
+            items = [item.strip() for item in simple.group(1).split(',')]
+            if items[-1] == '':
+                items.pop()
+            if '' not in items and not any(':' in item for item in items):
+                return [resolve_plain(item) for item in items]
+        text, spans = self._gather(rest, index, column, indent, self._flow_open, closers=']}')
+        flow = _FlowParser(self, text, spans)
+        value = flow.parse_value()
+        flow.skip_space()
+        if flow.pos < len(text) and text[flow.pos] != '#':
+            flow.fail("unexpected text after flow collection")
+        return value
+
+class _FlowParser:
+    """Parser for [..] and {..} collections, possibly spanning lines."""
+
+    def __init__(self, parent: _Parser, text: str, spans: List):
+        self.parent = parent
+        self.text = text
+        self.spans = spans
+        self.pos = 0
+
+    def fail(self, message: str, offset: Optional[int] = None):
+        line, col = _Parser._locate(self.spans, self.pos if offset is None else offset)
+        self.parent.error(message, line, col)
+
+    def skip_space(self):
+        text = self.text
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char in ' \t\n':
+                self.pos += 1
+            elif char == '#' and (self.pos == 0 or text[self.pos - 1] in ' \t\n'):
+                newline = text.find('\n', self.pos)
+                self.pos = len(text) if newline < 0 else newline
+            else:
+                break
+
+    def parse_value(self) -> Any:
+        self.skip_space()
+        if self.pos >= len(self.text):
+            self.fail("unexpected end of flow collection")
+        char = self.text[self.pos]
+        if char == '[':
+            return self.parse_sequence()
+        if char == '{':
+            return self.parse_mapping()
+        if char in '"\'':
+            line, col = _Parser._locate(self.spans, self.pos)
+            value, end = self.parent.parse_quoted(self.text, self.pos, line, col - self.pos)
+            self.pos = end
+            return value
+        return self.parse_plain()
+
+    def parse_plain(self, in_key: bool = False) -> Any:
+        text = self.text
+        start = self.pos
+        while self.pos < len(text):
+            char = text[self.pos]
+            if char in ',[]{}':
+                break
+            if char == ':' and (self.pos + 1 == len(text) or text[self.pos + 1] in ' \t\n,[]{}'):
+                break
+            if char == '#' and text[self.pos - 1] in ' \t\n':
+                break
+            self.pos += 1
+        raw = re.sub(r'\s*\n\s*', ' ', text[start:self.pos].strip())
+        if not raw and not in_key:
+            self.fail("expected a value")
+        return raw if in_key else resolve_plain(raw)
+
+    def parse_sequence(self) -> List:
+        self.pos += 1
+        result = []
+        while True:
+            self.skip_space()
+            if self.pos >= len(self.text):
+                self.fail("unterminated flow sequence")
+            if self.text[self.pos] == ']':
+                self.pos += 1
+                return result
+            result.append(self.parse_value())
+            self.skip_space()
+            if self.pos < len(self.text) and self.text[self.pos] == ',':
+                self.pos += 1
+            elif self.pos >= len(self.text) or self.text[self.pos] != ']':
+                self.fail("expected ',' or ']' in flow sequence")
+
+    def parse_mapping(self) -> Dict:
+        self.pos += 1
+        result: Dict[str, Any] = {}
+        while True:
+            self.skip_space()
+            if self.pos >= len(self.text):
+                self.fail("unterminated flow mapping")
+            if self.text[self.pos] == '}':
+                self.pos += 1
+                return result
+            key_pos = self.pos
+            if self.text[self.pos] in '"\'':
+                key = self.parse_value()
+            else:
+                key = self.parse_plain(in_key=True)
+            if key in result:
+                self.fail(f"duplicate key '{key}'", key_pos)
+            self.skip_space()
+            if self.pos < len(self.text) and self.text[self.pos] == ':':
+                self.pos += 1
+                self.skip_space()
+                if self.pos < len(self.text) and self.text[self.pos] in ',}':
+                    result[key] = None
+                else:
+                    result[key] = self.parse_value()
+            else:
+                result[key] = None
+            self.skip_space()
+            if self.pos < len(self.text) and self.text[self.pos] == ',':
+                self.pos += 1
+            elif self.pos >= len(self.text) or self.text[self.pos] != '}':
+                self.fail("expected ',' or '}' in flow mapping")
+
+def split_frontmatter(content: str) -> Tuple[Optional[str], str, int]:
+    """Split SKILL.md content into (frontmatter text, body, first frontmatter line).
+
+    Frontmatter is the block between a leading '---' line and the next line
+    that is exactly '---' (or '...'). Without it, the frontmatter is None and
+    the whole content is the body.
+    """
+    if not content.startswith('---'):
+        return None, content, 0
+    first_newline = content.find('\n')
+    if first_newline < 0 or content[:first_newline].rstrip() != '---':
+        return None, content, 0
+
+    start = first_newline + 1
+    for marker in ('\n---', '\n...'):
+        pos = first_newline
+        while True:
+            pos = content.find(marker, pos)
+            if pos < 0:
+                break
+            end = content.find('\n', pos + 4)
+            if end < 0:
+                end = len(content)
+            if not content[pos + 4:end].strip(' \r'):
+                return content[start:pos + 1], content[end + 1:].strip(), 2
+            pos += 4
+    return None, content, 0
+
+def parse_yaml(text: str, first_line: int = 1) -> Dict[str, Any]:
+    """Parse a frontmatter block into a dict; first_line numbers error positions."""
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    return _Parser(text, first_line).parse_document()
+
+def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+    """Parse SKILL.md content into (frontmatter, body). Raises FrontmatterError."""
+    text, body, first_line = split_frontmatter(content)
+    if text is None:
+        return {}, body
+    return parse_yaml(text, first_line), body
+
+def as_text(value: Any) -> str:
+    """Render a frontmatter value as text for string-based checks."""
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return ', '.join(as_text(v) for v in value)
+    return str(value)
+
+def as_list(value: Any) -> List:
+    """Normalise a list-like frontmatter value (list, or comma-separated string)."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        return [v.strip() for v in value.split(',') if v.strip()]
+    return [value]
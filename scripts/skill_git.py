@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Skill Git - Map a git revision range to the skills it touched
+
+Lets validate-skill.py and score-skill.py (--changed) check only the skills
+owning a changed file, so runtime scales with the size of the change rather
+than the size of the repository. Uses the local `git` binary only.
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+class GitError(Exception):
+    """Raised when git is unavailable or the revision range is invalid."""
+
+def _git(args: List[str], cwd: Path) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=False
+        )
+    except FileNotFoundError:
+        raise GitError("git executable not found")
+    if result.returncode != 0:
+        raise GitError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout
+
+def repo_root(path: Path) -> Path:
+    """Return the top-level directory of the repository containing path."""
+    start = path if path.is_dir() else path.parent
+    return Path(_git(["rev-parse", "--show-toplevel"], start).strip()).resolve()
+
+def changed_paths(rev_range: str, root: Path) -> List[Path]:
+    """List files changed in rev_range (e.g. 'main...HEAD', 'HEAD~3..HEAD', 'HEAD').
+
+    A single revision is compared against the working tree, so local edits
+    are included.
+    """
+    output = _git(["diff", "--name-only", "-z", rev_range, "--"], root)
+    return [root / name for name in output.split('\0') if name]
+
+def owning_skill(path: Path, root: Path, cache: Dict[Path, Optional[Path]]) -> Optional[Path]:
+    """Return the nearest directory at or above path that holds a SKILL.md.
+
+    Changes under a skill's references/ or scripts/ map to the skill itself.
+    Lookups are memoised per directory, so sibling files cost one stat.
+    """
+    directory = path.parent
+    visited = []
+    owner = None
+    while True:
+        if directory in cache:
+            owner = cache[directory]
+            break
+        visited.append(directory)
+        if (directory / "SKILL.md").is_file():
+            owner = directory
+            break
+        if directory == root or directory == directory.parent:
+            break
+        directory = directory.parent
+
+    for directory in visited:
+        cache[directory] = owner
+    return owner
+
+def changed_skills(rev_range: str, roots: Iterable[str]) -> List[Path]:
+    """Return the skill directories under roots touched by rev_range."""
+    root_paths = [Path(r).resolve() for r in roots]
+    if not root_paths:
+        root_paths = [Path.cwd().resolve()]
+    # A SKILL.md root stands for its skill directory
+    root_dirs = [r.parent if r.name == "SKILL.md" else r for r in root_paths]
+
+    repo = repo_root(root_paths[0])
+    cache: Dict[Path, Optional[Path]] = {}
+    skills = set()
+
+    for path in changed_paths(rev_range, repo):
+        # Files outside every root cannot belong to a skill inside one
+        if not any(path == r or r in path.parents for r in root_dirs):
+            continue
+        skill_dir = owning_skill(path, repo, cache)
+        # The owner may lie above the root, e.g. for a root inside a skill's references/
+        if skill_dir is not None and any(skill_dir == r or r in skill_dir.parents for r in root_dirs):
+            skills.add(skill_dir)
+
+    return sorted(skills)
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Skill Hooks - Latency harness for hook and entry point scripts
+
+A hook runs as a fresh process around every matching tool call, so its
+startup cost is paid on every agent action. HookHarness runs a skill's
+scripts the way the agent would and times them:
+
+- Hooks declared in frontmatter get a synthetic tool-event payload
+  (PreToolUse/PostToolUse JSON for their tool) on stdin
+- Other executable scripts/ entry points are run with --help
+- The first run is reported as the cold start; the following runs give
+  p50/p99 latency
+- One extra run with PYTHONPROFILEIMPORTTIME=1 (the environment form of
+  -X importtime, so it follows the script's own shebang) breaks down
+  Python import time
+
+Scripts run in a scratch copy of the skill with a scratch HOME, a
+minimal environment, a timeout and (on POSIX) CPU and memory limits.
+That keeps stray writes out of the skill and your home directory; it is
+not a security boundary.
+
+Both frontmatter forms are understood:
+
+    hooks:                          hooks:
+      - type: PreToolUse              PreToolUse:
+        tool: Bash                      - matcher: Bash
+        script: scripts/check.sh          hooks:
+                                            - type: command
+                                              command: scripts/check.sh
+
+A settings-style command runs as written, split like a shell command
+line with ${CLAUDE_PLUGIN_ROOT} and other variables expanded, so
+`python3 ${CLAUDE_PLUGIN_ROOT}/scripts/check.py` times the interpreter
+starting check.py. The script it is reported under is the first word
+that names a file in the skill.
+"""
+
+import os
+import re
+import json
+import time
+import shlex
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from skill_frontmatter import as_text
+from skill_walk import SkillWalker
+
+DEFAULT_RUNS = 20
+DEFAULT_TIMEOUT = 5.0
+DEFAULT_BUDGET_MS = 200.0
+SANDBOX_MEMORY = 1024 * 1024 * 1024
+SLOWEST_IMPORTS = 5
+IMPORT_TIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)')
+# Passed through to scripts; everything else in the environment is dropped
+KEEP_ENV = ('PATH', 'LANG', 'LC_ALL', 'TERM', 'TMPDIR', 'SYSTEMROOT')
+# ${CLAUDE_PLUGIN_ROOT}/scripts/x.sh and ./scripts/x.sh name the same file
+ROOT_PREFIX_RE = re.compile(r'^(?:\$\{?\w+\}?/|\./)')
+VARIABLE_RE = re.compile(r'\$\{(\w+)\}|\$(\w+)')
+
+@dataclass
+class HookSpec:
+    """One script to time: a declared hook, or a plain scripts/ entry point.
+
+    command is the full command line of a settings-style hook; script is
+    then the file in the skill it runs, used for reporting.
+    """
+    script: str
+    event: Optional[str] = None
+    tool: Optional[str] = None
+    command: List[str] = field(default_factory=list)
+
+    @property
+    def is_hook(self) -> bool:
+        return self.event is not None
+
+@dataclass
+class HookTiming:
+    """Timings of one script; latencies in milliseconds."""
+    spec: HookSpec
+    cold_ms: Optional[float] = None
+    runs_ms: List[float] = field(default_factory=list)
+    import_ms: Optional[float] = None
+    slowest_imports: List[List] = field(default_factory=list)
+    exit_codes: List[int] = field(default_factory=list)
+    timed_out: bool = False
+    error: Optional[str] = None
+
+    @property
+    def p50_ms(self) -> Optional[float]:
+        return percentile(self.runs_ms, 50)
+
+    @property
+    def p99_ms(self) -> Optional[float]:
+        return percentile(self.runs_ms, 99)
+
+    def over_budget(self, budget_ms: float) -> bool:
+        """Failed, timed out, or p99 (the cold start if it is the only run) above budget."""
+        if self.error or self.timed_out:
+            return True
+        worst = self.p99_ms if self.runs_ms else self.cold_ms
+        return worst is not None and worst > budget_ms
+
+    def to_dict(self, budget_ms: Optional[float] = None) -> Dict:
+        output = {
+            "script": self.spec.script,
+            "event": self.spec.event,
+            "tool": self.spec.tool,
+            "cold_ms": _round(self.cold_ms),
+            "p50_ms": _round(self.p50_ms),
+            "p99_ms": _round(self.p99_ms),
+            "runs": len(self.runs_ms),
+            "import_ms": _round(self.import_ms),
+            "slowest_imports": self.slowest_imports,
+            "exit_codes": sorted(set(self.exit_codes)),
+            "timed_out": self.timed_out,
+        }
+        if self.spec.command:
+            output["command"] = self.spec.command
+        if self.error:
+            output["error"] = self.error
+        if budget_ms is not None and self.spec.is_hook:
+            output["over_budget"] = self.over_budget(budget_ms)
+        return output
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+def split_command(command: str) -> List[str]:
+    try:
+        return shlex.split(command)
+    except ValueError:  # unbalanced quotes
+        return command.split()
+
+def command_script(command: List[str], skill_dir: Optional[Path] = None) -> str:
+    """The file in the skill a hook command runs, skipping interpreters and options.
+
+    With skill_dir, the first word naming a file there; otherwise (or if
+    none does) the first word under the plugin root or with a relative
+    path, and failing that the program itself.
+    """
+    words = [(ROOT_PREFIX_RE.sub('', word), word) for word in command if not word.startswith('-')]
+    if skill_dir is not None:
+        for word, _ in words:
+            if not os.path.isabs(word) and (Path(skill_dir) / word).is_file():
+                return word
+    for word, original in words:
+        if _names_skill_file(word, original):
+            return word
+    return ROOT_PREFIX_RE.sub('', command[0])
+
+def _names_skill_file(word: str, original: str) -> bool:
+    # Under the plugin root, or a relative path rather than a program looked up on PATH
+    return word != original or ('/' in word and not os.path.isabs(word))
+
+def declared_hooks(frontmatter: Dict, skill_dir: Optional[Path] = None) -> List[HookSpec]:
+    """Hooks from frontmatter, in either supported form.
+
+    skill_dir, when given, is used to find which word of a hook command
+    names the skill's script.
+    """
+    hooks = frontmatter.get('hooks')
+    specs = []
+    if isinstance(hooks, list):
+        for hook in hooks:
+            if isinstance(hook, dict) and hook.get('script'):
+                specs.append(HookSpec(as_text(hook['script']), as_text(hook.get('type')) or None,
+                                      as_text(hook.get('tool')) or None))
+    elif isinstance(hooks, dict):
+        for event, matchers in hooks.items():
+            for matcher in matchers if isinstance(matchers, list) else []:
+                if not isinstance(matcher, dict):
+                    continue
+                for hook in matcher.get('hooks') or []:
+                    command = as_text(hook.get('command')) if isinstance(hook, dict) else ''
+                    words = split_command(command)
+                    if words:
+                        specs.append(HookSpec(command_script(words, skill_dir), str(event),
+                                              as_text(matcher.get('matcher')) or None, words))
+    for spec in specs:
+        spec.script = ROOT_PREFIX_RE.sub('', spec.script)
+    return specs
+
+def entry_points(skill_dir: Path, hooks: List[HookSpec]) -> List[HookSpec]:
+    """Executable files under scripts/ that are not already declared as hooks."""
+    hooked = {spec.script for spec in hooks}
+    specs = []
+    scripts = skill_dir / "scripts"
+    if scripts.is_dir():
+        for rel, entry in SkillWalker(scripts).walk():
+            script = f"scripts/{rel}"
+            if script not in hooked and os.access(entry.path, os.X_OK):
+                specs.append(HookSpec(script))
+    return specs
+
+def synthetic_payload(spec: HookSpec, sandbox: Path) -> Dict:
+    """A tool-event payload shaped like the one the agent sends a hook on stdin."""
+    tool = spec.tool if spec.tool and re.fullmatch(r'\w+', spec.tool) else 'Bash'
+    target = str(sandbox / "example.py")
+    tool_input = {
+        'Bash': {"command": "ls -la", "description": "List files"},
+        'Read': {"file_path": target},
+        'Write': {"file_path": target, "content": "print('hello')\n"},
+        'Edit': {"file_path": target, "old_string": "hello", "new_string": "world"},
+        'Glob': {"pattern": "**/*.py"},
+        'Grep': {"pattern": "TODO", "path": str(sandbox)},
+    }.get(tool, {})
+    payload = {
+        "session_id": "00000000-0000-0000-0000-000000000000",
+        "transcript_path": str(sandbox / "transcript.jsonl"),
+        "cwd": str(sandbox),
+        "hook_event_name": spec.event,
+        "tool_name": tool,
+        "tool_input": tool_input,
+    }
+    if spec.event == 'PostToolUse':
+        payload["tool_response"] = {"success": True, "output": "ok\n"}
+    return payload
+
+def parse_import_times(stderr: str, top: int = SLOWEST_IMPORTS):
+    """Total import time (ms) and the slowest top-level imports from -X importtime output."""
+    total_us = 0
+    top_level = []
+    for line in stderr.splitlines():
+        match = IMPORT_TIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        total_us += int(self_us)
+        if len(indent) == 1:
+            top_level.append([module, round(int(cumulative_us) / 1000, 2)])
+    if not total_us:
+        return None, []
+    top_level.sort(key=lambda item: -item[1])
+    return total_us / 1000, top_level[:top]
+
+class HookHarness:
+    """Time a skill's hooks and entry points in a scratch copy of the skill."""
+
+    def __init__(self, skill_dir: Path, runs: int = DEFAULT_RUNS, timeout: float = DEFAULT_TIMEOUT,
+                 memory: Optional[int] = SANDBOX_MEMORY):
+        self.skill_dir = Path(skill_dir)
+        self.runs = max(0, runs)
+        self.timeout = timeout
+        self.memory = memory
+
+    def _limits(self):
+        # Runs in the child between fork and exec
+        cpu = int(self.timeout) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+        if self.memory:
+            resource.setrlimit(resource.RLIMIT_AS, (self.memory, self.memory))
+
+    def _environment(self, sandbox: Path, home: Path) -> Dict[str, str]:
+        env = {key: os.environ[key] for key in KEEP_ENV if key in os.environ}
+        env.update(HOME=str(home), CLAUDE_PROJECT_DIR=str(sandbox), CLAUDE_PLUGIN_ROOT=str(sandbox))
+        return env
+
+    def _run(self, spec: HookSpec, sandbox: Path, env: Dict[str, str], stdin: bytes):
+        """One invocation: (elapsed ms, exit code, stderr) or raises subprocess.TimeoutExpired."""
+        if spec.command:
+            # Expanded as the shell would, from the sandbox environment
+            args = [VARIABLE_RE.sub(lambda m: env.get(m.group(1) or m.group(2), m.group(0)), word)
+                    for word in spec.command]
+        else:
+            args = [str(sandbox / spec.script)] + ([] if spec.is_hook else ['--help'])
+        preexec = self._limits if resource is not None else None
+        start = time.perf_counter()
+        proc = subprocess.run(args, input=stdin, cwd=sandbox, env=env, timeout=self.timeout,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, preexec_fn=preexec)
+        elapsed = (time.perf_counter() - start) * 1000
+        return elapsed, proc.returncode, proc.stderr.decode('utf-8', 'replace')
+
+    def time_script(self, spec: HookSpec, sandbox: Path, env: Dict[str, str]) -> HookTiming:
+        timing = HookTiming(spec)
+        path = sandbox / spec.script
+        # A command may start with an interpreter, or be a program on PATH
+        runs_script = True
+        in_skill = True
+        if spec.command:
+            program = spec.command[0]
+            runs_script = ROOT_PREFIX_RE.sub('', program) == spec.script
+            in_skill = not runs_script or path.is_file() or _names_skill_file(spec.script, program)
+        if in_skill and not path.is_file():
+            timing.error = f"{spec.script} not found"
+            return timing
+        if in_skill and runs_script and not os.access(path, os.X_OK):
+            timing.error = f"{spec.script} is not executable"
+            return timing
+        stdin = json.dumps(synthetic_payload(spec, sandbox)).encode() if spec.is_hook else b''
+        try:
+            timing.cold_ms, code, _ = self._run(spec, sandbox, env, stdin)
+            timing.exit_codes.append(code)
+            for _ in range(self.runs):
+                elapsed, code, _ = self._run(spec, sandbox, env, stdin)
+                timing.runs_ms.append(elapsed)
+                timing.exit_codes.append(code)
+            _, _, stderr = self._run(spec, sandbox, dict(env, PYTHONPROFILEIMPORTTIME='1'), stdin)
+            timing.import_ms, timing.slowest_imports = parse_import_times(stderr)
+        except subprocess.TimeoutExpired:
+            timing.timed_out = True
+        except OSError as e:
+            timing.error = f"{spec.script}: {e.strerror or e}"
+        return timing
+
+    def run(self, specs: List[HookSpec]) -> List[HookTiming]:
+        """Time each script, one at a time so they do not skew each other."""
+        with tempfile.TemporaryDirectory(prefix="skill-hooks-") as scratch:
+            sandbox = Path(scratch) / self.skill_dir.name
+            home = Path(scratch) / "home"
+            shutil.copytree(self.skill_dir, sandbox, symlinks=True)
+            home.mkdir()
+            env = self._environment(sandbox, home)
+            return [self.time_script(spec, sandbox, env) for spec in specs]
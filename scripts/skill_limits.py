@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Skill Limits - Per-skill resource guardrails for batch runs
+
+One pathological skill (a 2 GB SKILL.md, a million-line file, a check
+that never returns) should cost a batch run one error record, not the
+run. ResourceLimits bounds each skill's:
+
+- file size:  SKILL.md is sized (stat, or a zip's central directory) before
+              it is read, and an oversized file is not read at all
+- line count: large files are counted in streamed chunks, stopping at the
+              limit, before anything is read into memory
+- wall time:  work that misses the deadline is reported. Without a memory
+              limit it is only abandoned: its thread keeps running (and
+              holding the GIL) until it returns, because Python threads
+              cannot be stopped. With a memory limit it is killed
+- memory:     with a memory limit, each skill runs in a forked process
+              whose address space is capped with RLIMIT_AS
+
+A skill over a limit raises ResourceLimitExceeded; its to_dict() is the
+record validate-skill.py and score-skill.py emit instead of a report.
+"""
+
+import os
+import re
+import pickle
+import select
+import signal
+import time
+import argparse
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from skill_tree import SkillTree
+
+COUNT_CHUNK = 1024 * 1024
+# Files larger than this are line-counted from disk before being read
+STREAM_THRESHOLD = 1024 * 1024
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'KB': 1024, 'M': 1024 ** 2, 'MB': 1024 ** 2, 'G': 1024 ** 3, 'GB': 1024 ** 3}
+# Forked workers need both fork() and setrlimit()
+ISOLATION = hasattr(os, 'fork') and resource is not None
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as 500000, 512K or 10MB (binary units)."""
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*', text)
+    if not match or match.group(2).upper() not in SIZE_UNITS:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r} (use e.g. 500K, 10MB)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2).upper()])
+
+@dataclass
+class ResourceLimits:
+    """Per-skill limits; 0 or None disables a limit."""
+    max_bytes: int = 4 * 1024 * 1024
+    max_lines: int = 50000
+    max_seconds: float = 30.0
+    max_memory: Optional[int] = None
+
+class ResourceLimitExceeded(Exception):
+    """A skill went over one of its ResourceLimits."""
+
+    def __init__(self, limit: str, maximum, value=None, **details):
+        self.limit = limit
+        self.maximum = maximum
+        self.value = value
+        self.details = details
+        measured = f"{value} > {maximum}" if value is not None else f"max {maximum}"
+        super().__init__(f"resource limit exceeded: {limit} ({measured})")
+
+    def __reduce__(self):
+        # Raised in forked workers and re-raised in the parent
+        return _rebuild_limit, (self.limit, self.maximum, self.value, self.details)
+
+    def to_dict(self, skill_path) -> Dict:
+        record = {
+            "skill_path": str(skill_path),
+            "error": "resource limit exceeded",
+            "limit": self.limit,
+            "max": self.maximum,
+        }
+        if self.value is not None:
+            record["value"] = self.value
+        record.update(self.details)
+        return record
+
+def _rebuild_limit(limit, maximum, value, details) -> ResourceLimitExceeded:
+    return ResourceLimitExceeded(limit, maximum, value, **details)
+
+def count_lines(tree: SkillTree, rel: str, stop_after: Optional[int] = None) -> int:
+    """Lines in a file (newlines + 1, like len(text.split('\\n'))), read in chunks.
+
+    With stop_after, counting stops once the count exceeds it.
+    """
+    count = 1
+    with tree.open(rel) as f:
+        while True:
+            chunk = f.read(COUNT_CHUNK)
+            if not chunk:
+                return count
+            count += chunk.count(b'\n')
+            if stop_after is not None and count > stop_after:
+                return count
+
+def check_file(tree: SkillTree, rel: str, limits: ResourceLimits):
+    """Check a file against the size and line limits before it is read.
+
+    Works for trees that know a file's size up front (on disk, or from a
+    zip's central directory); in-memory trees are checked after reading,
+    by check_content().
+    """
+    size = tree.file_size(rel)
+    if size is None:
+        return  # Reading reports any error
+    if limits.max_bytes and size > limits.max_bytes:
+        raise ResourceLimitExceeded("file_size", limits.max_bytes, size, file=rel)
+    if limits.max_lines and size > STREAM_THRESHOLD:
+        lines = count_lines(tree, rel, limits.max_lines)
+        if lines > limits.max_lines:
+            raise ResourceLimitExceeded("line_count", limits.max_lines, lines, file=rel)
+
+def check_content(content: str, limits: ResourceLimits, rel: str = "SKILL.md"):
+    """Check already-read text against the size and line limits.
+
+    The size is counted in UTF-8 bytes, as check_file() counts it on disk.
+    """
+    # A character is 1 to 4 UTF-8 bytes, so only text that may be over is encoded
+    if limits.max_bytes and len(content) * 4 > limits.max_bytes:
+        size = len(content.encode('utf-8', 'surrogatepass'))
+        if size > limits.max_bytes:
+            raise ResourceLimitExceeded("file_size", limits.max_bytes, size, file=rel)
+    if limits.max_lines:
+        lines = content.count('\n') + 1
+        if lines > limits.max_lines:
+            raise ResourceLimitExceeded("line_count", limits.max_lines, lines, file=rel)
+
+def run_limited(func: Callable[[], Any], limits: ResourceLimits) -> Any:
+    """Call func under the wall time (and, if set, memory) limit.
+
+    Without a memory limit func runs on a helper thread; a thread cannot
+    be interrupted, so one that misses the deadline is left running in
+    the background while the caller moves on. With a memory limit func
+    runs in a forked child, which is killed at the deadline; its return
+    value must be picklable and its side effects stay in the child.
+    """
+    if limits.max_memory:
+        return _run_forked(func, limits)
+    if not limits.max_seconds:
+        return func()
+
+    outcome: Dict[str, Any] = {}
+
+    def target():
+        try:
+            outcome["value"] = func()
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(limits.max_seconds)
+    if thread.is_alive():
+        raise ResourceLimitExceeded("wall_time", limits.max_seconds)
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["value"]
+
+def _address_space() -> int:
+    """Current virtual memory size of this process, or 0 if unknown."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+def _run_forked(func: Callable[[], Any], limits: ResourceLimits) -> Any:
+    if not ISOLATION:
+        raise RuntimeError("memory limits need fork() and setrlimit(), unavailable on this platform")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # Child: the limit is on top of what the interpreter already maps
+        os.close(read_fd)
+        status = 0
+        try:
+            cap = _address_space() + limits.max_memory
+            resource.setrlimit(resource.RLIMIT_AS, (cap, cap))
+            try:
+                payload = ("value", func())
+            except MemoryError:
+                payload = ("memory", None)
+            except Exception as e:
+                payload = ("error", e)
+            try:
+                data = pickle.dumps(payload)
+            except Exception as e:
+                data = pickle.dumps(("error", RuntimeError(f"unpicklable result: {e}")))
+            with os.fdopen(write_fd, 'wb') as out:
+                out.write(data)
+        except BaseException:
+            status = 1
+        finally:
+            os._exit(status)
+
+    os.close(write_fd)
+    chunks = []
+    timed_out = False
+    with os.fdopen(read_fd, 'rb') as pipe:
+        deadline = time.monotonic() + limits.max_seconds if limits.max_seconds else None
+        while True:
+            wait = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            ready, _, _ = select.select([pipe], [], [], wait)
+            if not ready:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                break
+            chunk = os.read(pipe.fileno(), COUNT_CHUNK)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    _, status = os.waitpid(pid, 0)
+
+    if timed_out:
+        raise ResourceLimitExceeded("wall_time", limits.max_seconds)
+    if not chunks:
+        # Killed or crashed before reporting: most often an allocation the
+        # interpreter could not turn into a MemoryError
+        raise ResourceLimitExceeded("memory", limits.max_memory, exit_status=status)
+    kind, value = pickle.loads(b''.join(chunks))
+    if kind == "memory":
+        raise ResourceLimitExceeded("memory", limits.max_memory)
+    if kind == "error":
+        raise value
+    return value
+
+def add_limit_arguments(parser: argparse.ArgumentParser):
+    """Add the per-skill limit options shared by the validator and scorer."""
+    defaults = ResourceLimits()
+    parser.add_argument(
+        "--max-bytes",
+        type=parse_size,
+        default=defaults.max_bytes,
+        metavar="SIZE",
+        help="Report a SKILL.md larger than SIZE instead of reading it (default: 4MB, 0 for no limit)"
+    )
+    parser.add_argument(
+        "--max-lines",
+        type=int,
+        default=defaults.max_lines,
+        metavar="N",
+        help=f"Report a SKILL.md longer than N lines (default: {defaults.max_lines}, 0 for no limit)"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=defaults.max_seconds,
+        metavar="SECONDS",
+        help="Report a skill as timed out after SECONDS, per stage with --ndjson (default: 30, 0 for no limit). "
+             "A hung check is only abandoned and keeps running in the background; with --max-memory it is killed"
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=parse_size,
+        metavar="SIZE",
+        help="Run each skill in a forked process allowed SIZE of memory (not with --ndjson)"
+    )
+
+def limits_from_args(parser: argparse.ArgumentParser, args) -> ResourceLimits:
+    if args.max_memory and args.ndjson:
+        parser.error("--max-memory forks a process per skill and cannot be combined with --ndjson")
+    if args.max_memory and not ISOLATION:
+        parser.error("--max-memory needs fork() and setrlimit(), unavailable on this platform")
+    return ResourceLimits(args.max_bytes, args.max_lines, args.timeout, args.max_memory)
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Skill Links - Link and anchor checking across SKILL.md and references/
+
+Builds a link graph over SKILL.md and every markdown file under references/,
+resolving relative links and heading anchors. Files are scanned through mmap
+rather than read whole, and each file's outgoing links and headings are
+cached by content hash so re-checks only rescan files that changed.
+
+The same graph drives reachability analysis: files under references/ and
+scripts/ that SKILL.md cannot reach, directly or transitively, are dead
+weight in a package. Reachable Python scripts extend the graph through
+their imports of sibling modules, so helpers a shipped script needs are
+never counted as dead.
+"""
+
+import os
+import sys
+import re
+import ast
+import json
+import mmap
+import hashlib
+import tempfile
+import posixpath
+import threading
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote
+
+from skill_tree import DiskTree, SkillTree
+
+CACHE_VERSION = 1
+MAX_CACHE_ENTRIES = 20000
+
+# Patterns run directly over the mapped bytes
+LINK_RE = re.compile(rb'!?\[[^\]\n]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"\n]*")?\s*\)')
+HEADING_RE = re.compile(rb'^ {0,3}(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$', re.MULTILINE)
+FENCE_RE = re.compile(rb'^ {0,3}(```|~~~)', re.MULTILINE)
+HTML_ANCHOR_RE = re.compile(rb'<a\s+(?:name|id)="([^"]+)"', re.IGNORECASE)
+MENTION_RE = re.compile(rb'(?<![\w/.-])((?:references|scripts)/[\w./-]+\w)')
+# A sibling script named in a string, e.g. load_script("validate-skill.py")
+SCRIPT_NAME_RE = re.compile(r'[\w.-]+\.py')
+
+def python_imports(source: bytes) -> Set[str]:
+    """Module paths (a/b for a.b) a Python file imports, plus .py file names it names in strings.
+
+    Relative imports are returned with one leading '.' per level. A file
+    that does not parse imports nothing.
+    """
+    try:
+        module = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return set()
+    names = set()
+    for node in ast.walk(module):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.replace('.', '/') for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = '.' * node.level + (node.module or '').replace('.', '/')
+            names.add(base)
+            # from pkg import submodule
+            names.update(posixpath.join(base, alias.name) if node.module else base + alias.name
+                         for alias in node.names)
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) \
+                and SCRIPT_NAME_RE.fullmatch(node.value):
+            names.add(node.value)
+    return names
+
+def slugify(heading: str) -> str:
+    """GitHub-style anchor for a heading."""
+    text = re.sub(r'`|\*\*|__|\[([^\]]*)\]\([^)]*\)', r'\1', heading.strip().lower())
+    text = re.sub(r'[^\w\- ]', '', text)
+    return text.replace(' ', '-')
+
+@dataclass
+class FileLinks:
+    """Outgoing links, anchors and path mentions of one markdown file."""
+    links: List[Tuple[str, int]] = field(default_factory=list)
+    anchors: Set[str] = field(default_factory=set)
+    mentions: Set[str] = field(default_factory=set)
+
+    def to_dict(self) -> Dict:
+        return {
+            "links": self.links,
+            "anchors": sorted(self.anchors),
+            "mentions": sorted(self.mentions),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "FileLinks":
+        return cls(
+            [tuple(link) for link in data.get("links", [])],
+            set(data.get("anchors", [])),
+            set(data.get("mentions", [])),
+        )
+
+def _fenced_spans(buf) -> List[Tuple[int, int]]:
+    """Byte ranges covered by fenced code blocks."""
+    spans = []
+    start = None
+    marker = None
+    for match in FENCE_RE.finditer(buf):
+        if start is None:
+            start, marker = match.start(), match.group(1)
+        elif match.group(1) == marker:
+            spans.append((start, match.end()))
+            start = None
+    if start is not None:
+        spans.append((start, len(buf)))
+    return spans
+
+def _outside(spans: List[Tuple[int, int]], pos: int, cursor: List[int]) -> bool:
+    """True if pos lies outside every span; positions must be non-decreasing."""
+    i = cursor[0]
+    while i < len(spans) and spans[i][1] <= pos:
+        i += 1
+    cursor[0] = i
+    return not (i < len(spans) and spans[i][0] <= pos)
+
+def scan_buffer(buf) -> FileLinks:
+    """Extract links, anchors and mentions from markdown bytes (or an mmap)."""
+    result = FileLinks()
+    spans = _fenced_spans(buf)
+
+    cursor = [0]
+    line = 1
+    last = 0
+    for match in LINK_RE.finditer(buf):
+        if not _outside(spans, match.start(), cursor):
+            continue
+        line += buf[last:match.start()].count(b'\n')
+        last = match.start()
+        target = match.group(1).decode('utf-8', 'replace')
+        result.links.append((target, line))
+
+    cursor = [0]
+    seen: Dict[str, int] = {}
+    for match in HEADING_RE.finditer(buf):
+        if not _outside(spans, match.start(), cursor):
+            continue
+        slug = slugify(match.group(2).decode('utf-8', 'replace'))
+        if slug in seen:
+            seen[slug] += 1
+            result.anchors.add(f"{slug}-{seen[slug]}")
+        else:
+            seen[slug] = 0
+            result.anchors.add(slug)
+
+    for match in HTML_ANCHOR_RE.finditer(buf):
+        result.anchors.add(match.group(1).decode('utf-8', 'replace'))
+
+    for match in MENTION_RE.finditer(buf):
+        result.mentions.add(match.group(1).decode('utf-8', 'replace'))
+
+    return result
+
+def default_cache_path() -> Path:
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'skill-factory' / 'links.json'
+
+class LinkCache:
+    """Per-file scan results keyed by SHA-256 of the content.
+
+    A stat index (path -> size, mtime, digest) lets unchanged files skip
+    hashing entirely; changed files are hashed through their mapping and only
+    rescanned if the digest is new. Safe to share between threads.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self.entries: Dict[str, Dict] = {}
+        self.stats: Dict[str, List] = {}
+        self.used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "LinkCache":
+        cache = cls(path or default_cache_path())
+        try:
+            with open(cache.path) as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                cache.entries = data.get("entries", {})
+                cache.stats = data.get("stats", {})
+        except (OSError, ValueError):
+            pass
+        return cache
+
+    def save(self) -> bool:
+        """Write the cache back if anything changed.
+
+        The cache only saves time, so a directory that cannot be written
+        (read-only home, sandboxed CI) gets a warning on stderr rather than
+        an exception; returns False in that case.
+        """
+        if not self.path or not self._dirty:
+            return True
+        with self._lock:
+            entries = self.entries
+            if len(entries) > MAX_CACHE_ENTRIES:
+                entries = {k: v for k, v in entries.items() if k in self.used}
+            stats = {p: s for p, s in self.stats.items() if s[2] in entries}
+            data = {"version": CACHE_VERSION, "entries": entries, "stats": stats}
+        tmp_name = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name)
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_name, self.path)
+        except OSError as e:
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+            print(f"Warning: link cache not saved ({e}); use --link-cache or --no-link-cache",
+                  file=sys.stderr)
+            return False
+        return True
+
+    def scan(self, path: Path) -> FileLinks:
+        """Return the scan of path, reusing cached results when possible."""
+        st = path.stat()
+        key = str(path)
+        with self._lock:
+            stat = self.stats.get(key)
+            if stat and stat[0] == st.st_size and stat[1] == st.st_mtime_ns and stat[2] in self.entries:
+                self.hits += 1
+                self.used.add(stat[2])
+                return FileLinks.from_dict(self.entries[stat[2]])
+
+        digest, links = scan_file(path, self._lookup)
+        with self._lock:
+            if digest not in self.entries:
+                self.entries[digest] = links.to_dict()
+            self.stats[key] = [st.st_size, st.st_mtime_ns, digest]
+            self.used.add(digest)
+            self._dirty = True
+        return links
+
+    def _lookup(self, digest: str) -> Optional[FileLinks]:
+        with self._lock:
+            entry = self.entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return FileLinks.from_dict(entry)
+
+def scan_file(path: Path, lookup=None) -> Tuple[str, FileLinks]:
+    """Hash and scan a file through mmap; lookup(digest) may short-circuit the scan."""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            digest = hashlib.sha256(b'').hexdigest()
+            return digest, FileLinks()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            digest = hashlib.sha256(mm).hexdigest()
+            cached = lookup(digest) if lookup else None
+            if cached is not None:
+                return digest, cached
+            return digest, scan_buffer(mm)
+
+class LinkGraph:
+    """Link graph over SKILL.md and the markdown files under references/.
+
+    Files are addressed by POSIX paths relative to the skill root, so the
+    same graph works over a DiskTree or an in-memory MemoryTree.
+    """
+
+    def __init__(self, skill: Union[str, Path, SkillTree], cache: Optional[LinkCache] = None):
+        self.tree = skill if isinstance(skill, SkillTree) else DiskTree(skill)
+        self.cache = cache
+        self.files: Dict[str, FileLinks] = {}
+
+    def _scan(self, rel: str) -> FileLinks:
+        if rel not in self.files:
+            root = self.tree.root
+            if root is None:
+                self.files[rel] = scan_buffer(self.tree.read_bytes(rel))
+            elif self.cache is not None:
+                self.files[rel] = self.cache.scan(root / rel)
+            else:
+                self.files[rel] = scan_file(root / rel)[1]
+        return self.files[rel]
+
+    def markdown_files(self) -> List[str]:
+        files = ["SKILL.md"] + [f for f in self.tree.walk_files("references") if f.endswith('.md')]
+        return [f for f in files if self.tree.is_file(f)]
+
+    def build(self) -> "LinkGraph":
+        for rel in self.markdown_files():
+            self._scan(rel)
+        return self
+
+    @staticmethod
+    def inside(rel: str) -> bool:
+        """True if a normalised relative path stays inside the skill."""
+        return rel not in ('.', '..') and not rel.startswith('../') and not rel.startswith('/')
+
+    def resolve(self, source: str, target: str) -> Optional[Tuple[str, str]]:
+        """Resolve a link target to (file, anchor); None for external links."""
+        if re.match(r'^[a-zA-Z][\w+.-]*:', target) or target.startswith('//'):
+            return None
+        path_part, _, anchor = target.partition('#')
+        path_part = unquote(path_part.split('?', 1)[0])
+        if not path_part:
+            return source, anchor
+        if '{{' in path_part:
+            return None
+        if path_part.startswith('/'):
+            return posixpath.normpath(path_part.lstrip('/') or '.'), anchor
+        return posixpath.normpath(posixpath.join(posixpath.dirname(source), path_part)), anchor
+
+    def outgoing(self, source: str) -> List[str]:
+        """Files a markdown file points at, via links or plain path mentions."""
+        links = self._scan(source)
+        targets = []
+        for target, _ in links.links:
+            resolved = self.resolve(source, target)
+            if resolved is not None:
+                targets.append(resolved[0])
+        for mention in links.mentions:
+            # Mentions are usually relative to the skill root, sometimes to the file
+            targets.append(mention)
+            targets.append(posixpath.join(posixpath.dirname(source), mention))
+        return [posixpath.normpath(t) for t in targets]
+
+    def imported(self, source: str) -> List[str]:
+        """Files in the skill a Python file imports: sibling modules and packages, relative imports."""
+        directory = posixpath.dirname(source)
+        targets = []
+        for name in python_imports(self.tree.read_bytes(source)):
+            if name.endswith('.py'):
+                targets.append(posixpath.join(directory, name))
+                continue
+            level = len(name) - len(name.lstrip('.'))
+            base = directory
+            for _ in range(max(level - 1, 0)):
+                base = posixpath.dirname(base)
+            module = posixpath.join(base, name.lstrip('.')) if name.lstrip('.') else base
+            targets.append(module + '.py')
+            if module and self.tree.is_dir(module):
+                targets.append(module)
+        return [posixpath.normpath(t) for t in targets]
+
+    def reachable(self) -> Set[str]:
+        """Every file reachable from SKILL.md by following links, mentions and Python imports."""
+        start = "SKILL.md"
+        seen = {start}
+        stack = [start]
+        while stack:
+            source = stack.pop()
+            if not self.tree.is_file(source):
+                continue
+            if source.endswith('.py'):
+                targets = self.imported(source)
+            elif source.endswith('.md'):
+                targets = self.outgoing(source)
+            else:
+                continue
+            for target in targets:
+                if not self.inside(target):
+                    continue
+                found = self.tree.walk_files(target) if self.tree.is_dir(target) else [target]
+                for rel in found:
+                    if rel not in seen and self.tree.is_file(rel):
+                        seen.add(rel)
+                        stack.append(rel)
+        return seen
+
+    def check(self) -> List[str]:
+        """Return one issue per broken link or missing anchor."""
+        issues = []
+        for source, links in list(self.files.items()):
+            for target, line in links.links:
+                resolved = self.resolve(source, target)
+                if resolved is None:
+                    continue
+                rel, anchor = resolved
+                if not self.inside(rel) and self.tree.root is None:
+                    # Nothing outside a virtual tree can be checked
+                    continue
+                if not self.tree.exists(rel):
+                    issues.append(f"Broken link in {source}:{line}: {target} (file not found)")
+                    continue
+                if anchor and rel.endswith('.md') and self.tree.is_file(rel):
+                    anchors = self._scan(rel).anchors
+                    if anchor not in anchors and anchor.lower() not in anchors:
+                        issues.append(f"Broken link in {source}:{line}: {target} (anchor not found)")
+        return issues
+
+def check_links(skill: Union[str, Path, SkillTree], cache: Optional[LinkCache] = None) -> List[str]:
+    """Check every relative link and anchor in a skill's markdown files."""
+    return LinkGraph(skill, cache).build().check()
+
+def unreachable_files(skill_path: Path, files: List[Path],
+                      cache: Optional[LinkCache] = None) -> List[Tuple[Path, int]]:
+    """Return (path, size) for files under references/ or scripts/ that SKILL.md never reaches."""
+    skill_path = Path(skill_path)
+    reachable = LinkGraph(skill_path, cache).reachable()
+    dead = []
+    for path in files:
+        rel = path.relative_to(skill_path)
+        if rel.parts[0] not in ('references', 'scripts') or len(rel.parts) < 2:
+            continue
+        if rel.as_posix() not in reachable:
+            dead.append((path, path.stat().st_size))
+    return sorted(dead, key=lambda item: (-item[1], str(item[0])))
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Skill Metrics - OpenMetrics text file for a validation, scoring or packaging run
+
+--metrics FILE on validate-skill.py, score-skill.py and package-skill.py
+writes what the run did as an OpenMetrics text file, for a node-exporter
+textfile collector (or anything else that reads the format) to pick up.
+Nothing is served and nothing is sent anywhere.
+
+Every value describes the last run only and is replaced by the next one,
+so counts are gauges rather than counters, and histograms start empty each
+run. That also keeps the file readable by the older Prometheus text parser
+the textfile collector uses. Every sample carries a tool label
+(validate, score or package); give each tool its own file.
+
+The file is written to a temporary name and renamed into place, so a
+collector never reads it half-written.
+"""
+
+import os
+import time
+import tempfile
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PREFIX = "skill_factory_"
+# Score and category percentages, 0-100
+SCORE_BUCKETS = (10, 20, 30, 40, 50, 60, 70, 80, 90, 100)
+# Package sizes, 1 KiB to 16 MiB
+SIZE_BUCKETS = tuple(1024 * 4 ** n for n in range(8))
+
+# name -> (type, help); a name ending in _seconds or _bytes gets that unit
+FAMILIES = {
+    "skills_processed": ("gauge", "Skills handled by the last run, by result"),
+    "check_results": ("gauge", "Validation check outcomes in the last run"),
+    "check_duration_seconds": ("gauge", "Time spent in each validation check in the last run"),
+    "score": ("histogram", "Total quality scores in the last run"),
+    "score_category_percent": ("histogram", "Quality score category percentages in the last run"),
+    "package_size_bytes": ("histogram", "Sizes of the packages written by the last run"),
+    "phase_duration_seconds": ("gauge", "Time spent in each phase of the last run"),
+    "cache_hits": ("gauge", "Cache lookups answered from the cache in the last run"),
+    "cache_misses": ("gauge", "Cache lookups that had to compute the value in the last run"),
+    "run_duration_seconds": ("gauge", "Wall time of the last run"),
+    "last_run_timestamp_seconds": ("gauge", "Unix time the last run finished"),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+def escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{escape(value)}"' for key, value in labels) + "}"
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(round(value, 6))
+
+class _Histogram:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+
+class Metrics:
+    """The metrics of one run. Safe to update from several threads."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.started = time.time()
+        self._values: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: Dict[str, str]) -> Labels:
+        return (("tool", self.tool),) + tuple((key, str(value)) for key, value in labels.items())
+
+    def add(self, name: str, amount: float = 1, **labels):
+        """Add amount to a gauge."""
+        key = self._labels(labels)
+        with self._lock:
+            samples = self._values.setdefault(name, {})
+            samples[key] = samples.get(key, 0) + amount
+
+    def set(self, name: str, value: float, **labels):
+        key = self._labels(labels)
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, buckets: Tuple[float, ...], **labels):
+        """Count value into a histogram."""
+        key = self._labels(labels)
+        with self._lock:
+            histogram = self._histograms.setdefault(name, {}).get(key)
+            if histogram is None:
+                histogram = self._histograms[name][key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to phase_duration_seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add("phase_duration_seconds", time.perf_counter() - start, phase=name)
+
+    def cache(self, name: str, cache):
+        """Record the hits and misses of a cache with .hits and .misses."""
+        if cache is not None:
+            self.set("cache_hits", cache.hits, cache=name)
+            self.set("cache_misses", cache.misses, cache=name)
+
+    def render(self) -> str:
+        """The metrics as OpenMetrics text, ending with # EOF."""
+        now = time.time()
+        self.set("run_duration_seconds", now - self.started)
+        self.set("last_run_timestamp_seconds", now)
+        lines: List[str] = []
+        with self._lock:
+            for name, (kind, help_text) in FAMILIES.items():
+                full = PREFIX + name
+                values = self._values.get(name)
+                histograms = self._histograms.get(name)
+                if not values and not histograms:
+                    continue
+                lines.append(f"# TYPE {full} {kind}")
+                for unit in ("seconds", "bytes"):
+                    if name.endswith("_" + unit):
+                        lines.append(f"# UNIT {full} {unit}")
+                lines.append(f"# HELP {full} {help_text}")
+                for labels, value in sorted((values or {}).items()):
+                    lines.append(f"{full}{format_labels(labels)} {format_value(value)}")
+                for labels, histogram in sorted((histograms or {}).items()):
+                    for bound, count in zip(histogram.buckets + (float('inf'),),
+                                            histogram.counts + [histogram.count]):
+                        bucket = labels + (("le", format_value(bound)),)
+                        lines.append(f"{full}_bucket{format_labels(bucket)} {count}")
+                    lines.append(f"{full}_count{format_labels(labels)} {histogram.count}")
+                    lines.append(f"{full}_sum{format_labels(labels)} {format_value(histogram.sum)}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Optional[str]):
+        """Replace the file at path with the rendered metrics; does nothing without a path."""
+        if not path:
+            return
+        target = Path(path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name)
+        with os.fdopen(fd, 'w') as f:
+            f.write(self.render())
+        # Readable by a collector running as another user
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, target)
+
+def add_metrics_argument(parser):
+    """Add --metrics FILE."""
+    parser.add_argument(
+        "--metrics",
+        metavar="FILE",
+        help="Write run metrics to FILE in OpenMetrics text format (e.g. for a node-exporter textfile collector)"
+    )
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Skill Pipeline - Streaming batch processing for large skill corpora
+
+Runs discovery -> read -> parse -> check -> emit as separate stages joined by
+bounded queues, so memory stays flat regardless of corpus size. Each result is
+written as one NDJSON line as soon as it is ready.
+
+Used by validate-skill.py and score-skill.py (--ndjson).
+"""
+
+import sys
+import json
+import queue
+import threading
+from pathlib import Path
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TextIO
+
+from skill_limits import ResourceLimitExceeded, ResourceLimits, run_limited
+from skill_walk import find_skills
+
+_DONE = object()
+
+def discover_skills(roots: Iterable[str]) -> Iterator[Path]:
+    """Yield every SKILL.md under the given roots (see skill_walk.find_skills).
+
+    Packaged skills given as .zip roots are yielded as they are, to be read
+    in place.
+    """
+    for root in roots:
+        path = Path(root)
+        if path.suffix.lower() == '.zip' and path.is_file():
+            yield path
+        else:
+            yield from find_skills([root])
+
+class StreamingPipeline:
+    """Bounded-queue pipeline: discovery -> read -> parse -> check -> emit.
+
+    Stage callables:
+        read(path)  -> item       Locate and read the skill (I/O bound)
+        parse(item) -> item       Parse frontmatter and body
+        check(item) -> dict       Run checks, return the JSON-ready record
+
+    A stage that raises produces an error record instead of a result, so one
+    bad skill never stalls the run. With limits, each stage call also gets
+    the wall time limit; memory limits need a process per skill and are
+    not applied here.
+    """
+
+    def __init__(self, read: Callable[[Path], Any], parse: Callable[[Any], Any],
+                 check: Callable[[Any], Dict], queue_size: int = 64, workers: int = 4,
+                 limits: Optional[ResourceLimits] = None):
+        self.read = read
+        self.parse = parse
+        self.check = check
+        self.queue_size = queue_size
+        self.workers = max(1, workers)
+        self.limits = replace(limits, max_memory=None) if limits else None
+        self.stop_event = threading.Event()
+
+    def stop(self):
+        """Stop scheduling new skills; results already in flight are still emitted."""
+        self.stop_event.set()
+
+    def _discover(self, roots: Iterable[str], out: queue.Queue):
+        try:
+            for path in discover_skills(roots):
+                if self.stop_event.is_set():
+                    break
+                out.put(path)
+        finally:
+            for _ in range(self.workers):
+                out.put(_DONE)
+
+    def _stage(self, func: Callable, inp: queue.Queue, out: queue.Queue, label: str):
+        while True:
+            item = inp.get()
+            if item is _DONE:
+                out.put(_DONE)
+                return
+            if isinstance(item, _Failed):
+                out.put(item)
+                continue
+            try:
+                if self.limits:
+                    out.put(run_limited(lambda: func(item), self.limits))
+                else:
+                    out.put(func(item))
+            except ResourceLimitExceeded as e:
+                out.put(_Failed(item, str(e), e))
+            except Exception as e:
+                out.put(_Failed(item, f"{label} failed: {e}"))
+
+    def run(self, roots: Iterable[str]) -> Iterator[Dict]:
+        """Yield one record per discovered skill, in completion order."""
+        paths: queue.Queue = queue.Queue(self.queue_size)
+        loaded: queue.Queue = queue.Queue(self.queue_size)
+        parsed: queue.Queue = queue.Queue(self.queue_size)
+        results: queue.Queue = queue.Queue(self.queue_size)
+
+        threads = [threading.Thread(target=self._discover, args=(roots, paths), daemon=True)]
+        for _ in range(self.workers):
+            threads.append(threading.Thread(target=self._stage, args=(self.read, paths, loaded, "read"), daemon=True))
+            threads.append(threading.Thread(target=self._stage, args=(self.parse, loaded, parsed, "parse"), daemon=True))
+            threads.append(threading.Thread(target=self._stage, args=(self.check, parsed, results, "check"), daemon=True))
+        for thread in threads:
+            thread.start()
+
+        remaining = self.workers
+        while remaining:
+            item = results.get()
+            if item is _DONE:
+                remaining -= 1
+            elif isinstance(item, _Failed):
+                yield item.to_dict()
+            else:
+                yield item
+
+        for thread in threads:
+            thread.join()
+
+class _Failed:
+    """Error record carried through the remaining stages."""
+
+    def __init__(self, item: Any, error: str, limit: Optional[ResourceLimitExceeded] = None):
+        self.item = item
+        self.error = error
+        self.limit = limit
+
+    def to_dict(self) -> Dict:
+        path = getattr(self.item, 'skill_path', self.item)
+        if self.limit is not None:
+            return self.limit.to_dict(path)
+        return {"skill_path": str(path), "error": self.error}
+
+def emit_ndjson(records: Iterable[Dict], out: TextIO = None,
+                on_record: Optional[Callable[[Dict], None]] = None) -> int:
+    """Write each record as one JSON line and flush, returning the count."""
+    out = out or sys.stdout
+    count = 0
+    for record in records:
+        out.write(json.dumps(record, separators=(',', ':')) + "\n")
+        out.flush()
+        count += 1
+        if on_record:
+            on_record(record)
+    return count
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Skill Routing - Phrase and token index over skill descriptions
+
+Which installed skill would a prompt activate? Each skill contributes
+trigger phrases from its description:
+- the quoted phrases after "Triggers for:" / "Activates when:" (or the
+  comma-separated list, when nothing is quoted) and any other quoted
+  phrase pairs
+- the clauses after "Use when" (split on commas, "or" and semicolons)
+- its name, with dashes read as spaces
+
+RoutingIndex matches a prompt by looking up its own tokens instead of
+comparing it against every skill:
+- token index: token -> phrases containing it. A phrase usually needs
+  two or more of its tokens in the prompt to reach min_strength, so the
+  candidates are the phrases found in two of the prompt's postings sets
+  (plus the few one rare token can match on its own), collected with set
+  operations that run in C
+- phrase index: each phrase's token sequence. A candidate the prompt
+  covers completely is an exact match (strength 1.0) when the sequence
+  appears contiguously in the prompt
+- any other candidate is a partial match: strength is the IDF-weighted
+  share of the phrase's tokens the prompt contains, times PARTIAL_WEIGHT
+  so a partial match never ties an exact one
+
+Tokens are lowercased, stopwords dropped and common suffixes stripped.
+Tokens found in more than COMMON_FRACTION of all skills name no skill in
+particular and are left out of both indexes.
+"""
+
+import re
+import math
+from itertools import chain
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+QUOTED_RE = re.compile(r'"([^"\n]{2,80})"')
+TRIGGER_CLAUSE_RE = re.compile(r'(?:[Tt]riggers?\s+(?:for|on|when)|[Aa]ctivates?\s+(?:for|on|when))\s*:?\s*([^\n]+)')
+USE_WHEN_RE = re.compile(r'[Uu]se\s+(?:this\s+skill\s+|it\s+)?when\s*:?\s*([^\n.;]+)')
+SENTENCE_END_RE = re.compile(r'[.!?](?:\s|$)')
+CLAUSE_SPLIT_RE = re.compile(r'\s*(?:,|;|\bor\b|\band\b)\s*')
+STOPWORDS = frozenset("""
+a an the and or but of for to in on at by with from into onto about as is are was were be been being
+this that these those it its i you your we our they them he she my me do does did can could should would
+will may might must shall have has had not no so if then than when while where which who whom what how
+use using used via any some all each every please want need help just also like get make
+""".split())
+SUFFIXES = ('ing', 'ed', 'es', 's')
+PARTIAL_WEIGHT = 0.9
+COMMON_FRACTION = 0.2
+MIN_COMMON_SKILLS = 20
+STEM_CACHE_SIZE = 1 << 18
+
+# word -> stem, or '' for a stopword
+_STEMS: Dict[str, str] = {}
+
+def stem(token: str) -> str:
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased, stemmed tokens of text, stopwords removed."""
+    tokens = []
+    stems = _STEMS
+    for word in TOKEN_RE.findall(text.lower()):
+        token = stems.get(word)
+        if token is None:
+            token = '' if word in STOPWORDS else stem(word)
+            if len(stems) < STEM_CACHE_SIZE:
+                stems[word] = token
+        if token:
+            tokens.append(token)
+    return tokens
+
+def trigger_phrases(name: str, description: str) -> List[str]:
+    """The phrases of a description that say when the skill applies."""
+    phrases = []
+    for clause in TRIGGER_CLAUSE_RE.findall(description):
+        quoted = QUOTED_RE.findall(clause)
+        phrases.extend(quoted if quoted else CLAUSE_SPLIT_RE.split(SENTENCE_END_RE.split(clause)[0]))
+    for clause in USE_WHEN_RE.findall(description):
+        phrases.extend(CLAUSE_SPLIT_RE.split(clause))
+    phrases.extend(QUOTED_RE.findall(description))
+    if name:
+        phrases.append(name.replace('-', ' ').replace('_', ' '))
+    seen = set()
+    unique = []
+    for phrase in phrases:
+        key = phrase.strip().lower()
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(phrase.strip())
+    return unique
+
+@dataclass
+class Match:
+    """One skill matched by a prompt."""
+    skill: int
+    strength: float
+    phrase: str
+    exact: bool
+
+@dataclass
+class RoutingIndex:
+    """Phrase and token indexes over every skill's trigger phrases."""
+    min_strength: float = 0.6
+    skills: List[str] = field(default_factory=list)
+    # Per phrase: owning skill, text, token sequence (space-joined, for the
+    # exact match), distinct tokens and their summed IDF
+    phrase_skill: List[int] = field(default_factory=list)
+    phrase_text: List[str] = field(default_factory=list)
+    phrase_sequence: List[str] = field(default_factory=list)
+    phrase_tokens: List[Tuple[str, ...]] = field(default_factory=list)
+    phrase_weight: List[float] = field(default_factory=list)
+    postings: Dict[str, FrozenSet[int]] = field(default_factory=dict)
+    # Phrases a single token can match on its own
+    single: Dict[str, List[int]] = field(default_factory=dict)
+    idf: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, skills: Iterable[Tuple[str, str]], min_strength: float = 0.6) -> "RoutingIndex":
+        """Index (name, description) pairs for matches of min_strength or more."""
+        index = cls(min_strength)
+        tokenized: List[List[str]] = []
+        document_frequency: Dict[str, int] = {}
+        for name, description in skills:
+            skill = len(index.skills)
+            index.skills.append(name)
+            vocabulary = set()
+            for phrase in trigger_phrases(name, description):
+                tokens = tokenize(phrase)
+                if not tokens:
+                    continue
+                index.phrase_skill.append(skill)
+                index.phrase_text.append(phrase)
+                tokenized.append(tokens)
+                vocabulary.update(tokens)
+            for token in vocabulary:
+                document_frequency[token] = document_frequency.get(token, 0) + 1
+
+        total = max(1, len(index.skills))
+        common = max(MIN_COMMON_SKILLS, COMMON_FRACTION * total)
+        idf = index.idf = {token: math.log(1 + total / df) for token, df in document_frequency.items()
+                           if df <= common}
+        # Share of a phrase's weight a partial match must cover
+        needed = min_strength / PARTIAL_WEIGHT
+        postings: Dict[str, List[int]] = {}
+        for phrase, tokens in enumerate(tokenized):
+            kept = [t for t in tokens if t in idf]
+            distinct = tuple(sorted(set(kept), key=lambda t: (-idf[t], t)))
+            weight = sum(idf[t] for t in distinct)
+            index.phrase_sequence.append(f" {' '.join(kept)} ")
+            index.phrase_tokens.append(distinct)
+            index.phrase_weight.append(weight)
+            for token in distinct:
+                postings.setdefault(token, []).append(phrase)
+                if len(distinct) == 1 or idf[token] >= needed * weight - 1e-9:
+                    index.single.setdefault(token, []).append(phrase)
+        index.postings = {token: frozenset(phrases) for token, phrases in postings.items()}
+        return index
+
+    def match(self, prompt: str) -> List[Match]:
+        """Skills the prompt matches at min_strength or more, strongest first."""
+        tokens = [t for t in tokenize(prompt) if t in self.idf]
+
+        # Candidates: phrases in two or more of the prompt's postings sets,
+        # and phrases one of its tokens can match alone
+        present = set(tokens)
+        postings = self.postings
+        seen = set()
+        candidates = set(chain.from_iterable([self.single[t] for t in present if t in self.single]))
+        for token in present:
+            phrases = postings.get(token)
+            if phrases:
+                candidates |= seen & phrases
+                seen |= phrases
+
+        best: Dict[int, Match] = {}
+        exact_length: Dict[int, int] = {}
+        sequence = f" {' '.join(tokens)} "
+        idf = self.idf
+        for phrase in candidates:
+            skill = self.phrase_skill[phrase]
+            current = best.get(skill)
+            covered = sum(idf[t] for t in self.phrase_tokens[phrase] if t in present)
+            if covered >= self.phrase_weight[phrase] - 1e-9 and self.phrase_sequence[phrase] in sequence:
+                # Report the most specific of several exact phrases
+                length = len(self.phrase_sequence[phrase])
+                if current is None or not current.exact or length > exact_length[skill]:
+                    best[skill] = Match(skill, 1.0, self.phrase_text[phrase], True)
+                    exact_length[skill] = length
+                continue
+            if current is not None and current.exact:
+                continue
+            strength = PARTIAL_WEIGHT * covered / self.phrase_weight[phrase]
+            if strength < self.min_strength:
+                continue
+            if current is None or strength > current.strength:
+                best[skill] = Match(skill, strength, self.phrase_text[phrase], False)
+
+        return sorted(best.values(), key=lambda m: (-m.strength, self.skills[m.skill]))
+
+def is_ambiguous(matches: List[Match], margin: float) -> bool:
+    """Two or more skills within margin of the strongest match."""
+    return len(matches) > 1 and matches[0].strength - matches[1].strength <= margin
+
+def route(index: RoutingIndex, prompts: Iterable[str], margin: float = 0.1, on_prompt=None) -> Dict:
+    """Match every prompt; returns per-skill counts, ambiguous pairs and unmatched prompts.
+
+    on_prompt(prompt, matches), if given, sees each prompt's matches.
+    """
+    matched = [0] * len(index.skills)
+    won = [0] * len(index.skills)
+    contested = [0] * len(index.skills)
+    pairs: Dict[Tuple[int, int], int] = {}
+    unmatched: List[str] = []
+    total = ambiguous = 0
+    for prompt in prompts:
+        total += 1
+        matches = index.match(prompt)
+        if on_prompt is not None:
+            on_prompt(prompt, matches)
+        if not matches:
+            unmatched.append(prompt)
+            continue
+        for m in matches:
+            matched[m.skill] += 1
+        won[matches[0].skill] += 1
+        if is_ambiguous(matches, margin):
+            ambiguous += 1
+            top = [m.skill for m in matches if matches[0].strength - m.strength <= margin]
+            for skill in top:
+                contested[skill] += 1
+            a, b = sorted(top[:2], key=lambda s: index.skills[s])
+            pairs[(a, b)] = pairs.get((a, b), 0) + 1
+    return {
+        "prompts": total,
+        "ambiguous": ambiguous,
+        "unmatched": unmatched,
+        "matched": matched,
+        "won": won,
+        "contested": contested,
+        "pairs": pairs,
+    }
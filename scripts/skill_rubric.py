@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Skill Rubric - Turn feature vectors into scores
+
+A rubric is data: categories with a maximum, each made of criteria, each
+an ordered ladder of steps. The first step whose conditions all hold
+awards its points (a number, or the name of a feature whose value is
+awarded) and contributes its label and recommendation to the report:
+
+    {"name": "Content", "max": 25, "criteria": [
+      {"name": "code_blocks", "steps": [
+        {"when": [["code_blocks", ">=", 4]], "points": 6, "label": "Excellent code examples"},
+        {"when": [["code_blocks", ">=", 1]], "points": 2, "label": "Some code examples",
+         "recommendation": "Add more code examples"},
+        {"points": 0, "label": "No code examples"}]}]}
+
+DEFAULT_RUBRIC is the scoring score-skill.py has always used. Labels may
+reference features, e.g. "Main file too long ({line_count} lines)".
+
+score_features() scores one skill with its full breakdown. score_matrix()
+scores many feature rows at once: column-wise with NumPy when it is
+installed, with a plain-Python loop over rows otherwise.
+"""
+
+import json
+import string
+import operator
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from skill_features import FEATURE_NAMES
+
+try:
+    import numpy as np
+except ImportError:  # optional: score_matrix falls back to pure Python
+    np = None
+
+VECTORIZED = np is not None
+
+RUBRIC_VERSION = 1
+OPS = {
+    '>=': operator.ge, '>': operator.gt, '<=': operator.le,
+    '<': operator.lt, '==': operator.eq, '!=': operator.ne,
+}
+
+class RubricError(ValueError):
+    """Raised when a rubric file is malformed or names unknown features."""
+
+def _step(points, label, recommendation=None, *when):
+    step = {"when": [list(cond) for cond in when], "points": points, "label": label}
+    if recommendation:
+        step["recommendation"] = recommendation
+    return step
+
+def _ladder(name, *steps):
+    return {"name": name, "steps": list(steps)}
+
+DEFAULT_RUBRIC = {
+    "version": RUBRIC_VERSION,
+    "categories": [
+        {"name": "Structure", "max": 15, "criteria": [
+            _ladder("skill_md",
+                    _step(5, "SKILL.md exists", None, ("has_skill_md", "==", 1)),
+                    _step(0, "SKILL.md missing", "Create a SKILL.md file")),
+            _ladder("references_dir",
+                    _step(4, "references/ directory with content", None, ("references_nonempty", "==", 1)),
+                    _step(2, "references/ mentioned but directory missing", "Create references/ directory",
+                          ("references_mentioned", "==", 1)),
+                    _step(0, "No references/ structure", "Consider adding references/ for documentation")),
+            _ladder("scripts_dir",
+                    _step(4, "scripts/ with executable files", None,
+                          ("scripts_nonempty", "==", 1), ("scripts_all_executable", "==", 1)),
+                    _step(3, "scripts/ exists but some not executable", "Make scripts executable: chmod +x scripts/*",
+                          ("scripts_nonempty", "==", 1)),
+                    _step(1, "scripts/ mentioned but directory missing", "Create scripts/ directory",
+                          ("scripts_mentioned", "==", 1)),
+                    _step(0, "No scripts/ (may not be needed)")),
+            _ladder("clean",
+                    _step(2, "Clean directory (no junk files)", None, ("has_unwanted", "==", 0)),
+                    _step(0, "Contains unwanted files", "Remove .DS_Store, __pycache__, etc.")),
+        ]},
+        {"name": "Description", "max": 25, "criteria": [
+            _ladder("name",
+                    _step(3, "Valid name field", None, ("name_valid", "==", 1)),
+                    _step(1, "Name field exists but format incorrect", "Use lowercase-with-dashes format for name",
+                          ("has_name", "==", 1)),
+                    _step(0, "Missing name field", "Add 'name' to frontmatter")),
+            _ladder("description_length",
+                    _step(5, "Description is comprehensive", None, ("description_length", ">=", 100)),
+                    _step(3, "Description is adequate", "Expand description with more trigger phrases",
+                          ("description_length", ">=", 50)),
+                    _step(1, "Description is minimal", "Add more detail and trigger phrases",
+                          ("description_length", ">=", 20)),
+                    _step(0, "Description too short", "Write comprehensive description (100+ chars)")),
+            _ladder("triggers",
+                    _step(8, "Multiple trigger patterns found", None, ("trigger_patterns", ">=", 2)),
+                    _step(4, "One trigger pattern found", "Add more trigger phrases for better auto-detection",
+                          ("trigger_patterns", "==", 1)),
+                    _step(0, "No trigger phrases", "Add 'Triggers for: \"phrase1\", \"phrase2\"'")),
+            _ladder("specificity",
+                    _step(5, "Description is specific", None, ("specificity", ">=", 2)),
+                    _step(3, "Description moderately specific", "Make description more specific",
+                          ("specificity", ">=", 0)),
+                    _step(1, "Description is too generic", "Avoid generic words like 'help', 'various'")),
+            _ladder("context",
+                    _step(4, "context:fork properly specified", None,
+                          ("conversational", "==", 1), ("has_context", "==", 1)),
+                    _step(1, "Conversational skill but missing context:fork",
+                          "Add 'context: fork' for conversational skills", ("conversational", "==", 1)),
+                    _step(4, "Non-conversational (context not required)")),
+        ]},
+        {"name": "Content", "max": 25, "criteria": [
+            _ladder("headers",
+                    _step(6, "Well-structured with proper header hierarchy", None, ("h1", "==", 1), ("h2", ">=", 3)),
+                    _step(4, "Good header structure", None, ("headers", ">=", 4)),
+                    _step(2, "Basic structure", "Add more section headers", ("headers", ">=", 2)),
+                    _step(0, "Poor structure", "Add section headers (##, ###)")),
+            _ladder("code_blocks",
+                    _step(6, "Excellent code examples", None, ("code_blocks", ">=", 4)),
+                    _step(4, "Good code examples", None, ("code_blocks", ">=", 2)),
+                    _step(2, "Some code examples", "Add more code examples", ("code_blocks", ">=", 1)),
+                    _step(0, "No code examples", "Add code examples with ```language blocks")),
+            _ladder("imperative",
+                    _step(5, "Strong imperative form", None, ("imperative_ratio", ">=", 3)),
+                    _step(3, "Good imperative form", "Reduce passive voice", ("imperative_ratio", ">=", 1.5)),
+                    _step(1, "Too much passive voice", "Use imperative: 'Run tests' not 'You should run tests'",
+                          ("imperative_ratio", ">=", 0.5)),
+                    _step(0, "Mostly passive voice", "Rewrite in imperative form")),
+            _ladder("tables",
+                    _step(4, "Good use of tables", None, ("table_rows", ">=", 6)),
+                    _step(2, "Some table usage", None, ("table_rows", ">=", 2)),
+                    _step(0, "No tables", "Consider adding tables for structured info")),
+            _ladder("lists",
+                    _step(4, "Good use of lists", None, ("list_items", ">=", 8)),
+                    _step(2, "Some list usage", None, ("list_items", ">=", 4)),
+                    _step(0, "Few lists", "Use lists for steps and options")),
+        ]},
+        {"name": "Progressive Disclosure", "max": 15, "criteria": [
+            _ladder("length",
+                    _step(8, "Concise main file (<200 lines)", None, ("line_count", "<=", 200)),
+                    _step(6, "Good main file length (<350 lines)", None, ("line_count", "<=", 350)),
+                    _step(4, "Acceptable length (<500 lines)", None, ("line_count", "<=", 500)),
+                    _step(2, "Main file is long", "Move content to references/", ("line_count", "<=", 700)),
+                    _step(0, "Main file too long ({line_count} lines)", "Significantly reduce SKILL.md size")),
+            _ladder("references_usage",
+                    _step(5, "Good use of references/", None, ("references_exists", "==", 1),
+                          ("reference_md_files", ">=", 2), ("reference_mentions", ">=", 2)),
+                    _step(3, "Some use of references/", None, ("references_exists", "==", 1),
+                          ("reference_md_files", ">=", 1)),
+                    _step(1, "references/ exists but empty", "Add documentation to references/",
+                          ("references_exists", "==", 1)),
+                    _step(0, "Long file without references/", "Create references/ folder for details",
+                          ("line_count", ">", 300)),
+                    _step(3, "Short file (references not required)")),
+            _ladder("duplicates",
+                    _step(2, "No duplicate content", None, ("duplicate_paragraphs", "==", 0)),
+                    _step(0, "Some duplicate content", "Remove duplicate paragraphs")),
+        ]},
+        {"name": "Examples", "max": 10, "criteria": [
+            _ladder("examples",
+                    _step(5, "Multiple examples provided", None, ("examples", ">=", 3)),
+                    _step(3, "Some examples", "Add more examples (aim for 3+)", ("examples", ">=", 1)),
+                    _step(0, "No examples", "Add example sections")),
+            _ladder("outputs",
+                    _step(3, "Examples show expected outputs", None, ("output_words", ">=", 2)),
+                    _step(1, "Some examples show output", "Add expected outputs to examples",
+                          ("output_words", ">=", 1)),
+                    _step(0, "Examples don't show outputs", "Show expected output for each example")),
+            _ladder("placeholders",
+                    _step(2, "Realistic examples", None, ("placeholders", "<=", 1)),
+                    _step(1, "Some placeholder text in examples", "Use realistic values instead of foo/bar",
+                          ("placeholders", "<=", 3)),
+                    _step(0, "Too many placeholders", "Replace foo/bar/example.com with realistic values")),
+        ]},
+        {"name": "Cross-Platform", "max": 10, "criteria": [
+            _ladder("agentskills_fields",
+                    _step(5, "Full agentskills.io compliance", None, ("agentskills_points", ">=", 4)),
+                    _step("agentskills_points", "Partial agentskills.io fields", "Add more agentskills.io fields",
+                          ("agentskills_points", ">=", 2)),
+                    _step(0, "No agentskills.io fields", "Consider adding: version, platforms, tags")),
+            _ladder("manifest",
+                    _step(3, "Valid manifest.json", None, ("manifest_state", "==", 3)),
+                    _step(1, "manifest.json incomplete", "Add required fields to manifest.json",
+                          ("manifest_state", "==", 2)),
+                    _step(0, "Invalid manifest.json", "Fix manifest.json syntax", ("manifest_state", "==", 1)),
+                    _step(0, "No manifest.json", "Add manifest.json for registry listing")),
+            _ladder("platform_agnostic",
+                    _step(2, "Platform-agnostic content", None, ("platform_mentions", "<=", 2)),
+                    _step(1, "Some Claude-specific references", "Use platform-neutral language where possible",
+                          ("platform_mentions", "<=", 5)),
+                    _step(0, "Heavy Claude-specific content", "Make content more platform-agnostic")),
+        ]},
+    ],
+}
+
+def check_rubric(rubric: Dict) -> Dict:
+    """Raise RubricError unless rubric is well-formed over FEATURE_NAMES; returns it."""
+    known = set(FEATURE_NAMES)
+    categories = rubric.get("categories") if isinstance(rubric, dict) else None
+    if not isinstance(categories, list) or not categories:
+        raise RubricError("rubric needs a non-empty 'categories' list")
+    for cat in categories:
+        where = f"category {cat.get('name', '?')!r}" if isinstance(cat, dict) else "category"
+        if not isinstance(cat, dict) or not isinstance(cat.get("name"), str):
+            raise RubricError(f"{where}: needs a 'name'")
+        if not isinstance(cat.get("max"), (int, float)):
+            raise RubricError(f"{where}: needs a numeric 'max'")
+        if not isinstance(cat.get("criteria", []), list):
+            raise RubricError(f"{where}: 'criteria' must be a list")
+        for crit in cat.get("criteria", []):
+            steps = crit.get("steps") if isinstance(crit, dict) else None
+            if not isinstance(steps, list) or not steps:
+                raise RubricError(f"{where}: every criterion needs a non-empty 'steps' list")
+            for step in steps:
+                if not isinstance(step, dict):
+                    raise RubricError(f"{where}: each step must be an object, got {step!r}")
+                points = step.get("points")
+                if isinstance(points, str) and points not in known:
+                    raise RubricError(f"{where}: unknown feature {points!r} in points")
+                if not isinstance(points, (int, float, str)) or isinstance(points, bool):
+                    raise RubricError(f"{where}: step points must be a number or a feature name")
+                if not isinstance(step.get("label", ""), str):
+                    raise RubricError(f"{where}: step label must be a string")
+                _check_label(step.get("label", ""), known, where)
+                if not isinstance(step.get("recommendation", ""), (str, type(None))):
+                    raise RubricError(f"{where}: step recommendation must be a string")
+                if not isinstance(step.get("when", []), list):
+                    raise RubricError(f"{where}: step 'when' must be a list of conditions")
+                for cond in step.get("when", []):
+                    if not (isinstance(cond, list) and len(cond) == 3):
+                        raise RubricError(f"{where}: conditions are [feature, op, value]")
+                    feature, op, value = cond
+                    if feature not in known:
+                        raise RubricError(f"{where}: unknown feature {feature!r}")
+                    if op not in OPS:
+                        raise RubricError(f"{where}: unknown operator {op!r} (use {', '.join(OPS)})")
+                    if not isinstance(value, (int, float)) or isinstance(value, bool):
+                        raise RubricError(f"{where}: condition value must be a number")
+    return rubric
+
+def _check_label(label: str, known: set, where: str):
+    # Labels are formatted with the feature vector, so every {field} must name a feature
+    try:
+        fields = [field for _, field, _, _ in string.Formatter().parse(label) if field is not None]
+    except ValueError as e:
+        raise RubricError(f"{where}: malformed label {label!r}: {e}")
+    for field in fields:
+        name = field.split('.')[0].split('[')[0]
+        if name not in known:
+            raise RubricError(f"{where}: unknown feature {name!r} in label {label!r}")
+
+def load_rubric(path: Path) -> Dict:
+    """Read and check a JSON rubric file."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            rubric = json.load(f)
+    except (OSError, ValueError) as e:
+        raise RubricError(f"could not read rubric {path}: {e}")
+    return check_rubric(rubric)
+
+def _matches(step: Dict, features: Dict) -> bool:
+    return all(OPS[op](features[name], value) for name, op, value in step.get("when", ()))
+
+def score_features(features: Dict[str, float], rubric: Dict = DEFAULT_RUBRIC) -> Tuple[float, List[Dict]]:
+    """Score one feature vector; returns (total, per-category results with breakdowns)."""
+    results = []
+    for cat in rubric["categories"]:
+        points = 0.0
+        breakdown = []
+        recommendations = []
+        for crit in cat.get("criteria", []):
+            for step in crit["steps"]:
+                if not _matches(step, features):
+                    continue
+                value = features[step["points"]] if isinstance(step["points"], str) else step["points"]
+                points += value
+                breakdown.append(f"+{value}: {step.get('label', '').format_map(features)}")
+                if step.get("recommendation"):
+                    recommendations.append(step["recommendation"])
+                break
+        results.append({"name": cat["name"], "max": cat["max"], "earned": points,
+                        "breakdown": breakdown, "recommendations": recommendations})
+    return sum(r["earned"] for r in results), results
+
+def score_matrix(rows: Sequence[Sequence[float]], rubric: Dict = DEFAULT_RUBRIC,
+                 names: Sequence[str] = FEATURE_NAMES) -> Dict[str, List[float]]:
+    """Score many feature rows (columns in `names` order) under one rubric.
+
+    Returns {"total": [...], <category name>: [...]} with one value per row.
+    """
+    if np is not None:
+        return _score_matrix_numpy(rows, rubric, names)
+    score_row = compile_rubric(rubric, names)
+    results = [score_row(row) for row in rows]
+    output = {"total": [r[-1] for r in results]}
+    for i, cat in enumerate(rubric["categories"]):
+        output[cat["name"]] = [r[i] for r in results]
+    return output
+
+def compile_rubric(rubric: Dict, names: Sequence[str] = FEATURE_NAMES):
+    """Compile a rubric into one function row -> (category points..., total).
+
+    Feature names are resolved to row indexes and operators to functions
+    up front, so scoring a row walks prebuilt (index, op, value) tuples
+    with no dict lookups.
+    """
+    index = {name: i for i, name in enumerate(names)}
+    categories = []
+    for cat in rubric["categories"]:
+        ladders = []
+        for crit in cat.get("criteria", []):
+            ladder = []
+            for step in crit["steps"]:
+                points = step["points"]
+                conds = tuple((index[name], OPS[op], value) for name, op, value in step.get("when", ()))
+                ladder.append((conds, index[points] if isinstance(points, str) else None, points))
+            ladders.append(tuple(ladder))
+        categories.append(tuple(ladders))
+
+    def score_row(row):
+        totals = []
+        for ladders in categories:
+            points = 0.0
+            for ladder in ladders:
+                # The first step whose conditions all hold awards its points
+                for conds, column, value in ladder:
+                    for i, op, threshold in conds:
+                        if not op(row[i], threshold):
+                            break
+                    else:
+                        points += row[column] if column is not None else value
+                        break
+            totals.append(points)
+        return (*totals, sum(totals, 0.0))
+
+    return score_row
+
+def _score_matrix_numpy(rows, rubric, names) -> Dict[str, List[float]]:
+    matrix = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(names))
+    column = {name: matrix[:, i] for i, name in enumerate(names)}
+    result = {}
+    total = np.zeros(len(matrix))
+    for cat in rubric["categories"]:
+        points = np.zeros(len(matrix))
+        for crit in cat.get("criteria", []):
+            # np.select picks the first step whose conditions hold, as the ladder does
+            conditions = []
+            values = []
+            for step in crit["steps"]:
+                mask = np.ones(len(matrix), dtype=bool)
+                for name, op, value in step.get("when", ()):
+                    mask &= OPS[op](column[name], value)
+                conditions.append(mask)
+                values.append(column[step["points"]] if isinstance(step["points"], str) else step["points"])
+            points += np.select(conditions, values, default=0.0)
+        result[cat["name"]] = points.tolist()
+        total += points
+    result["total"] = total.tolist()
+    return result
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Skill Shard - Split a batch run across machines
+
+--shard K/N on validate-skill.py, score-skill.py and package-skill.py
+discovers every skill under the given paths and keeps the K-th of N
+shards (1-based). Every node must compute the same split, so a skill's
+shard depends only on its key: the skill directory relative to the
+working directory (run each node from the same checkout root).
+
+- By hash: SHA-256 of the key, modulo N. Stable as skills come and go
+- By cost (--shard-costs FILE): skills are dealt largest recorded cost
+  first to the least loaded shard, so shards finish together. Skills
+  with no recorded cost count as the mean of the others. Every node must
+  read the same cost file
+
+--record-costs FILE folds this run's per-skill seconds into FILE (a JSON
+object of key -> seconds), under a lock so shard processes on one
+machine can share it. Record to a different file than the one being
+read, so a shard finishing early cannot change the split for one that
+has not started yet; merge-reports.py combines the files from several
+nodes.
+
+Sharded --json reports carry a "shard" object that merge-reports.py uses
+to check that every shard is present and to compute the overall result.
+"""
+
+import os
+import re
+import json
+import heapq
+import hashlib
+import argparse
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from skill_walk import find_skills
+
+SHARD_RE = re.compile(r'\s*(\d+)\s*/\s*(\d+)\s*')
+# Weight of the previous recording when folding in a new one, as for check costs
+COST_SMOOTHING = 0.7
+
+@dataclass
+class Shard:
+    """Shard index (1-based) out of count."""
+    index: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+def parse_shard(text: str) -> Shard:
+    """Parse K/N, with 1 <= K <= N."""
+    match = SHARD_RE.fullmatch(text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"invalid shard: {text!r} (use K/N, e.g. 2/8)")
+    index, count = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"invalid shard: {text!r} (K must be between 1 and N)")
+    return Shard(index, count)
+
+def skill_key(path) -> str:
+    """Stable name of a skill: its directory relative to the working directory, POSIX style."""
+    skill_dir = Path(path).resolve()
+    if skill_dir.name == "SKILL.md":
+        skill_dir = skill_dir.parent
+    try:
+        return Path(os.path.relpath(skill_dir, Path.cwd().resolve())).as_posix()
+    except ValueError:  # Another drive on Windows
+        return skill_dir.as_posix()
+
+def hash_shard(key: str, count: int) -> int:
+    """0-based shard of a key by hash."""
+    digest = hashlib.sha256(key.encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+def assign(keys: List[str], count: int, costs: Optional[Dict[str, float]] = None) -> List[int]:
+    """0-based shard of each key: by hash, or balanced by cost when costs are given."""
+    if costs is None:
+        return [hash_shard(key, count) for key in keys]
+    known = [costs[key] for key in keys if key in costs]
+    default = sum(known) / len(known) if known else 1.0
+    # Largest first to the least loaded shard; ties broken by key and shard number
+    order = sorted(range(len(keys)), key=lambda i: (-costs.get(keys[i], default), keys[i]))
+    loads = [(0.0, s) for s in range(count)]
+    shards = [0] * len(keys)
+    for i in order:
+        load, target = heapq.heappop(loads)
+        shards[i] = target
+        heapq.heappush(loads, (load + costs.get(keys[i], default), target))
+    return shards
+
+def load_costs(path: Optional[str]) -> Dict[str, float]:
+    """Recorded per-skill costs; empty if the file is missing or unreadable."""
+    if not path or not Path(path).exists():
+        return {}
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return {str(k): float(v) for k, v in data.items()}
+    except (OSError, ValueError, AttributeError, TypeError):
+        return {}
+
+def record_costs(path: str, measured: Dict[str, float]):
+    """Fold measured per-skill seconds into the cost file, holding a lock while doing so."""
+    with open(path, 'a+') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        f.seek(0)
+        try:
+            costs = {str(k): float(v) for k, v in json.loads(f.read() or '{}').items()}
+        except (ValueError, AttributeError, TypeError):
+            costs = {}
+        for key, seconds in measured.items():
+            previous = costs.get(key)
+            costs[key] = seconds if previous is None else COST_SMOOTHING * previous + (1 - COST_SMOOTHING) * seconds
+        f.seek(0)
+        f.truncate()
+        json.dump({k: round(v, 4) for k, v in sorted(costs.items())}, f, indent=2)
+
+def select(roots: List[str], shard: Shard, costs: Optional[Dict[str, float]] = None) -> List[Path]:
+    """The skill directories under roots that belong to shard, in discovery order."""
+    skills = [skill_md.parent for skill_md in find_skills(roots)]
+    shards = assign([skill_key(path) for path in skills], shard.count, costs)
+    return [path for path, s in zip(skills, shards) if s == shard.index - 1]
+
+def add_shard_arguments(parser: argparse.ArgumentParser):
+    """Add --shard, --shard-costs and --record-costs."""
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="K/N",
+        help="Discover skills under the given paths and handle only the K-th of N shards"
+    )
+    parser.add_argument(
+        "--shard-costs",
+        metavar="FILE",
+        help="Balance shards by the per-skill costs recorded in FILE instead of by hash"
+    )
+    parser.add_argument(
+        "--record-costs",
+        metavar="FILE",
+        help="Fold this run's per-skill seconds into FILE, for a later --shard-costs"
+    )
+
+def shard_paths(args) -> List[str]:
+    """This run's skill paths: args.path narrowed to args.shard, if given."""
+    if args.shard is None:
+        return args.path
+    costs = load_costs(args.shard_costs) if args.shard_costs else None
+    return [str(path) for path in select(args.path, args.shard, costs)]
+
+def shard_info(args, skills: int, passed: bool) -> Dict:
+    """The "shard" object of a sharded --json report."""
+    return {
+        "index": args.shard.index,
+        "count": args.shard.count,
+        "strategy": "cost" if args.shard_costs else "hash",
+        "skills": skills,
+        "passed": passed,
+    }
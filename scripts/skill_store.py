@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Skill Store - Content-addressed storage shared across skills
+
+Skills often ship identical copies of large reference docs. Two stores
+keyed by SHA-256 let each distinct file be handled once:
+
+- BlobStore: raw file contents for installs. install-skill.py --store
+  hard-links installed files to blobs, so identical files across skills
+  share one inode on disk. gc() removes blobs no installed file links to.
+- DeflateCache: deflated payloads for packaging. package-skill.py
+  compresses each distinct file once per run and, given --store, once
+  across runs.
+
+A third keeps whole packages:
+
+- ArtifactCache: the packages in an output directory (package-skill.py
+  --artifacts), indexed by skill name, version and tree hash. A skill
+  whose tree hash is already there is not packaged again, and the
+  directory is kept under a byte budget by evicting the least recently
+  used packages of unpinned versions.
+
+Blobs are read-only (0444, or 0555 for executables, stored separately)
+because every hard link shares the inode: editing an installed copy in
+place would otherwise change it for every skill.
+"""
+
+import os
+import json
+import stat
+import time
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+COPY_CHUNK = 1024 * 1024
+BLOB_MODE = 0o444
+EXEC_BLOB_MODE = 0o555
+STORE_DIRNAME = ".skill-store"
+ARTIFACT_INDEX = "artifacts.json"
+ARTIFACT_INDEX_VERSION = 1
+DEFAULT_ARTIFACT_BUDGET = 1024 ** 3
+
+def blob_mode(mode: int) -> int:
+    """Mode a file gets when installed from the store."""
+    return EXEC_BLOB_MODE if mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH) else BLOB_MODE
+
+class BlobStore:
+    """Raw file contents under objects/<2 hex>/<sha256>[.x]."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.tmp = self.root / "tmp"
+
+    def blob_path(self, digest: str, executable: bool = False) -> Path:
+        return self.objects / digest[:2] / (digest + ('.x' if executable else ''))
+
+    def has(self, digest: str, executable: bool = False) -> bool:
+        return self.blob_path(digest, executable).is_file()
+
+    def put_stream(self, stream: BinaryIO, executable: bool = False) -> Tuple[str, int]:
+        """Copy a stream into the store; returns (sha256, size). Existing blobs are kept."""
+        self.tmp.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self.tmp)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = stream.read(COPY_CHUNK)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            hexdigest = digest.hexdigest()
+            target = self.blob_path(hexdigest, executable)
+            if target.exists():
+                os.unlink(tmp_name)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.chmod(tmp_name, EXEC_BLOB_MODE if executable else BLOB_MODE)
+                os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return hexdigest, size
+
+    def put_file(self, path: Path, executable: bool = False) -> str:
+        with open(path, 'rb') as f:
+            return self.put_stream(f, executable)[0]
+
+    def link(self, digest: str, executable: bool, dest: Path):
+        """Hard-link a blob to dest. Raises OSError if the filesystem refuses."""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.link(self.blob_path(digest, executable), dest)
+
+    def blobs(self):
+        """Yield (path, stat) for every blob."""
+        if not self.objects.is_dir():
+            return
+        for shard in sorted(self.objects.iterdir()):
+            if shard.is_dir():
+                for blob in sorted(shard.iterdir()):
+                    yield blob, blob.stat()
+
+    def usage(self) -> Dict[str, int]:
+        count = size = 0
+        for _, st in self.blobs():
+            count += 1
+            size += st.st_size
+        return {"blobs": count, "bytes": size}
+
+    def gc(self, dry_run: bool = False) -> Dict[str, int]:
+        """Remove blobs that no installed file links to (link count 1)."""
+        removed = freed = 0
+        for blob, st in self.blobs():
+            if st.st_nlink > 1:
+                continue
+            removed += 1
+            freed += st.st_size
+            if not dry_run:
+                blob.unlink()
+        if not dry_run and self.tmp.is_dir():
+            # Leftovers from interrupted writes
+            for leftover in self.tmp.iterdir():
+                leftover.unlink()
+        return {"removed": removed, "bytes_freed": freed}
+
+class DeflateCache:
+    """Deflated payloads keyed by (SHA-256, level), shared between packaging threads.
+
+    Holds up to max_bytes of payloads in memory (least recently used out
+    first). With a directory, payloads are also kept on disk so later runs
+    skip compression for content they have seen.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = 512 * 1024 * 1024):
+        self.directory = Path(directory) if directory else None
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Tuple[str, int], Tuple[int, bytes]]" = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _file(self, digest: str, level: int) -> Path:
+        return self.directory / digest[:2] / f"{digest}.{level}"
+
+    def get(self, digest: str, level: int) -> Optional[Tuple[int, bytes]]:
+        """Return (zip method, payload) for content seen before, else None."""
+        key = (digest, level)
+        with self._lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+        if self.directory is not None:
+            try:
+                data = self._file(digest, level).read_bytes()
+            except OSError:
+                data = None
+            if data:
+                value = (data[0], data[1:])
+                self._remember(key, value)
+                with self._lock:
+                    self.hits += 1
+                return value
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, digest: str, level: int, method: int, payload: bytes):
+        self._remember((digest, level), (method, payload))
+        if self.directory is not None:
+            path = self._file(digest, level)
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=path.parent)
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(bytes([method]) + payload)
+                os.replace(tmp_name, path)
+
+    def _remember(self, key, value):
+        with self._lock:
+            if key in self.entries or len(value[1]) > self.max_bytes:
+                return
+            self.entries[key] = value
+            self.size += len(value[1])
+            while self.size > self.max_bytes:
+                _, (_, old) = self.entries.popitem(last=False)
+                self.size -= len(old)
+
+@dataclass
+class Artifact:
+    """One package in an ArtifactCache."""
+    name: str
+    version: str
+    format: str
+    tree_hash: str
+    file: str
+    size: int
+    created: float
+    last_used: float
+
+class ArtifactCache:
+    """Packages in one directory, indexed in artifacts.json by name, version and tree hash.
+
+    Each package keeps its usual <name>-<version>.<format> file name, so a
+    rebuild of the same version with different content replaces the old
+    entry. Pins are "name@version" or "name" (every version); pinned
+    packages are never evicted. Every index update happens under a lock,
+    so several packaging processes can share the directory.
+    """
+
+    def __init__(self, directory: Path, budget: Optional[int] = None):
+        self.directory = Path(directory)
+        self.index_path = self.directory / ARTIFACT_INDEX
+        # None keeps the budget recorded in the index (or the default)
+        self.budget = budget
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def _index(self, write: bool = True) -> Iterator[Dict]:
+        """The index, locked against other processes; saved afterwards if write."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / (ARTIFACT_INDEX + ".lock"), 'a') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.index_path) as f:
+                    data = json.load(f)
+                if data.get("version") != ARTIFACT_INDEX_VERSION:
+                    raise ValueError("index version")
+            except (OSError, ValueError, AttributeError):
+                data = {"version": ARTIFACT_INDEX_VERSION, "budget": DEFAULT_ARTIFACT_BUDGET,
+                        "pins": [], "artifacts": {}}
+            if self.budget is not None:
+                data["budget"] = self.budget
+            # Packages deleted by hand leave the index too
+            data["artifacts"] = {file: entry for file, entry in data["artifacts"].items()
+                                 if (self.directory / file).is_file()}
+            yield data
+            if write:
+                fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=ARTIFACT_INDEX)
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+                os.replace(tmp_name, self.index_path)
+
+    @staticmethod
+    def _pinned(data: Dict, entry: Dict) -> bool:
+        pins = data["pins"]
+        return entry["name"] in pins or f"{entry['name']}@{entry['version']}" in pins
+
+    def lookup(self, tree_hash: str, fmt: str) -> Optional[Path]:
+        """The package already built from this tree in this format, marked as used; else None."""
+        with self._index() as data:
+            for file, entry in data["artifacts"].items():
+                path = self.directory / file
+                if entry["tree_hash"] == tree_hash and entry["format"] == fmt \
+                        and path.stat().st_size == entry["size"]:
+                    entry["last_used"] = time.time()
+                    self.hits += 1
+                    return path
+        self.misses += 1
+        return None
+
+    def record(self, name: str, version: str, fmt: str, tree_hash: str, path: Path):
+        """Index a package just written into the directory."""
+        now = time.time()
+        artifact = Artifact(name, version, fmt, tree_hash, path.name, path.stat().st_size, now, now)
+        with self._index() as data:
+            data["artifacts"][path.name] = asdict(artifact)
+
+    def pin(self, pins: Iterable[str] = (), unpin: Iterable[str] = ()):
+        """Add and remove "name@version" (or "name") pins."""
+        with self._index() as data:
+            current = set(data["pins"]) - set(unpin)
+            data["pins"] = sorted(current | set(pins))
+
+    def evict(self, keep: Iterable[str] = (), dry_run: bool = False) -> Dict:
+        """Delete least recently used, unpinned packages until the directory fits the budget.
+
+        Files in keep (e.g. this run's packages) stay. Returns what was
+        removed and whether the budget is met.
+        """
+        keep = set(keep)
+        removed: List[str] = []
+        with self._index(write=not dry_run) as data:
+            entries = data["artifacts"]
+            total = sum(entry["size"] for entry in entries.values())
+            budget = data["budget"]
+            candidates = sorted((entry["last_used"], file) for file, entry in entries.items()
+                                if file not in keep and not self._pinned(data, entry))
+            freed = 0
+            for _, file in candidates:
+                if total - freed <= budget:
+                    break
+                freed += entries[file]["size"]
+                removed.append(file)
+                if not dry_run:
+                    del entries[file]
+                    try:
+                        os.unlink(self.directory / file)
+                    except FileNotFoundError:
+                        pass
+        return {"removed": removed, "bytes_freed": freed, "bytes": total - freed,
+                "budget": budget, "within_budget": total - freed <= budget}
+
+    def artifacts(self) -> Tuple[List[Artifact], List[str], int]:
+        """(packages, most recently used first; pins; budget)."""
+        with self._index(write=False) as data:
+            artifacts = [Artifact(**entry) for entry in data["artifacts"].values()]
+            artifacts.sort(key=lambda a: -a.last_used)
+            return artifacts, list(data["pins"]), data["budget"]
+
+    def is_pinned(self, artifact: Artifact, pins: List[str]) -> bool:
+        return self._pinned({"pins": pins}, asdict(artifact))
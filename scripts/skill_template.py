@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Skill Template - Compiled {{PLACEHOLDER}} templates
+
+A template is compiled once into a list of literal and slot segments, so
+rendering many skills from it is a single join with no re-scanning. Each
+slot remembers the indentation of its line: a multi-line value is
+re-indented to match, which keeps values inside YAML block scalars valid.
+
+Used by scaffold-skills.py.
+"""
+
+import re
+from pathlib import Path
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+PLACEHOLDER_RE = re.compile(r'\{\{([A-Z][A-Z0-9_]*)\}\}')
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+TEMPLATE_FILE = "SKILL.template.md"
+
+class TemplateError(Exception):
+    """Raised when a template cannot be found or read."""
+
+class Template:
+    """A template compiled into literal strings and (name, indent) slots."""
+
+    def __init__(self, text: str, source: str = "<string>"):
+        self.source = source
+        self.segments: List[Union[str, Tuple[str, str]]] = []
+        self.placeholders: List[str] = []
+
+        last = 0
+        for match in PLACEHOLDER_RE.finditer(text):
+            if match.start() > last:
+                self.segments.append(text[last:match.start()])
+            line_start = text.rfind('\n', 0, match.start()) + 1
+            prefix = text[line_start:match.start()]
+            indent = prefix[:len(prefix) - len(prefix.lstrip(' '))]
+            name = match.group(1)
+            self.segments.append((name, indent))
+            if name not in self.placeholders:
+                self.placeholders.append(name)
+            last = match.end()
+        if last < len(text):
+            self.segments.append(text[last:])
+
+    def render(self, values: Dict[str, str]) -> Tuple[str, List[str]]:
+        """Fill the slots from values; return (text, unfilled placeholder names).
+
+        Unfilled slots are left as {{NAME}} so they stay visible in the output.
+        """
+        parts = []
+        missing = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+            name, indent = segment
+            value = values.get(name)
+            if value is None:
+                parts.append('{{' + name + '}}')
+                if name not in missing:
+                    missing.append(name)
+            elif '\n' in value:
+                parts.append(value.replace('\n', '\n' + indent))
+            else:
+                parts.append(value)
+        return ''.join(parts), missing
+
+def template_path(name: str, templates_dir: Path = TEMPLATES_DIR) -> Path:
+    """Resolve a template name (e.g. 'standard') or a path to its template file."""
+    path = Path(name)
+    if path.is_file():
+        return path.resolve()
+    if path.is_dir() and (path / TEMPLATE_FILE).is_file():
+        return (path / TEMPLATE_FILE).resolve()
+    candidate = Path(templates_dir) / name / TEMPLATE_FILE
+    if candidate.is_file():
+        return candidate.resolve()
+    raise TemplateError(f"template not found: {name}")
+
+@lru_cache(maxsize=None)
+def _compile_file(path: Path) -> Template:
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError as e:
+        raise TemplateError(f"cannot read template {path}: {e}")
+    return Template(text, str(path))
+
+def load_template(name: str, templates_dir: Path = TEMPLATES_DIR) -> Template:
+    """Compile a template once per process and return the cached result."""
+    return _compile_file(template_path(name, templates_dir))
+
+def available_templates(templates_dir: Path = TEMPLATES_DIR) -> List[str]:
+    """Names of the templates shipped under templates/."""
+    return sorted(p.parent.name for p in Path(templates_dir).glob(f"*/{TEMPLATE_FILE}"))
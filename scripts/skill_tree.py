@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Skill Tree - File access for skills on disk or in memory
+
+The validator, scorer and link checker read a skill through a SkillTree
+instead of touching the filesystem directly. Paths are POSIX strings
+relative to the skill root ('SKILL.md', 'references/guide.md').
+
+- DiskTree:   a skill directory on disk
+- MemoryTree: SKILL.md content plus an optional virtual file listing,
+              for checking drafts without temp files
+- ZipTree:    a packaged skill, read in place from the archive's central
+              directory and entry streams, without extracting it
+"""
+
+import io
+import os
+import stat
+import fnmatch
+import zipfile
+import posixpath
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set, Union
+
+class SkillTree:
+    """Read-only view of one skill's files."""
+
+    name = "skill"
+    # On-disk location, or None for virtual trees
+    root: Optional[Path] = None
+
+    def is_file(self, rel: str) -> bool:
+        raise NotImplementedError
+
+    def is_dir(self, rel: str) -> bool:
+        raise NotImplementedError
+
+    def exists(self, rel: str) -> bool:
+        return self.is_file(rel) or self.is_dir(rel)
+
+    def read_bytes(self, rel: str) -> bytes:
+        raise NotImplementedError
+
+    def read_text(self, rel: str) -> str:
+        return self.read_bytes(rel).decode('utf-8')
+
+    def open(self, rel: str) -> BinaryIO:
+        """Binary stream of a file's content."""
+        return io.BytesIO(self.read_bytes(rel))
+
+    def file_size(self, rel: str) -> Optional[int]:
+        """Size of a file known without reading it, or None."""
+        return None
+
+    def is_executable(self, rel: str) -> bool:
+        raise NotImplementedError
+
+    def listdir(self, rel: str) -> List[str]:
+        """Sorted names of the entries directly inside a directory."""
+        raise NotImplementedError
+
+    def walk_files(self, rel: str = '') -> List[str]:
+        """Sorted relative paths of every file under a directory."""
+        raise NotImplementedError
+
+    def glob(self, rel: str, pattern: str) -> List[str]:
+        """Relative paths of the entries directly inside rel matching pattern."""
+        return [posixpath.join(rel, name) for name in self.listdir(rel)
+                if fnmatch.fnmatchcase(name, pattern)]
+
+class DiskTree(SkillTree):
+    """A skill directory on disk."""
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+        self.name = self.root.name
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel if rel else self.root
+
+    def is_file(self, rel: str) -> bool:
+        return self.path(rel).is_file()
+
+    def is_dir(self, rel: str) -> bool:
+        return self.path(rel).is_dir()
+
+    def exists(self, rel: str) -> bool:
+        return self.path(rel).exists()
+
+    def read_bytes(self, rel: str) -> bytes:
+        return self.path(rel).read_bytes()
+
+    def open(self, rel: str) -> BinaryIO:
+        return open(self.path(rel), 'rb')
+
+    def file_size(self, rel: str) -> Optional[int]:
+        try:
+            return os.stat(self.path(rel)).st_size
+        except OSError:
+            return None
+
+    def is_executable(self, rel: str) -> bool:
+        return os.access(self.path(rel), os.X_OK)
+
+    def listdir(self, rel: str) -> List[str]:
+        try:
+            return sorted(os.listdir(self.path(rel)))
+        except OSError:
+            return []
+
+    def walk_files(self, rel: str = '') -> List[str]:
+        base = self.path(rel)
+        if not base.is_dir():
+            return []
+        return sorted(p.relative_to(self.root).as_posix() for p in base.rglob('*') if p.is_file())
+
+class MemoryTree(SkillTree):
+    """A skill held in memory: {relative path: content}.
+
+    Content may be str or bytes; files listed in executable (or given a
+    mode with an executable bit in modes) count as executable scripts.
+    Directories exist implicitly when a file lives under them.
+    """
+
+    def __init__(self, files: Dict[str, Union[str, bytes]], name: str = "skill",
+                 executable: Iterable[str] = (), modes: Optional[Dict[str, int]] = None):
+        self.name = name
+        self.files: Dict[str, Union[str, bytes]] = {}
+        for rel, content in files.items():
+            self.files[self._normalise(rel)] = content
+        self.executable: Set[str] = {self._normalise(rel) for rel in executable}
+        for rel, mode in (modes or {}).items():
+            if mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH):
+                self.executable.add(self._normalise(rel))
+
+        self.dirs: Dict[str, Set[str]] = {'': set()}
+        for rel in self.files:
+            parent, child = posixpath.split(rel)
+            while True:
+                self.dirs.setdefault(parent, set()).add(child)
+                if not parent:
+                    break
+                parent, child = posixpath.split(parent)
+
+    @classmethod
+    def from_content(cls, content: str, files: Optional[Dict[str, Union[str, bytes]]] = None,
+                     **kwargs) -> "MemoryTree":
+        """Tree with the given SKILL.md content plus any other files."""
+        return cls({**(files or {}), "SKILL.md": content}, **kwargs)
+
+    @staticmethod
+    def _normalise(rel: str) -> str:
+        rel = posixpath.normpath(rel.replace('\\', '/')).lstrip('/')
+        return '' if rel == '.' else rel
+
+    def is_file(self, rel: str) -> bool:
+        return self._normalise(rel) in self.files
+
+    def is_dir(self, rel: str) -> bool:
+        return self._normalise(rel) in self.dirs
+
+    def read_bytes(self, rel: str) -> bytes:
+        try:
+            content = self.files[self._normalise(rel)]
+        except KeyError:
+            raise FileNotFoundError(rel)
+        return content.encode('utf-8') if isinstance(content, str) else content
+
+    def read_text(self, rel: str) -> str:
+        try:
+            content = self.files[self._normalise(rel)]
+        except KeyError:
+            raise FileNotFoundError(rel)
+        return content if isinstance(content, str) else content.decode('utf-8')
+
+    def is_executable(self, rel: str) -> bool:
+        return self._normalise(rel) in self.executable
+
+    def listdir(self, rel: str) -> List[str]:
+        return sorted(self.dirs.get(self._normalise(rel), ()))
+
+    def walk_files(self, rel: str = '') -> List[str]:
+        rel = self._normalise(rel)
+        if rel not in self.dirs:
+            return []
+        prefix = rel + '/' if rel else ''
+        return sorted(f for f in self.files if f.startswith(prefix))
+
+class ZipTree(SkillTree):
+    """A packaged skill: a .zip whose entries are the skill's files.
+
+    SkillPackager puts every entry under one <name>/ directory; when the
+    archive has a single top-level directory holding SKILL.md, that
+    directory is the skill root. Only the central directory is read up
+    front; file content is decompressed from the entry stream on demand.
+    Executable bits come from the Unix mode in each entry's external
+    attributes (archives made elsewhere have none).
+    """
+
+    def __init__(self, archive: Union[str, Path]):
+        """Raises zipfile.BadZipFile (or OSError) if archive is not a readable zip."""
+        self.archive = Path(archive)
+        self.zip = zipfile.ZipFile(self.archive)
+        entries: Dict[str, zipfile.ZipInfo] = {}
+        explicit_dirs: Set[str] = set()
+        for info in self.zip.infolist():
+            rel = MemoryTree._normalise(info.filename)
+            # Absolute and parent-relative names are never part of the skill
+            if not rel or rel == '..' or rel.startswith('../'):
+                continue
+            if info.is_dir():
+                explicit_dirs.add(rel)
+            else:
+                entries[rel] = info
+
+        tops = {rel.split('/', 1)[0] for rel in list(entries) + list(explicit_dirs)}
+        prefix = ''
+        if "SKILL.md" not in entries and len(tops) == 1:
+            top = tops.pop()
+            if f"{top}/SKILL.md" in entries:
+                prefix = top + '/'
+        self.name = prefix[:-1] if prefix else self.archive.stem
+
+        self.entries: Dict[str, zipfile.ZipInfo] = {
+            rel[len(prefix):]: info for rel, info in entries.items() if rel.startswith(prefix)
+        }
+        self.dirs: Dict[str, Set[str]] = {'': set()}
+        for rel in explicit_dirs:
+            if rel.startswith(prefix) and len(rel) > len(prefix):
+                self.dirs.setdefault(rel[len(prefix):], set())
+        for rel in list(self.entries) + list(self.dirs):
+            parent, child = posixpath.split(rel)
+            while child:
+                self.dirs.setdefault(parent, set()).add(child)
+                parent, child = posixpath.split(parent)
+
+    def close(self):
+        self.zip.close()
+
+    def _info(self, rel: str) -> zipfile.ZipInfo:
+        try:
+            return self.entries[MemoryTree._normalise(rel)]
+        except KeyError:
+            raise FileNotFoundError(rel)
+
+    def is_file(self, rel: str) -> bool:
+        return MemoryTree._normalise(rel) in self.entries
+
+    def is_dir(self, rel: str) -> bool:
+        return MemoryTree._normalise(rel) in self.dirs
+
+    def read_bytes(self, rel: str) -> bytes:
+        return self.zip.read(self._info(rel))
+
+    def open(self, rel: str) -> BinaryIO:
+        return self.zip.open(self._info(rel))
+
+    def file_size(self, rel: str) -> Optional[int]:
+        info = self.entries.get(MemoryTree._normalise(rel))
+        return info.file_size if info is not None else None
+
+    def mode(self, rel: str) -> int:
+        """Unix mode of an entry, or 0 if the archive did not record one."""
+        info = self._info(rel)
+        return info.external_attr >> 16 if info.create_system == 3 else 0
+
+    def is_executable(self, rel: str) -> bool:
+        try:
+            return bool(self.mode(rel) & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+        except FileNotFoundError:
+            return False
+
+    def listdir(self, rel: str) -> List[str]:
+        return sorted(self.dirs.get(MemoryTree._normalise(rel), ()))
+
+    def walk_files(self, rel: str = '') -> List[str]:
+        rel = MemoryTree._normalise(rel)
+        if rel not in self.dirs:
+            return []
+        prefix = rel + '/' if rel else ''
+        return sorted(f for f in self.entries if f.startswith(prefix))
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Skill Walk - Ignore-aware directory walking for skills
+
+One os.scandir walker shared by packaging (which files go in a package)
+and batch discovery (which directories hold a SKILL.md). Ignored
+directories are pruned before they are opened, so .git/, node_modules/
+and virtualenvs cost one directory entry each, not a walk of their
+contents.
+
+Ignore rules come from three places, later ones taking precedence:
+- DEFAULT_IGNORES: hidden files and directories, caches, compiled Python
+- .gitignore and .skillignore in the walked directory and below, applied
+  to their own subtree with gitignore semantics (*, **, ?, [...], a
+  leading or inner / to anchor, a trailing / for directories, ! to
+  re-include)
+- Directories containing pyvenv.cfg (virtualenvs) are always pruned
+
+Symlinked directories are followed; a link back to a directory already
+on the current path is recorded in `cycles` and not descended into.
+"""
+
+import os
+import re
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+IGNORE_FILES = ('.gitignore', '.skillignore')
+DEFAULT_IGNORES = (
+    '.*',
+    '__pycache__/',
+    'node_modules/',
+    '*.pyc',
+    '*.pyo',
+    'Thumbs.db',
+)
+VENV_MARKER = 'pyvenv.cfg'
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """One compiled pattern line, relative to the directory of its file."""
+    regex: "re.Pattern"
+    base: str
+    anchored: bool
+    dir_only: bool
+    negate: bool
+
+def _translate(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over '/'-separated paths."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif c == '*':
+            out.append('[^/]*')
+            i += 1
+        elif c == '?':
+            out.append('[^/]')
+            i += 1
+        elif c == '[':
+            j = pattern.find(']', i + 2)
+            if j == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:j].replace('\\', '\\\\')
+            if body[0] in '!^':
+                body = '^' + body[1:]
+            out.append(f'[{body}]')
+            i = j + 1
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return ''.join(out) + r'\Z'
+
+def compile_rule(line: str, base: str = '') -> Optional[IgnoreRule]:
+    """Compile one ignore-file line; None for blanks and comments."""
+    line = line.rstrip('\n').rstrip()
+    if not line or line.startswith('#'):
+        return None
+    negate = line.startswith('!')
+    if negate:
+        line = line[1:]
+    elif line.startswith('\\'):
+        line = line[1:]
+    dir_only = line.endswith('/')
+    line = line.rstrip('/')
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the file's directory
+    anchored = '/' in line
+    line = line.lstrip('/')
+    return IgnoreRule(re.compile(_translate(line)), base, anchored, dir_only, negate)
+
+def read_rules(path: Path, base: str) -> List[IgnoreRule]:
+    try:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    return [rule for rule in (compile_rule(line, base) for line in lines) if rule]
+
+DEFAULT_RULES = [compile_rule(pattern) for pattern in DEFAULT_IGNORES]
+
+def is_ignored(rules: Sequence[IgnoreRule], rel: str, is_dir: bool) -> bool:
+    """Whether rel (relative to the walk root) is ignored; the last matching rule wins."""
+    name = rel.rsplit('/', 1)[-1]
+    for rule in reversed(rules):
+        if rule.dir_only and not is_dir:
+            continue
+        if rule.anchored:
+            target = rel[len(rule.base) + 1:] if rule.base else rel
+        else:
+            target = name
+        if rule.regex.match(target):
+            return not rule.negate
+    return False
+
+class SkillWalker:
+    """Walk a directory with os.scandir, pruning ignored directories.
+
+    After a walk, `pruned` lists the directories skipped by rules,
+    `cycles` the symlinks that led back into their own ancestry and
+    `errors` the directories that could not be read.
+    """
+
+    def __init__(self, root, ignore_files: Sequence[str] = IGNORE_FILES,
+                 defaults: Optional[List[IgnoreRule]] = None, follow_symlinks: bool = True):
+        self.root = Path(root)
+        self.ignore_files = tuple(ignore_files)
+        self.rules = list(DEFAULT_RULES if defaults is None else defaults)
+        self.follow_symlinks = follow_symlinks
+        self.pruned: List[str] = []
+        self.cycles: List[str] = []
+        self.errors: List[str] = []
+
+    def walk(self, stop_at: Optional[str] = None) -> Iterator[Tuple[str, os.DirEntry]]:
+        """Yield (relative POSIX path, DirEntry) for every file not ignored.
+
+        With stop_at, a directory containing that file name yields only
+        that file and is not descended into (a skill owns its subtree).
+        """
+        try:
+            st = os.stat(self.root)
+        except OSError as e:
+            self.errors.append(f"{self.root}: {e.strerror}")
+            return
+        yield from self._walk(str(self.root), '', self.rules, [(st.st_dev, st.st_ino)], stop_at)
+
+    def _walk(self, path: str, rel: str, rules: List[IgnoreRule], ancestors: List[Tuple[int, int]],
+              stop_at: Optional[str]) -> Iterator[Tuple[str, os.DirEntry]]:
+        try:
+            with os.scandir(path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError as e:
+            self.errors.append(f"{rel or path}: {e.strerror}")
+            return
+        names = {entry.name for entry in entries}
+        if rel and VENV_MARKER in names:
+            self.pruned.append(rel)
+            return
+        if stop_at and stop_at in names:
+            entry = next(e for e in entries if e.name == stop_at)
+            yield (f"{rel}/{stop_at}" if rel else stop_at), entry
+            return
+
+        for filename in self.ignore_files:
+            if filename in names:
+                rules = rules + read_rules(Path(path) / filename, rel)
+
+        subdirs = []
+        for entry in entries:
+            child = f"{rel}/{entry.name}" if rel else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=self.follow_symlinks)
+            except OSError:
+                continue
+            if is_ignored(rules, child, is_dir):
+                if is_dir:
+                    self.pruned.append(child)
+                continue
+            if is_dir:
+                subdirs.append((entry, child))
+            elif entry.is_file(follow_symlinks=self.follow_symlinks):
+                yield child, entry
+
+        for entry, child in subdirs:
+            try:
+                st = entry.stat(follow_symlinks=True)
+            except OSError as e:
+                self.errors.append(f"{child}: {e.strerror}")
+                continue
+            key = (st.st_dev, st.st_ino)
+            if key in ancestors:
+                self.cycles.append(child)
+                continue
+            ancestors.append(key)
+            yield from self._walk(entry.path, child, rules, ancestors, stop_at)
+            ancestors.pop()
+
+    def files(self) -> List[Path]:
+        """Every file not ignored, as absolute-or-root-relative Paths, sorted."""
+        return sorted(self.root / rel for rel, _ in self.walk())
+
+def find_skills(roots: Iterable[str]) -> Iterator[Path]:
+    """Yield every SKILL.md under the given roots.
+
+    A root may be a SKILL.md file, a skill directory or any directory
+    containing skills. A directory holding SKILL.md owns its subtree, so the
+    walk does not descend further into it.
+    """
+    for root in roots:
+        root_path = Path(root)
+        if root_path.is_file():
+            yield root_path
+            continue
+        for rel, _ in SkillWalker(root_path).walk(stop_at="SKILL.md"):
+            yield root_path / rel
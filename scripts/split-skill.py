@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Skill Splitter - Move heavy SKILL.md sections into references/
+
+SKILL.md is loaded on every activation; references/ files only when the
+agent follows a link. The splitter ranks the ## sections of SKILL.md by
+size and by how likely they are to be needed, moves the heaviest,
+least-needed ones into references/<section>.md, and leaves a short
+summary with a link in their place.
+
+- Sections the validator flags (over 100 lines without a heading) are
+  always moved; others go, heaviest first, until SKILL.md is under the
+  target length
+- Sections titled like core instructions (overview, quick start, usage,
+  workflow, ...) stay unless they are flagged
+- Links are retargeted: #anchors to moved sections, relative paths in
+  moved content, and references/ files linking back into SKILL.md
+- The result is re-validated, in memory with --dry-run
+
+Usage:
+    python split-skill.py path/to/skill --dry-run
+    python split-skill.py path/to/skill --target-lines 200
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import posixpath
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from skill_api import validate_tree
+from skill_frontmatter import FrontmatterError, as_text, parse_frontmatter
+from skill_links import slugify
+from skill_tree import DiskTree, MemoryTree, SkillTree
+
+DEFAULT_TARGET_LINES = 300
+# Same limit as the validator's long-section check
+SECTION_RUN_LIMIT = 100
+# Moving a section shorter than this saves little over its summary
+MIN_MOVE_LINES = 12
+SUMMARY_CHARS = 160
+MAX_COVERS = 6
+
+ESSENTIAL_WORDS = ('overview', 'quick start', 'quickstart', 'getting started', 'usage', 'when to use',
+                   'workflow', 'instructions', 'steps', 'process', 'rules', 'core', 'how to')
+REFERENCE_WORDS = ('reference', 'api', 'example', 'troubleshoot', 'faq', 'appendix', 'advanced',
+                   'detail', 'configuration', 'specification', 'schema', 'glossary', 'changelog',
+                   'background', 'internals', 'options', 'parameters', 'template')
+
+FRONTMATTER_END_RE = re.compile(r'^---[ \t]*$', re.MULTILINE)
+HEADING_RE = re.compile(r'^ {0,3}(#{1,6})[ \t]+(.+?)[ \t]*#*[ \t]*$')
+FENCE_RE = re.compile(r'^ {0,3}(```|~~~)')
+LINK_RE = re.compile(r'(!?\[[^\]\n]*\]\(\s*<?)([^)\s>]+)')
+SCHEME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+WORD_RE = re.compile(r'[a-z]{3,}')
+# Keywords match at the start of a word: 'examples' counts, 'score' is not 'core'
+ESSENTIAL_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, ESSENTIAL_WORDS)) + ')')
+REFERENCE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, REFERENCE_WORDS)) + ')')
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+@dataclass
+class Section:
+    """One top-level section of the SKILL.md body."""
+    title: str
+    lines: List[str]
+    anchors: List[str] = field(default_factory=list)
+    subsections: List[str] = field(default_factory=list)
+    need: float = 0.5
+    flagged: bool = False
+    target: Optional[str] = None
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    @property
+    def weight(self) -> float:
+        """Lines saved per activation, discounted by how often the section is needed."""
+        return self.line_count * (1 - self.need)
+
+def split_frontmatter(content: str) -> Tuple[str, str]:
+    """The raw frontmatter block (kept byte for byte) and the body after it."""
+    if content.startswith('---'):
+        match = FRONTMATTER_END_RE.search(content, content.find('\n') + 1)
+        if match:
+            end = match.end() + 1 if content[match.end():match.end() + 1] == '\n' else match.end()
+            return content[:end], content[end:]
+    return '', content
+
+def map_outside_fences(lines: List[str], func: Callable[[str], str]) -> List[str]:
+    """Apply func to every line that is not inside a fenced code block."""
+    out = []
+    marker = None
+    for line in lines:
+        fence = FENCE_RE.match(line)
+        if fence:
+            if marker is None:
+                marker = fence.group(1)
+            elif fence.group(1) == marker:
+                marker = None
+            out.append(line)
+        else:
+            out.append(line if marker is not None else func(line))
+    return out
+
+def headings(lines: List[str]) -> List[Tuple[int, int, str]]:
+    """(line index, level, text) of every heading outside code fences."""
+    found = []
+    marker = None
+    for index, line in enumerate(lines):
+        fence = FENCE_RE.match(line)
+        if fence:
+            if marker is None:
+                marker = fence.group(1)
+            elif fence.group(1) == marker:
+                marker = None
+        elif marker is None:
+            match = HEADING_RE.match(line)
+            if match:
+                found.append((index, len(match.group(1)), match.group(2)))
+    return found
+
+def longest_run(lines: List[str]) -> int:
+    """Longest stretch of lines without a '#' line, as the validator counts it."""
+    longest = current = 0
+    for line in lines:
+        if line.startswith('#'):
+            current = 0
+        else:
+            current += 1
+            longest = max(longest, current)
+    return longest
+
+def parse_sections(body: str) -> Tuple[List[str], List[Section], int]:
+    """Split a body into the lines before the first section, the sections, and their level."""
+    lines = body.split('\n')
+    found = headings(lines)
+    levels = [level for _, level, _ in found if level > 1]
+    if not levels:
+        return lines, [], 0
+    level = min(levels)
+    starts = [(index, text) for index, lvl, text in found if lvl == level]
+    preamble = lines[:starts[0][0]]
+    sections = []
+    for n, (start, title) in enumerate(starts):
+        end = starts[n + 1][0] if n + 1 < len(starts) else len(lines)
+        section = Section(title, lines[start:end])
+        for index, lvl, text in found:
+            if start <= index < end:
+                section.anchors.append(slugify(text))
+                if lvl == level + 1:
+                    section.subsections.append(text)
+        section.flagged = longest_run(section.lines) > SECTION_RUN_LIMIT
+        sections.append(section)
+    return preamble, sections, level
+
+def rate_need(sections: List[Section], description: str, body: str):
+    """How likely each section is to be needed on an activation, 0..1."""
+    description_words = set(WORD_RE.findall(description.lower()))
+    for section in sections:
+        title = section.title.lower()
+        if ESSENTIAL_RE.search(title):
+            need = 1.0
+        elif REFERENCE_RE.search(title):
+            need = 0.2
+        else:
+            need = 0.5
+        words = set(WORD_RE.findall(title))
+        if words:
+            need += 0.3 * len(words & description_words) / len(words)
+        # Linked to from elsewhere in the body: needed to follow the main text
+        links = sum(body.count(f"](#{anchor})") for anchor in section.anchors[:1])
+        need += 0.1 * min(links, 3)
+        section.need = min(1.0, round(need, 2))
+
+def choose_sections(preamble: List[str], sections: List[Section], target_lines: int) -> List[Section]:
+    """Flagged sections, then the heaviest low-need ones until the body fits the target."""
+    chosen = [s for s in sections if s.flagged]
+    projected = len(preamble) + sum(s.line_count for s in sections)
+    projected -= sum(s.line_count - 5 for s in chosen)
+    candidates = sorted((s for s in sections if not s.flagged and s.need < 1.0),
+                        key=lambda s: -s.weight)
+    for section in candidates:
+        if projected <= target_lines:
+            break
+        if section.line_count < MIN_MOVE_LINES:
+            continue
+        chosen.append(section)
+        projected -= section.line_count - 5
+    return chosen
+
+def summarize(section: Section) -> str:
+    """First sentence of the section's first paragraph of prose, else what its table holds."""
+    marker = None
+    columns: List[str] = []
+    rows = 0
+    for line in section.lines[1:]:
+        fence = FENCE_RE.match(line)
+        if fence:
+            marker = fence.group(1) if marker is None else (None if fence.group(1) == marker else marker)
+            continue
+        text = line.strip()
+        if marker is not None or not text:
+            continue
+        if text.startswith('|'):
+            cells = [cell.strip() for cell in text.strip('|').split('|')]
+            if not columns:
+                columns = cells
+            elif not all(set(cell) <= set('-: ') for cell in cells):
+                rows += 1
+            continue
+        if text.startswith(('#', '<', '>', '!')):
+            continue
+        text = re.sub(r'^(?:[-*+]|\d+\.)\s+', '', text)
+        sentence = re.split(r'(?<=[.!?])\s', text, maxsplit=1)[0]
+        if len(sentence) > SUMMARY_CHARS:
+            sentence = sentence[:SUMMARY_CHARS].rsplit(' ', 1)[0] + '...'
+        return sentence
+    if columns:
+        return f"Table of {rows} rows: {', '.join(columns)}."
+    return f"Details on {section.title.strip('*_`')}."
+
+def reference_name(title: str, taken: set) -> str:
+    base = slugify(title).strip('-') or 'section'
+    name = f"references/{base}.md"
+    n = 2
+    while name in taken:
+        name = f"references/{base}-{n}.md"
+        n += 1
+    taken.add(name)
+    return name
+
+def retarget(target: str, source: str, new_source: str, anchor_home: Dict[str, str]) -> str:
+    """Rewrite a link found in source (now living at new_source) after sections moved."""
+    if SCHEME_RE.match(target) or target.startswith('/'):
+        return target
+    path, _, fragment = target.partition('#')
+    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(source), path)) if path else source
+    if resolved == 'SKILL.md' and fragment in anchor_home:
+        resolved = anchor_home[fragment]
+    if resolved == source and source == new_source:
+        return target
+    if resolved == new_source:
+        new_path = ''
+    else:
+        new_path = posixpath.relpath(resolved, posixpath.dirname(new_source) or '.')
+    if path and posixpath.normpath(path) == new_path:
+        return target
+    if not new_path and not fragment:
+        return target
+    return new_path + (f"#{fragment}" if fragment else '')
+
+def rewrite_links(lines: List[str], source: str, new_source: str, anchor_home: Dict[str, str]) -> List[str]:
+    def fix(line):
+        return LINK_RE.sub(lambda m: m.group(1) + retarget(m.group(2), source, new_source, anchor_home), line)
+    return map_outside_fences(lines, fix)
+
+def shift_headings(lines: List[str], by: int) -> List[str]:
+    def shift(line):
+        match = HEADING_RE.match(line)
+        if not match:
+            return line
+        return '#' * max(1, len(match.group(1)) - by) + line[line.index('#') + len(match.group(1)):]
+    return map_outside_fences(lines, shift)
+
+class SkillSplitter:
+    """Plan and apply a split of one skill's SKILL.md."""
+
+    def __init__(self, skill_path: str, target_lines: int = DEFAULT_TARGET_LINES):
+        path = Path(skill_path).resolve()
+        self.skill_path = path.parent if path.is_file() else path
+        self.target_lines = target_lines
+        self.content = ""
+        self.sections: List[Section] = []
+        self.moved: List[Section] = []
+        self.files: Dict[str, str] = {}
+
+    def plan(self) -> Dict[str, str]:
+        """Compute the new SKILL.md and reference files; returns {relative path: content}."""
+        self.content = (self.skill_path / "SKILL.md").read_text(encoding='utf-8')
+        frontmatter, _ = parse_frontmatter(self.content)
+        raw_frontmatter, body = split_frontmatter(self.content)
+        preamble, self.sections, level = parse_sections(body)
+        rate_need(self.sections, as_text(frontmatter.get('description')), body)
+        self.moved = choose_sections(preamble, self.sections, self.target_lines)
+
+        taken = {f"references/{p.name}" for p in (self.skill_path / "references").glob("*")} \
+            if (self.skill_path / "references").is_dir() else set()
+        anchor_home: Dict[str, str] = {}
+        for section in self.sections:
+            if any(section is moved for moved in self.moved):
+                section.target = reference_name(section.title, taken)
+                for anchor in section.anchors:
+                    anchor_home.setdefault(anchor, section.target)
+
+        files: Dict[str, str] = {}
+        out = list(preamble)
+        for section in self.sections:
+            if section.target is None:
+                out.extend(section.lines)
+                continue
+            moved_lines = rewrite_links(section.lines, "SKILL.md", section.target, anchor_home)
+            moved_lines = shift_headings(moved_lines, level - 1)
+            files[section.target] = '\n'.join(moved_lines).rstrip('\n') + '\n'
+            out.extend(self.stub(section))
+        out = rewrite_links(out, "SKILL.md", "SKILL.md", anchor_home)
+        files["SKILL.md"] = raw_frontmatter + '\n'.join(out)
+
+        # Existing references that link back into moved parts of SKILL.md
+        if anchor_home and (self.skill_path / "references").is_dir():
+            for ref in sorted((self.skill_path / "references").glob("*.md")):
+                rel = f"references/{ref.name}"
+                text = ref.read_text(encoding='utf-8')
+                updated = '\n'.join(rewrite_links(text.split('\n'), rel, rel, anchor_home))
+                if updated != text:
+                    files[rel] = updated
+        self.files = files
+        return files
+
+    def stub(self, section: Section) -> List[str]:
+        """Heading, one-sentence summary and link left in place of a moved section."""
+        covers = ""
+        if section.subsections:
+            names = [s.strip('*_`') for s in section.subsections[:MAX_COVERS]]
+            more = ", ..." if len(section.subsections) > MAX_COVERS else ""
+            covers = f" Covers: {', '.join(names)}{more}."
+        title = re.sub(r'[\[\]]', '', section.title)
+        trailing = len(section.lines) - len('\n'.join(section.lines).rstrip('\n').split('\n'))
+        return [
+            section.lines[0],
+            "",
+            summarize(section),
+            "",
+            f"Full section: [{title}]({section.target}).{covers}",
+        ] + [""] * max(1, trailing)
+
+    def write(self):
+        for rel, text in self.files.items():
+            path = self.skill_path / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.tmp")
+            tmp.write_text(text, encoding='utf-8')
+            os.replace(tmp, path)
+
+    def overlay(self) -> SkillTree:
+        """The skill as it would be after writing, in memory."""
+        tree = DiskTree(self.skill_path)
+        contents = {}
+        executable = []
+        for rel in tree.walk_files():
+            contents[rel] = tree.read_bytes(rel)
+            if tree.is_executable(rel):
+                executable.append(rel)
+        contents.update(self.files)
+        return MemoryTree(contents, name=self.skill_path.name, executable=executable)
+
+def size_of(text: str) -> Dict[str, int]:
+    data = text.encode('utf-8')
+    return {"lines": text.count('\n') + 1, "bytes": len(data), "tokens": len(data) // 4}
+
+def validation_summary(report: Dict) -> Dict:
+    results = report.get("results", [])
+    return {
+        "passed": sum(1 for r in results if r["passed"]),
+        "total": len(results),
+        "failed": [f"{r['name']}: {r['message']}" for r in results if not r["passed"]],
+    }
+
+def print_report(splitter: SkillSplitter, report: Dict, dry_run: bool):
+    print(colorize(f"\n=== Progressive Disclosure Split: {splitter.skill_path.name} ===\n", Colors.BOLD))
+    if not splitter.sections:
+        print("No ## sections found")
+    for section in sorted(splitter.sections, key=lambda s: -s.weight):
+        if section.target:
+            status = colorize("Move", Colors.YELLOW)
+            where = f"-> {section.target}" + (" (long section)" if section.flagged else "")
+        else:
+            status = "Keep"
+            where = ""
+        print(f"  {status}  {section.title[:40]:<40} {section.line_count:>5} lines  need {section.need:.2f}  {where}")
+
+    before, after = report["before"], report["after"]
+    print(f"\nAlways-loaded SKILL.md: {before['lines']} lines, {before['bytes'] / 1024:.1f} KB (~{before['tokens']:,} tokens)"
+          f" -> {after['lines']} lines, {after['bytes'] / 1024:.1f} KB (~{after['tokens']:,} tokens)")
+    for label in ("validation_before", "validation_after"):
+        summary = report[label]
+        color = Colors.GREEN if not summary["failed"] else Colors.YELLOW
+        when = "before" if label.endswith("before") else "after"
+        print(colorize(f"Validation {when}: {summary['passed']}/{summary['total']} checks passed", color))
+    for failure in report["validation_after"]["failed"]:
+        print(colorize(f"  [FAIL] {failure}", Colors.RED))
+    if not splitter.moved:
+        print(f"\nNothing to move: SKILL.md is within {splitter.target_lines} lines and has no long sections")
+    elif dry_run:
+        print(colorize("\nDry run: no files written", Colors.BLUE))
+    else:
+        print(colorize(f"\nWrote {len(splitter.files)} files", Colors.GREEN))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Move heavy SKILL.md sections into references/ and re-validate"
+    )
+    parser.add_argument(
+        "path",
+        help="Path to skill directory or SKILL.md file"
+    )
+    parser.add_argument(
+        "--target-lines",
+        type=int,
+        default=DEFAULT_TARGET_LINES,
+        help=f"Move sections until SKILL.md is at most this many lines (default: {DEFAULT_TARGET_LINES})"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show the plan and validate the result in memory without writing"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output result as JSON"
+    )
+
+    args = parser.parse_args()
+
+    splitter = SkillSplitter(args.path, args.target_lines)
+    if not (splitter.skill_path / "SKILL.md").is_file():
+        print(colorize(f"Error: no SKILL.md in {splitter.skill_path}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+    try:
+        files = splitter.plan()
+    except FrontmatterError as e:
+        print(colorize(f"Error: SKILL.md frontmatter: {e}", Colors.RED), file=sys.stderr)
+        sys.exit(2)
+
+    report = {
+        "skill_path": str(splitter.skill_path),
+        "dry_run": args.dry_run,
+        "before": size_of(splitter.content),
+        "after": size_of(files["SKILL.md"]),
+        "sections": [
+            {"title": s.title, "lines": s.line_count, "need": s.need, "long": s.flagged, "moved_to": s.target}
+            for s in splitter.sections
+        ],
+        "validation_before": validation_summary(validate_tree(DiskTree(splitter.skill_path))),
+    }
+    if splitter.moved and not args.dry_run:
+        splitter.write()
+        after_tree = DiskTree(splitter.skill_path)
+    else:
+        after_tree = splitter.overlay() if splitter.moved else DiskTree(splitter.skill_path)
+    report["validation_after"] = validation_summary(validate_tree(after_tree))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(splitter, report, args.dry_run)
+
+    sys.exit(0 if not report["validation_after"]["failed"] else 1)
+
+if __name__ == "__main__":
+    main()
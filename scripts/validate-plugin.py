@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Plugin Validator - Validate a whole .claude-plugin bundle in one run
+
+Loads .claude-plugin/plugin.json once and checks every component it lists:
+- Manifest: valid JSON, a kebab-case name, well-formed skills/commands/agents
+  entries with unique names, and paths that stay inside the plugin
+- Skills: the full 7-point SkillValidator checks, plus the manifest name
+  matching the SKILL.md name
+- Commands and agents: frontmatter that parses, a description, and a name
+  matching the manifest entry (and, for commands, the file name)
+
+Components are checked in parallel and reported together; commands/*.md
+and agents/*.md files the manifest does not list are noted.
+
+Usage:
+    python validate-plugin.py                 # plugin in the current directory
+    python validate-plugin.py path/to/plugin --json
+    python validate-plugin.py path/to/plugin/.claude-plugin/plugin.json
+"""
+
+import re
+import sys
+import json
+import argparse
+from pathlib import Path
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from skill_api import load_script
+from skill_frontmatter import FrontmatterError, as_text, parse_frontmatter
+from skill_links import LinkCache
+
+_validate_skill = load_script("validate-skill.py")
+ValidationResult = _validate_skill.ValidationResult
+SkillValidator = _validate_skill.SkillValidator
+
+MANIFEST_PATH = Path(".claude-plugin") / "plugin.json"
+# Manifest key -> component kind, in report order
+COMPONENT_KINDS = (("skills", "skill"), ("commands", "command"), ("agents", "agent"))
+NAME_RE = re.compile(r'^[a-z0-9-]+$')
+VERSION_RE = re.compile(r'^\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?$')
+
+class Colors:
+    GREEN = '\033[92m'
+    YELLOW = '\033[93m'
+    RED = '\033[91m'
+    BLUE = '\033[94m'
+    BOLD = '\033[1m'
+    END = '\033[0m'
+
+def colorize(text: str, color: str) -> str:
+    if sys.stdout.isatty():
+        return f"{color}{text}{Colors.END}"
+    return text
+
+def result_dict(result: ValidationResult) -> Dict:
+    return {"name": result.name, "passed": result.passed, "message": result.message, "details": result.details}
+
+@dataclass
+class Component:
+    """One skills/commands/agents entry of the manifest."""
+    kind: str
+    name: str
+    path: str
+    results: List[ValidationResult] = field(default_factory=list)
+    # Full validate-skill.py report, for skills
+    report: Optional[Dict] = None
+
+    @property
+    def passed(self) -> bool:
+        return all(r.passed for r in self.results)
+
+    def to_dict(self) -> Dict:
+        output = {
+            "kind": self.kind,
+            "name": self.name,
+            "path": self.path,
+            "passed": self.passed,
+            "results": [result_dict(r) for r in self.results],
+        }
+        if self.report is not None:
+            output["skill_path"] = self.report["skill_path"]
+            if self.report.get("skipped_checks"):
+                output["skipped_checks"] = self.report["skipped_checks"]
+        return output
+
+class PluginValidator:
+    """Validates a plugin manifest and every component it lists."""
+
+    def __init__(self, plugin_path: str, link_cache: Optional[LinkCache] = None,
+                 workers: int = 4, fail_fast: bool = False):
+        path = Path(plugin_path).resolve()
+        if path.is_file():
+            # .claude-plugin/plugin.json given directly
+            self.manifest_path = path
+            self.root = path.parent.parent if path.parent.name == ".claude-plugin" else path.parent
+        else:
+            self.root = path
+            self.manifest_path = path / MANIFEST_PATH
+        self.link_cache = link_cache
+        self.workers = max(1, workers)
+        self.fail_fast = fail_fast
+        self.manifest: Dict = {}
+        self.manifest_results: List[ValidationResult] = []
+        self.components: List[Component] = []
+
+    def load_manifest(self) -> bool:
+        """Read plugin.json; records a failed Manifest result if it cannot be used."""
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            self.manifest_results.append(ValidationResult(
+                "Manifest", False, "Could not find plugin.json", [f"Searched for: {self.manifest_path}"]))
+            return False
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            self.manifest_results.append(ValidationResult(
+                "Manifest", False, "Could not parse plugin.json", [str(e)]))
+            return False
+        if not isinstance(manifest, dict):
+            self.manifest_results.append(ValidationResult(
+                "Manifest", False, "plugin.json must be a JSON object"))
+            return False
+        self.manifest = manifest
+        return True
+
+    def resolve(self, rel: str) -> Optional[Path]:
+        """The path of a manifest entry, or None if it points outside the plugin."""
+        path = (self.root / rel).resolve()
+        try:
+            path.relative_to(self.root)
+        except ValueError:
+            return None
+        return path
+
+    def validate_manifest(self) -> ValidationResult:
+        """Check the manifest fields and collect its components."""
+        issues = []
+        name = self.manifest.get('name')
+        if not isinstance(name, str) or not name:
+            issues.append("Missing required 'name' field")
+        elif not NAME_RE.match(name):
+            issues.append("'name' should be lowercase with dashes (e.g., 'my-plugin')")
+        version = self.manifest.get('version')
+        if version is not None and not (isinstance(version, str) and VERSION_RE.match(version)):
+            issues.append(f"'version' should be semantic (e.g., '1.0.0'), got {version!r}")
+
+        for key, kind in COMPONENT_KINDS:
+            entries = self.manifest.get(key, [])
+            if not isinstance(entries, list):
+                issues.append(f"'{key}' must be a list")
+                continue
+            seen = set()
+            for position, entry in enumerate(entries, 1):
+                if not isinstance(entry, dict):
+                    issues.append(f"{key}[{position}] must be an object with 'name' and 'path'")
+                    continue
+                entry_name, entry_path = entry.get('name'), entry.get('path')
+                if not isinstance(entry_name, str) or not entry_name:
+                    issues.append(f"{key}[{position}] is missing 'name'")
+                    continue
+                if not isinstance(entry_path, str) or not entry_path:
+                    issues.append(f"{key}[{position}] ({entry_name}) is missing 'path'")
+                    continue
+                if entry_name in seen:
+                    issues.append(f"{kind} '{entry_name}' is listed more than once")
+                    continue
+                seen.add(entry_name)
+                self.components.append(Component(kind, entry_name, entry_path))
+
+        if issues:
+            return ValidationResult("Manifest", False, "Manifest issues found", issues)
+        counts = ", ".join(f"{sum(1 for c in self.components if c.kind == kind)} {key}"
+                           for key, kind in COMPONENT_KINDS)
+        return ValidationResult("Manifest", True, f"Manifest is valid ({counts})")
+
+    def find_unlisted(self) -> Optional[ValidationResult]:
+        """Note commands/*.md and agents/*.md files the manifest leaves out."""
+        listed = {self.resolve(c.path) for c in self.components}
+        unlisted = []
+        for directory in ("commands", "agents"):
+            for path in sorted((self.root / directory).glob("*.md")):
+                if path.resolve() not in listed:
+                    unlisted.append(f"{directory}/{path.name} is not listed in plugin.json")
+        if not unlisted:
+            return None
+        return ValidationResult("Unlisted Files", True, "Files not in the manifest are not loaded", unlisted)
+
+    def check_skill(self, component: Component, path: Path) -> List[ValidationResult]:
+        validator = SkillValidator(str(path), self.link_cache)
+        all_passed, results = validator.validate(fail_fast=self.fail_fast)
+        component.report = validator.to_dict(all_passed)
+        results = list(results)
+        if validator.skill_md_path is not None and validator.parse_error is None:
+            skill_name = as_text(validator.frontmatter.get('name'))
+            if skill_name and skill_name != component.name:
+                results.append(ValidationResult(
+                    "Manifest Name", False, "Name does not match SKILL.md",
+                    [f"plugin.json lists '{component.name}', SKILL.md says '{skill_name}'"]))
+        return results
+
+    def check_markdown(self, component: Component, path: Path) -> List[ValidationResult]:
+        """Frontmatter checks for a command or agent file."""
+        if not path.is_file():
+            return [ValidationResult("Frontmatter", False, f"{component.path} is not a file")]
+        try:
+            content = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            return [ValidationResult("Frontmatter", False, f"Could not read {component.path}", [str(e)])]
+        if not content.startswith('---'):
+            return [ValidationResult("Frontmatter", False, "Missing frontmatter",
+                                     ["The file must start with a '---' frontmatter block"])]
+        try:
+            frontmatter, _ = parse_frontmatter(content)
+        except FrontmatterError as e:
+            return [ValidationResult("Frontmatter", False, "Could not parse frontmatter",
+                                     [f"Frontmatter error at {e}"])]
+
+        issues = []
+        name = as_text(frontmatter.get('name'))
+        if not name:
+            if component.kind == "agent":
+                issues.append("Missing required 'name' field")
+        elif not NAME_RE.match(name):
+            issues.append("'name' should be lowercase with dashes (e.g., 'my-command')")
+        elif name != component.name:
+            issues.append(f"plugin.json lists '{component.name}', frontmatter says '{name}'")
+        # Commands are invoked by file name
+        if component.kind == "command" and path.stem != component.name:
+            issues.append(f"File name '{path.name}' does not match command '{component.name}'")
+        if not as_text(frontmatter.get('description')).strip():
+            issues.append("Missing required 'description' field")
+        if issues:
+            return [ValidationResult("Frontmatter", False, "Frontmatter issues found", issues)]
+        return [ValidationResult("Frontmatter", True, "Frontmatter is valid")]
+
+    def check_component(self, component: Component) -> Component:
+        path = self.resolve(component.path)
+        if path is None:
+            component.results = [ValidationResult(
+                "Path", False, "Path points outside the plugin", [component.path])]
+        elif not path.exists():
+            component.results = [ValidationResult(
+                "Path", False, "Path does not exist", [component.path])]
+        elif component.kind == "skill":
+            component.results = self.check_skill(component, path)
+        else:
+            component.results = self.check_markdown(component, path)
+        return component
+
+    def validate(self) -> bool:
+        """Run every check; returns whether the whole plugin passed."""
+        self.manifest_results = []
+        self.components = []
+        if not self.load_manifest():
+            return False
+        self.manifest_results.append(self.validate_manifest())
+        unlisted = self.find_unlisted()
+        if unlisted is not None:
+            self.manifest_results.append(unlisted)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            self.components = list(pool.map(self.check_component, self.components))
+        return self.passed
+
+    @property
+    def passed(self) -> bool:
+        return all(r.passed for r in self.manifest_results) and all(c.passed for c in self.components)
+
+    def to_dict(self) -> Dict:
+        return {
+            "plugin_path": str(self.root),
+            "name": as_text(self.manifest.get('name')),
+            "version": as_text(self.manifest.get('version')),
+            "all_passed": self.passed,
+            "manifest": [result_dict(r) for r in self.manifest_results],
+            "components": [c.to_dict() for c in self.components],
+        }
+
+    def print_results(self):
+        print(colorize("\n=== Plugin Validation Report ===\n", Colors.BOLD))
+        name = as_text(self.manifest.get('name')) or self.root.name
+        version = as_text(self.manifest.get('version'))
+        print(f"Plugin: {name}" + (f" {version}" if version else ""))
+        print(f"Path: {self.root}\n")
+
+        for result in self.manifest_results:
+            print(result)
+            print()
+
+        for component in self.components:
+            status = colorize("PASS", Colors.GREEN) if component.passed else colorize("FAIL", Colors.RED)
+            print(f"[{status}] {component.kind} {component.name} ({component.path})")
+            for result in component.results:
+                if not result.passed:
+                    print(f"       {result.name}: {result.message}")
+                    for detail in result.details:
+                        print(f"         - {detail}")
+
+        print(colorize("\n=== Summary ===", Colors.BOLD))
+        passed = sum(1 for c in self.components if c.passed)
+        total = len(self.components)
+        if self.passed:
+            print(colorize(f"All {total} components passed!", Colors.GREEN))
+        elif not all(r.passed for r in self.manifest_results):
+            print(colorize(f"Manifest failed; {passed}/{total} components passed", Colors.RED))
+        else:
+            print(colorize(f"{passed}/{total} components passed", Colors.YELLOW if passed > total / 2 else Colors.RED))
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate a Claude Code plugin: its manifest, skills, commands and agents"
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=".",
+        help="Plugin directory or its .claude-plugin/plugin.json (default: current directory)"
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Components checked at once (default: 4)"
+    )
+    parser.add_argument(
+        "--link-cache",
+        help="Cache file for scanned links and headings (default: ~/.cache/skill-factory/links.json)"
+    )
+    parser.add_argument(
+        "--no-link-cache",
+        action="store_true",
+        help="Rescan every markdown file instead of using the link cache"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop each skill's checks at its first failure"
+    )
+
+    args = parser.parse_args()
+
+    link_cache = None if args.no_link_cache else LinkCache.load(args.link_cache)
+    validator = PluginValidator(args.path, link_cache, args.workers, args.fail_fast)
+    all_passed = validator.validate()
+    if link_cache:
+        link_cache.save()
+
+    if args.json:
+        print(json.dumps(validator.to_dict(), indent=2))
+    else:
+        validator.print_results()
+
+    sys.exit(0 if all_passed else 1)
+
+if __name__ == "__main__":
+    main()
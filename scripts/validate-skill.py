@@ -12,14 +12,25 @@ Validates skills against Anthropic's best practices:
 7. Cross-Platform - agentskills.io compatibility
 """
 
-import os
 import sys
 import re
 import json
+import time
+import zipfile
 import argparse
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 
+from skill_frontmatter import FrontmatterError, as_text, parse_frontmatter
+from skill_hooks import HookHarness, declared_hooks
+from skill_limits import (ResourceLimitExceeded, ResourceLimits, add_limit_arguments, check_content,
+                          check_file, limits_from_args, run_limited)
+from skill_links import LinkCache, check_links
+from skill_metrics import Metrics, add_metrics_argument
+from skill_shard import add_shard_arguments, record_costs, shard_info, shard_paths, skill_key
+from skill_tree import DiskTree, SkillTree, ZipTree
+
 # ANSI colors for terminal output
 class Colors:
     GREEN = '\033[92m'
@@ -52,88 +63,137 @@ class ValidationResult:
                 result += f"\n       - {detail}"
         return result
 
+# Relative cost of each check in milliseconds, used to order checks when
+# failing fast. In-memory checks are cheap; checks that touch the filesystem
+# come last. Measured costs from --cost-file override these estimates.
+DEFAULT_CHECK_COSTS = {
+    "Frontmatter": 0.01,
+    "Description": 0.02,
+    "Content": 0.2,
+    "Structure": 0.5,
+    "Progressive Disclosure": 0.5,
+    "Cross-Platform": 0.5,
+    "Resources": 2.0,
+}
+
+def load_check_costs(cost_file: Optional[str]) -> Dict[str, float]:
+    """Load measured check costs, falling back to the default estimates."""
+    costs = dict(DEFAULT_CHECK_COSTS)
+    if cost_file and Path(cost_file).exists():
+        try:
+            with open(cost_file) as f:
+                measured = json.load(f)
+            costs.update({k: float(v) for k, v in measured.items() if k in costs})
+        except (OSError, ValueError):
+            pass
+    return costs
+
+def save_check_costs(cost_file: str, costs: Dict[str, float], timings: Dict[str, List[float]]):
+    """Fold measured check durations ({name: [total_ms, count]}) into the cost file."""
+    updated = dict(costs)
+    for name, (total, count) in timings.items():
+        if not count:
+            continue
+        mean = total / count
+        previous = updated.get(name)
+        updated[name] = mean if previous is None else 0.7 * previous + 0.3 * mean
+    with open(cost_file, 'w') as f:
+        json.dump({k: round(v, 4) for k, v in updated.items()}, f, indent=2)
+
 class SkillValidator:
     """Validates Claude Code skills against best practices."""
 
-    def __init__(self, skill_path: str):
-        self.skill_path = Path(skill_path).resolve()
+    # Check name -> method, in report order
+    CHECKS = [
+        ("Structure", "validate_structure"),
+        ("Frontmatter", "validate_frontmatter"),
+        ("Description", "validate_description"),
+        ("Content", "validate_content"),
+        ("Progressive Disclosure", "validate_progressive_disclosure"),
+        ("Resources", "validate_resources"),
+        ("Cross-Platform", "validate_cross_platform"),
+    ]
+    # Runs the skill's hooks, so only when a latency budget is given
+    HOOK_CHECK = ("Hook Latency", "validate_hook_latency")
+    HOOK_CHECK_RUNS = 10
+
+    def __init__(self, skill_path: str, link_cache: Optional[LinkCache] = None,
+                 tree: Optional[SkillTree] = None, limits: Optional[ResourceLimits] = None):
+        # A tree given up front (e.g. a MemoryTree) replaces the filesystem
+        self.tree = tree
+        self.skill_path = Path(skill_path) if tree is not None else Path(skill_path).resolve()
+        self.link_cache = link_cache
+        self.limits = limits
+        self.hook_budget: Optional[float] = None
         self.skill_md_path = None
         self.content = ""
         self.frontmatter = {}
         self.body = ""
+        self.body_lower = ""
+        self.parse_error: Optional[FrontmatterError] = None
         self.results: List[ValidationResult] = []
+        self.skipped: List[str] = []
+        self.timings: Dict[str, float] = {}
 
     def find_skill_file(self) -> bool:
         """Locate the SKILL.md file."""
+        if self.tree is not None:
+            if self.tree.is_file("SKILL.md"):
+                self.skill_md_path = self.skill_path / "SKILL.md"
+            return self.skill_md_path is not None
+
         if self.skill_path.is_file() and self.skill_path.name == "SKILL.md":
             self.skill_md_path = self.skill_path
             self.skill_path = self.skill_path.parent
+        elif self.skill_path.is_file() and self.skill_path.suffix.lower() == ".zip":
+            # A packaged skill, read in place from the archive
+            try:
+                self.tree = ZipTree(self.skill_path)
+            except (OSError, zipfile.BadZipFile):
+                return False
+            if self.tree.is_file("SKILL.md"):
+                self.skill_md_path = self.skill_path / "SKILL.md"
+            return self.skill_md_path is not None
         elif self.skill_path.is_dir():
             skill_file = self.skill_path / "SKILL.md"
             if skill_file.exists():
                 self.skill_md_path = skill_file
 
+        if self.skill_md_path is not None:
+            self.tree = DiskTree(self.skill_path)
         return self.skill_md_path is not None
 
-    def parse_frontmatter(self) -> bool:
-        """Parse YAML frontmatter from SKILL.md."""
+    def read_skill_file(self) -> bool:
+        """Read SKILL.md into self.content.
+
+        Raises ResourceLimitExceeded if it is over self.limits.
+        """
+        if self.limits:
+            check_file(self.tree, "SKILL.md", self.limits)
         try:
-            with open(self.skill_md_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
+            self.content = self.tree.read_text("SKILL.md")
         except Exception as e:
             return False
+        if self.limits:
+            check_content(self.content, self.limits)
+        return True
 
-        # Check for frontmatter
-        if not self.content.startswith('---'):
-            self.body = self.content
-            return True
-
-        # Extract frontmatter
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
-            self.body = self.content
-            return True
-
-        frontmatter_text = parts[1].strip()
-        self.body = parts[2].strip()
-
-        # Simple YAML parsing (handles basic cases)
-        current_key = None
-        current_value = []
-        in_multiline = False
-
-        for line in frontmatter_text.split('\n'):
-            # Check for new key
-            if not line.startswith(' ') and ':' in line:
-                # Save previous key if exists
-                if current_key:
-                    if in_multiline:
-                        self.frontmatter[current_key] = '\n'.join(current_value)
-
-                key_part = line.split(':', 1)
-                current_key = key_part[0].strip()
-                value = key_part[1].strip() if len(key_part) > 1 else ""
-
-                if value == '|':
-                    in_multiline = True
-                    current_value = []
-                elif value.startswith('[') or value.startswith('{'):
-                    # Handle inline arrays/objects
-                    self.frontmatter[current_key] = value
-                    current_key = None
-                elif value:
-                    self.frontmatter[current_key] = value.strip('"\'')
-                    current_key = None
-                else:
-                    in_multiline = False
-                    current_value = []
-            elif current_key and in_multiline:
-                current_value.append(line.strip())
-
-        # Save last key
-        if current_key and in_multiline:
-            self.frontmatter[current_key] = '\n'.join(current_value)
+    def parse_frontmatter(self, content: Optional[str] = None) -> bool:
+        """Parse YAML frontmatter from SKILL.md (or from already-read content)."""
+        if content is not None:
+            self.content = content
+        elif not self.read_skill_file():
+            return False
 
+        try:
+            data, self.body = parse_frontmatter(self.content)
+        except FrontmatterError as e:
+            self.parse_error = e
+            return False
+        # Keys without a value are absent, as before
+        self.frontmatter = {k: v for k, v in data.items() if v is not None}
+        # Lowercased once; several checks search it case-insensitively
+        self.body_lower = self.body.lower()
         return True
 
     def validate_structure(self) -> ValidationResult:
@@ -141,7 +201,7 @@ class SkillValidator:
         issues = []
 
         # Check SKILL.md exists
-        if not self.skill_md_path or not self.skill_md_path.exists():
+        if not self.skill_md_path or not self.tree.is_file("SKILL.md"):
             return ValidationResult(
                 "Structure",
                 False,
@@ -149,16 +209,12 @@ class SkillValidator:
                 ["Create a SKILL.md file in the skill directory"]
             )
 
-        # Check for common structure issues
-        references_dir = self.skill_path / "references"
-        scripts_dir = self.skill_path / "scripts"
-
         # Check if references are mentioned but directory doesn't exist
-        if "references/" in self.content and not references_dir.exists():
+        if "references/" in self.content and not self.tree.exists("references"):
             issues.append("references/ directory mentioned but doesn't exist")
 
         # Check if scripts are mentioned but directory doesn't exist
-        if "scripts/" in self.content and not scripts_dir.exists():
+        if "scripts/" in self.content and not self.tree.exists("scripts"):
             issues.append("scripts/ directory mentioned but doesn't exist")
 
         if issues:
@@ -173,19 +229,19 @@ class SkillValidator:
         # Required field: name
         if 'name' not in self.frontmatter:
             issues.append("Missing required 'name' field")
-        elif not re.match(r'^[a-z0-9-]+$', self.frontmatter['name']):
+        elif not re.match(r'^[a-z0-9-]+$', as_text(self.frontmatter['name'])):
             issues.append("'name' should be lowercase with dashes (e.g., 'my-skill')")
 
         # Required field: description
         if 'description' not in self.frontmatter:
             issues.append("Missing required 'description' field")
-        elif len(self.frontmatter.get('description', '')) < 20:
+        elif len(as_text(self.frontmatter['description'])) < 20:
             issues.append("'description' is too short (minimum 20 characters)")
 
         # Optional but validated: context
         if 'context' in self.frontmatter:
             valid_contexts = ['fork', 'append']
-            if self.frontmatter['context'] not in valid_contexts:
+            if as_text(self.frontmatter['context']) not in valid_contexts:
                 issues.append(f"'context' must be one of: {', '.join(valid_contexts)}")
 
         if issues:
@@ -198,7 +254,7 @@ class SkillValidator:
         issues = []
         recommendations = []
 
-        description = self.frontmatter.get('description', '')
+        description = as_text(self.frontmatter.get('description'))
 
         # Check for trigger phrases
         trigger_indicators = ['trigger', 'activates for', 'use when', 'triggers for']
@@ -232,18 +288,16 @@ class SkillValidator:
         issues = []
         recommendations = []
 
-        lines = self.body.split('\n')
-
         # Check for imperative form (common passive indicators)
         passive_indicators = ['you should', 'you can', 'you will', 'you may', 'it is recommended']
-        passive_count = sum(1 for ind in passive_indicators if ind.lower() in self.body.lower())
+        passive_count = sum(1 for ind in passive_indicators if ind.lower() in self.body_lower)
 
         if passive_count > 3:
             recommendations.append("Use imperative form more ('Run tests' not 'You should run tests')")
 
         # Check for examples
         example_indicators = ['example', '```', 'e.g.', 'for instance']
-        has_examples = any(ind.lower() in self.body.lower() for ind in example_indicators)
+        has_examples = any(ind.lower() in self.body_lower for ind in example_indicators)
 
         if not has_examples:
             issues.append("No examples found - add concrete examples with expected outputs")
@@ -292,8 +346,7 @@ class SkillValidator:
                 current_section_lines += 1
 
         # Check if references folder is used appropriately
-        references_dir = self.skill_path / "references"
-        if line_count > 300 and not references_dir.exists():
+        if line_count > 300 and not self.tree.exists("references"):
             issues.append("Consider using references/ folder for detailed documentation")
 
         if issues:
@@ -323,23 +376,20 @@ class SkillValidator:
             if '{{' in ref:
                 continue
 
-            ref_path = self.skill_path / ref
-            if not ref_path.exists():
+            if not self.tree.exists(ref):
                 # Also check without leading path component
                 if '/' in ref:
-                    alt_path = self.skill_path / ref.split('/')[-1]
-                    if not alt_path.exists():
+                    if not self.tree.exists(ref.split('/')[-1]):
                         issues.append(f"Referenced file not found: {ref}")
 
+        # Check links and anchors across SKILL.md and references/
+        issues.extend(check_links(self.tree, self.link_cache))
+
         # Check script permissions
-        scripts_dir = self.skill_path / "scripts"
-        if scripts_dir.exists():
-            for script in scripts_dir.glob('*.sh'):
-                if not os.access(script, os.X_OK):
-                    issues.append(f"Script not executable: {script.name}")
-            for script in scripts_dir.glob('*.py'):
-                if not os.access(script, os.X_OK):
-                    issues.append(f"Script not executable: {script.name}")
+        for pattern in ('*.sh', '*.py'):
+            for script in self.tree.glob("scripts", pattern):
+                if not self.tree.is_executable(script):
+                    issues.append(f"Script not executable: {script.rsplit('/', 1)[-1]}")
 
         if issues:
             return ValidationResult("Resources", False, "Resource issues found", issues)
@@ -360,13 +410,12 @@ class SkillValidator:
             recommendations.append("Fields: version, platforms, inputs, outputs, tags")
         else:
             # Validate version format
-            version = self.frontmatter.get('version', '')
-            if version and not re.match(r'^\d+\.\d+\.\d+', version.strip('"')):
+            version = as_text(self.frontmatter.get('version'))
+            if version and not re.match(r'^\d+\.\d+\.\d+', version):
                 issues.append("'version' should follow semver format (e.g., '1.0.0')")
 
             # Check for manifest.json
-            manifest_path = self.skill_path / "manifest.json"
-            if not manifest_path.exists():
+            if not self.tree.exists("manifest.json"):
                 recommendations.append("Consider adding manifest.json for agentskills.io registry")
 
         if issues:
@@ -377,40 +426,110 @@ class SkillValidator:
 
         return ValidationResult("Cross-Platform", True, "Cross-platform compatible")
 
-    def validate(self) -> Tuple[bool, List[ValidationResult]]:
-        """Run all validation checks."""
+    def validate_hook_latency(self) -> ValidationResult:
+        """Optional check: declared hooks run within self.hook_budget milliseconds (p99)."""
+        hooks = declared_hooks(self.frontmatter, self.tree.root)
+        if not hooks:
+            return ValidationResult("Hook Latency", True, "No hooks declared")
+        if self.tree.root is None:
+            return ValidationResult("Hook Latency", True, "Skipped: hooks can only be timed on disk")
+
+        budget = self.hook_budget
+        issues = []
+        details = []
+        for timing in HookHarness(self.tree.root, runs=self.HOOK_CHECK_RUNS).run(hooks):
+            script = timing.spec.script
+            if timing.error:
+                issues.append(timing.error)
+            elif timing.timed_out:
+                issues.append(f"{script} timed out")
+            else:
+                summary = f"p99 {timing.p99_ms:.0f} ms, cold start {timing.cold_ms:.0f} ms"
+                if timing.over_budget(budget):
+                    issues.append(f"{script}: {summary}, over the {budget:g} ms budget")
+                else:
+                    details.append(f"{script}: {summary}")
+
+        if issues:
+            return ValidationResult("Hook Latency", False, "Hooks over latency budget", issues + details)
+
+        return ValidationResult("Hook Latency", True, f"All hooks within {budget:g} ms", details)
+
+    def validate(self, fail_fast: bool = False,
+                 costs: Optional[Dict[str, float]] = None) -> Tuple[bool, List[ValidationResult]]:
+        """Run all validation checks.
+
+        With fail_fast, checks run cheapest first (by costs) and stop at the
+        first failure; the remaining check names are recorded in self.skipped.
+        """
 
         # Find and parse skill file
         if not self.find_skill_file():
-            return False, [ValidationResult(
+            self.results = [ValidationResult(
                 "Initialization",
                 False,
                 "Could not find SKILL.md",
                 [f"Searched in: {self.skill_path}"]
             )]
+            return False, self.results
 
         if not self.parse_frontmatter():
-            return False, [ValidationResult(
+            self.results = [ValidationResult(
                 "Initialization",
                 False,
                 "Could not parse SKILL.md",
-                ["Check file encoding and format"]
+                [f"Frontmatter error at {self.parse_error}"] if self.parse_error
+                else ["Check file encoding and format"]
             )]
-
-        # Run all checks
-        self.results = [
-            self.validate_structure(),
-            self.validate_frontmatter(),
-            self.validate_description(),
-            self.validate_content(),
-            self.validate_progressive_disclosure(),
-            self.validate_resources(),
-            self.validate_cross_platform(),
-        ]
+            return False, self.results
+
+        return self.run_checks(fail_fast, costs)
+
+    def run_checks(self, fail_fast: bool = False,
+                   costs: Optional[Dict[str, float]] = None) -> Tuple[bool, List[ValidationResult]]:
+        """Run the checks on an already located and parsed skill."""
+        checks = list(self.CHECKS)
+        if self.hook_budget is not None:
+            checks.append(self.HOOK_CHECK)
+        if fail_fast:
+            costs = costs or DEFAULT_CHECK_COSTS
+            checks.sort(key=lambda check: costs.get(check[0], float('inf')))
+
+        self.results = []
+        self.skipped = []
+        self.timings = {}
+        for index, (name, method) in enumerate(checks):
+            start = time.perf_counter()
+            result = getattr(self, method)()
+            self.timings[name] = (time.perf_counter() - start) * 1000
+            self.results.append(result)
+
+            if fail_fast and not result.passed:
+                self.skipped = [skipped for skipped, _ in checks[index + 1:]]
+                break
 
         all_passed = all(r.passed for r in self.results)
         return all_passed, self.results
 
+    def to_dict(self, all_passed: bool) -> Dict:
+        """Build the JSON report for this skill."""
+        output = {
+            "skill_path": str(self.skill_path),
+            "all_passed": all_passed,
+            "results": [
+                {
+                    "name": r.name,
+                    "passed": r.passed,
+                    "message": r.message,
+                    "details": r.details
+                }
+                for r in self.results
+            ]
+        }
+        if self.skipped:
+            output["skipped_checks"] = self.skipped
+        return output
+
     def print_results(self):
         """Print validation results to console."""
         print(colorize("\n=== Skill Validation Report ===\n", Colors.BOLD))
@@ -433,42 +552,262 @@ class SkillValidator:
 
         return passed == total
 
+def validate_limited(validator: SkillValidator, limits: ResourceLimits, **options) -> bool:
+    """validator.validate() under the resource limits; raises ResourceLimitExceeded.
+
+    Results are copied back onto the validator, since with a memory limit
+    the checks run in a forked process.
+    """
+    def run():
+        all_passed, results = validator.validate(**options)
+        return all_passed, results, validator.skipped, validator.timings, validator.skill_path
+
+    all_passed, validator.results, validator.skipped, validator.timings, validator.skill_path = \
+        run_limited(run, limits)
+    return all_passed
+
+def record_check_metrics(metrics: Metrics, validator: SkillValidator):
+    """Count a validated skill's check outcomes and durations."""
+    for result in validator.results:
+        metrics.add("check_results", check=result.name, result="pass" if result.passed else "fail")
+    for name, duration in validator.timings.items():
+        metrics.add("check_duration_seconds", duration / 1000, check=name)
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate Claude Code skills against best practices"
     )
     parser.add_argument(
         "path",
-        help="Path to skill directory or SKILL.md file"
+        nargs="*",
+        help="Path to skill directory or SKILL.md file (several for a batch run)"
     )
     parser.add_argument(
         "--json",
         action="store_true",
         help="Output results as JSON"
     )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Discover skills under the given paths and stream one JSON line per skill"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Worker threads per pipeline stage with --ndjson (default: 4)"
+    )
+    parser.add_argument(
+        "--changed",
+        metavar="REV_RANGE",
+        help="Only validate skills under the given paths touched by a git revision range (e.g. main...HEAD)"
+    )
+    parser.add_argument(
+        "--link-cache",
+        help="Cache file for scanned links and headings (default: ~/.cache/skill-factory/links.json)"
+    )
+    parser.add_argument(
+        "--no-link-cache",
+        action="store_true",
+        help="Rescan every markdown file instead of using the link cache"
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Run checks cheapest first and stop at the first failure"
+    )
+    parser.add_argument(
+        "--max-failures",
+        type=int,
+        help="Stop validating further skills after N failures (default: 1 with --fail-fast)"
+    )
+    parser.add_argument(
+        "--cost-file",
+        help="JSON file of measured check costs; read for ordering and updated after the run"
+    )
+    parser.add_argument(
+        "--hook-budget",
+        type=float,
+        metavar="MS",
+        help="Also run declared hooks and fail if their p99 latency is above MS milliseconds"
+    )
+    add_limit_arguments(parser)
+    add_shard_arguments(parser)
+    add_metrics_argument(parser)
 
     args = parser.parse_args()
+    limits = limits_from_args(parser, args)
+    metrics = Metrics("validate")
+
+    batch = len(args.path) > 1
+    if args.changed:
+        from skill_git import GitError, changed_skills
+        try:
+            with metrics.phase("discover"):
+                args.path = [str(p) for p in changed_skills(args.changed, args.path or ["."])]
+        except GitError as e:
+            print(colorize(f"Error: {e}", Colors.RED), file=sys.stderr)
+            sys.exit(2)
+        batch = True
+        if not args.path:
+            if args.json:
+                print(json.dumps({"all_passed": True, "skills": [], "skipped_skills": []}, indent=2))
+            elif not args.ndjson:
+                print(f"No skills changed in {args.changed}")
+            metrics.write(args.metrics)
+            sys.exit(0)
+    elif not args.path:
+        parser.error("a path is required unless --changed is given")
+    if args.shard:
+        with metrics.phase("discover"):
+            args.path = shard_paths(args)
+        batch = True
+        if not args.json and not args.ndjson:
+            print(f"Shard {args.shard}: {len(args.path)} skills")
+
+    max_failures = args.max_failures
+    if max_failures is None and args.fail_fast:
+        max_failures = 1
+
+    costs = load_check_costs(args.cost_file)
+    link_cache = None if args.no_link_cache else LinkCache.load(args.link_cache)
+    timings: Dict[str, List[float]] = {}
+    timings_lock = threading.Lock()
+    # Seconds per skill, for --record-costs
+    skill_costs: Dict[str, float] = {}
+
+    def record_timings(validator: SkillValidator):
+        with timings_lock:
+            for name, duration in validator.timings.items():
+                total = timings.setdefault(name, [0.0, 0])
+                total[0] += duration
+                total[1] += 1
+
+    if args.ndjson:
+        from skill_pipeline import StreamingPipeline, emit_ndjson
+
+        def read(path):
+            validator = SkillValidator(str(path), link_cache, limits=limits)
+            validator.hook_budget = args.hook_budget
+            if not validator.find_skill_file() or not validator.read_skill_file():
+                raise OSError(f"could not read {path}")
+            return validator
+
+        def parse(validator):
+            if not validator.parse_frontmatter(validator.content):
+                raise validator.parse_error
+            return validator
+
+        def check(validator):
+            start = time.perf_counter()
+            all_passed, _ = validator.run_checks(fail_fast=args.fail_fast, costs=costs)
+            record_timings(validator)
+            record_check_metrics(metrics, validator)
+            with timings_lock:
+                skill_costs[skill_key(validator.skill_path)] = time.perf_counter() - start
+            return validator.to_dict(all_passed)
+
+        pipeline = StreamingPipeline(read, parse, check, workers=args.workers, limits=limits)
+        failures = 0
+
+        def on_record(record):
+            nonlocal failures
+            if "error" in record:
+                metrics.add("skills_processed", result="error")
+            else:
+                metrics.add("skills_processed", result="passed" if record["all_passed"] else "failed")
+            if not record.get("all_passed"):
+                failures += 1
+                if max_failures and failures >= max_failures:
+                    pipeline.stop()
+
+        with metrics.phase("validate"):
+            emit_ndjson(pipeline.run(args.path), on_record=on_record)
+            if args.shard:
+                # Trailer for merge-reports.py; a stream cut short has none
+                emit_ndjson([{"tool": "validate", "shard": shard_info(args, len(args.path), failures == 0)}])
+        with metrics.phase("save"):
+            if link_cache:
+                link_cache.save()
+            if args.cost_file:
+                save_check_costs(args.cost_file, costs, timings)
+            if args.record_costs:
+                record_costs(args.record_costs, skill_costs)
+        metrics.cache("links", link_cache)
+        metrics.write(args.metrics)
+        sys.exit(0 if failures == 0 else 1)
+
+    reports = []
+    skipped_skills = []
+    failures = 0
+
+    with metrics.phase("validate"):
+        for index, path in enumerate(args.path):
+            if max_failures and failures >= max_failures:
+                skipped_skills = args.path[index:]
+                break
+
+            validator = SkillValidator(path, link_cache, limits=limits)
+            validator.hook_budget = args.hook_budget
+            start = time.perf_counter()
+            try:
+                all_passed = validate_limited(validator, limits, fail_fast=args.fail_fast, costs=costs)
+            except ResourceLimitExceeded as e:
+                failures += 1
+                metrics.add("skills_processed", result="error")
+                if args.json:
+                    reports.append(e.to_dict(validator.skill_path))
+                else:
+                    print(colorize(f"[LIMIT] {validator.skill_path}: {e}", Colors.RED))
+                continue
+            finally:
+                skill_costs[skill_key(validator.skill_path)] = time.perf_counter() - start
+            record_timings(validator)
+            record_check_metrics(metrics, validator)
+            metrics.add("skills_processed", result="passed" if all_passed else "failed")
+
+            if not all_passed:
+                failures += 1
 
-    validator = SkillValidator(args.path)
-    all_passed, results = validator.validate()
+            if args.json:
+                reports.append(validator.to_dict(all_passed))
+            else:
+                validator.print_results()
+                if validator.skipped:
+                    print(f"Skipped after first failure: {', '.join(validator.skipped)}")
+    if skipped_skills:
+        metrics.add("skills_processed", len(skipped_skills), result="skipped")
+
+    with metrics.phase("save"):
+        if link_cache:
+            link_cache.save()
+        if args.cost_file:
+            save_check_costs(args.cost_file, costs, timings)
+        if args.record_costs:
+            record_costs(args.record_costs, skill_costs)
+    metrics.cache("links", link_cache)
+    metrics.write(args.metrics)
+
+    all_passed = failures == 0 and not skipped_skills
 
     if args.json:
-        output = {
-            "skill_path": str(validator.skill_path),
-            "all_passed": all_passed,
-            "results": [
-                {
-                    "name": r.name,
-                    "passed": r.passed,
-                    "message": r.message,
-                    "details": r.details
-                }
-                for r in results
-            ]
-        }
+        if not batch:
+            output = reports[0]
+        else:
+            output = {
+                "all_passed": all_passed,
+                "skills": reports,
+                "skipped_skills": skipped_skills,
+            }
+            if args.shard:
+                output["shard"] = shard_info(args, len(args.path), all_passed)
         print(json.dumps(output, indent=2))
-    else:
-        validator.print_results()
+    elif batch:
+        print(colorize("\n=== Batch Summary ===", Colors.BOLD))
+        print(f"{len(args.path) - len(skipped_skills)} skills validated, {failures} failed")
+        if skipped_skills:
+            print(f"Stopped after {failures} failure(s); {len(skipped_skills)} skills not validated")
 
     sys.exit(0 if all_passed else 1)
 